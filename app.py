@@ -3,9 +3,11 @@
 # 위치: C:\Users\user\Desktop\인공지능산업협회AI\app.py
 # ============================================
 
+import hmac
+import io
 import os
 import sys
-from datetime import datetime, date
+from datetime import datetime, date, time, timedelta
 from functools import wraps
 
 # 환경 변수 로딩 (.env 파일)
@@ -17,7 +19,9 @@ except ImportError:
     print("⚠️ python-dotenv가 설치되지 않았습니다. pip install python-dotenv")
 
 # Flask 관련
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify
+import click
+from werkzeug.middleware.proxy_fix import ProxyFix
+from flask import Flask, Response, render_template, request, redirect, url_for, flash, jsonify, abort, stream_with_context
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 from werkzeug.utils import secure_filename
 
@@ -31,12 +35,33 @@ from models.company import Company
 from models.team import Team
 from models.document import Document
 from models.schedule import Schedule
+from models.calendar_feed import CalendarFeed
 
 # 서비스
 from services.auth import AuthService
+from services.user_cache import user_cache
+from services.org_cache import org_cache, init_org_invalidation
+from services.password_hasher import password_hasher
+from services.rate_limit import login_ip_limiter, login_user_limiter
 from services.document_parser import DocumentParser
 from services.ai_extractor import AIScheduleExtractor, get_extractor
 from services.company_service import CompanyService, TeamService
+from services.schedule_service import ScheduleService
+from services.availability import AvailabilityService
+from services import recurrence, schedule_io
+from services.feed_service import FeedService, init_feed_invalidation
+from services.digest_service import DigestService, init_digest_refresh
+from services import events
+from services.sync_service import SyncService, SyncCursorError, init_tombstones
+from services.tag_service import TagService, init_tag_index
+from services.schedule_listing import ScheduleListService, ScheduleFilters, ListCursorError, STATUSES
+from services import metrics
+from services.metrics import span, traced
+from services.query_stats import init_query_stats, endpoint_summary
+from services.sqlite_profile import init_sqlite_profile
+from services.db_routing import init_db_routing, read_replica
+from services.write_queue import write_queue, WriteQueueFull
+from services.provisioning import ProvisioningService, ProvisionError, read_org_chart, FORMATS as PROVISION_FORMATS
 
 
 # ============================================
@@ -48,13 +73,57 @@ def create_app():
     app = Flask(__name__)
     app.config.from_object(Config)
     
+    # 리버스 프록시 뒤에서 실제 클라이언트 IP 사용 (로그인 IP 제한 등) - 설정한 단계만 신뢰
+    if app.config['PROXY_FIX_HOPS'] > 0:
+        hops = app.config['PROXY_FIX_HOPS']
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=hops, x_proto=hops)
+    
     # 폴더 생성 (없으면)
     os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
     os.makedirs(os.path.dirname(app.config['SQLALCHEMY_DATABASE_URI'].replace('sqlite:///', '')), exist_ok=True)
     
+    # 연결 풀 옵션, 읽기 복제본 bind
+    init_db_routing(app)
+    
+    # SQLite 연결별 PRAGMA (WAL 등) - 첫 연결 전에 등록
+    init_sqlite_profile(app)
+    
     # 데이터베이스 초기화
     init_db(app)
     
+    # 쓰기가 많은 경로용 단일 쓰기 큐
+    write_queue.configure(
+        app,
+        app.config['WRITE_QUEUE_ENABLED'],
+        app.config['WRITE_QUEUE_MAX_PENDING'],
+        app.config['WRITE_QUEUE_TIMEOUT']
+    )
+    
+    # 단계별 시간 측정 설정
+    metrics.configure(log_spans=app.config['TRACE_LOG_ENABLED'])
+    
+    # 요청별 SQL 쿼리 집계
+    init_query_stats(app)
+    
+    # 일정 변경 시 ICS 구독 피드 무효화
+    init_feed_invalidation()
+    
+    # 일정 변경 시 팀원 일정 요약 다시 계산 (커밋 직전)
+    init_digest_refresh()
+    
+    # 일정 변경 실시간 알림 (커밋 후 SSE 발행)
+    events.init_event_publishing()
+    
+    # 일정 삭제 기록 (증분 동기화용)
+    init_tombstones()
+    
+    # 일정 태그 색인 (tags 문자열 → tags / schedule_tags)
+    init_tag_index()
+    
+    # 조직도 캐시 (팀/회사 멤버 조회) - 소속 변경 커밋 시 무효화
+    org_cache.configure(app.config['ORG_CACHE_TTL'])
+    init_org_invalidation()
+    
     # 로그인 매니저 설정
     login_manager = LoginManager()
     login_manager.init_app(app)
@@ -62,9 +131,21 @@ def create_app():
     login_manager.login_message = '로그인이 필요합니다.'
     login_manager.login_message_category = 'warning'
     
+    # 비밀번호 해시 작업 풀, 로그인 시도 제한
+    password_hasher.configure(
+        app.config['BCRYPT_LOG_ROUNDS'],
+        app.config['PASSWORD_HASH_WORKERS'],
+        app.config['PASSWORD_HASH_MAX_PENDING']
+    )
+    login_ip_limiter.configure(app.config['LOGIN_RATE_LIMIT_IP'], app.config['LOGIN_RATE_LIMIT_WINDOW'])
+    login_user_limiter.configure(app.config['LOGIN_RATE_LIMIT_USER'], app.config['LOGIN_RATE_LIMIT_WINDOW'])
+    
+    # 로그인 사용자 캐시 (요청마다 사용자/회사/팀 조회 생략)
+    user_cache.configure(app.config['USER_CACHE_TTL'])
+    
     @login_manager.user_loader
     def load_user(user_id):
-        return AuthService.get_user_by_id(int(user_id))
+        return user_cache.load(int(user_id))
     
     return app
 
@@ -96,18 +177,20 @@ def allowed_file(filename):
     return ext in app.config['ALLOWED_EXTENSIONS']
 
 
+def bearer_token_matches(token):
+    """Authorization: Bearer 토큰 확인 (응답 시간으로 토큰을 추측할 수 없도록 상수 시간 비교)"""
+    header = request.headers.get('Authorization', '')
+    return hmac.compare_digest(header.encode('utf-8'), f'Bearer {token}'.encode('utf-8'))
+
+
 def get_user_stats(user_id):
     """사용자 일정 통계 계산"""
-    today = date.today()
+    counts = ScheduleService.urgency_counts(user_id)
     
-    total = Schedule.query.filter_by(user_id=user_id).count()
-    completed = Schedule.query.filter_by(user_id=user_id, is_completed=True).count()
-    pending = Schedule.query.filter_by(user_id=user_id, is_completed=False).count()
-    overdue = Schedule.query.filter(
-        Schedule.user_id == user_id,
-        Schedule.is_completed == False,
-        Schedule.due_date < today
-    ).count()
+    total = sum(counts.values())
+    completed = counts['completed']
+    pending = total - completed
+    overdue = counts['overdue']
     
     completion_rate = round((completed / total * 100) if total > 0 else 0)
     
@@ -134,7 +217,7 @@ def login():
         username = request.form.get('username', '').strip()
         password = request.form.get('password', '')
         
-        success, message, user = AuthService.authenticate_user(username, password)
+        success, message, user = AuthService.authenticate_user(username, password, request.remote_addr)
         
         if success and user:
             login_user(user, remember=True)
@@ -235,21 +318,73 @@ def index():
 @login_required
 def dashboard():
     """대시보드 페이지"""
-    # 사용자의 일정 목록 (마감일 순, 완료되지 않은 것 우선)
-    schedules = Schedule.query.filter_by(user_id=current_user.id)\
-        .order_by(Schedule.is_completed.asc(), Schedule.due_date.asc())\
-        .all()
+    # 사용자의 일정 목록 첫 페이지 (급한 순, 완료된 것은 마지막) - 나머지는 /api/dashboard/schedules로 이어 읽기
+    filters = parse_list_filters(request.args)
+    page = ScheduleListService.page(current_user.id, filters, limit=app.config['DASHBOARD_PAGE_SIZE'])
     
     # 통계
     stats = get_user_stats(current_user.id)
     
-    return render_template('dashboard.html', schedules=schedules, stats=stats)
+    return render_template(
+        'dashboard.html',
+        schedules=page['schedules'],
+        today=page['today'],
+        next_cursor=page['next_cursor'],
+        filters=filters,
+        filter_args=filters.to_args(),
+        schedule_types=Schedule.TYPE_LABELS,
+        stats=stats
+    )
+
+
+def parse_list_filters(args):
+    """
+    쿼리 인자 → 일정 목록 필터
+    
+    ?status=pending|completed, ?type=meeting,trip, ?urgency=overdue,urgent, ?tag=, ?from=, ?to=
+    알 수 없는 값은 무시합니다.
+    """
+    def split(name, allowed):
+        return tuple(value for value in args.get(name, '').split(',') if value in allowed)
+    
+    status = args.get('status')
+    tag = args.get('tag', '').strip()
+    return ScheduleFilters(
+        status=status if status in STATUSES else None,
+        types=split('type', Schedule.TYPE_LABELS),
+        urgency=split('urgency', Schedule.URGENCY_ORDER),
+        tag=tag[:50] or None,
+        date_from=parse_iso_date(args.get('from')),
+        date_to=parse_iso_date(args.get('to'))
+    )
 
 
 # ============================================
 # 일정 라우트
 # ============================================
 
+def parse_recurrence_form(form, start_date):
+    """
+    폼의 반복 설정 → (recurrence_rule, recurrence_until)
+    
+    recurrence_rule(RRULE 문자열)이 있으면 그대로, 없으면 recurrence(DAILY/WEEKLY/MONTHLY/YEARLY)와
+    recurrence_end(종료일)로 규칙을 만듭니다. 반복 없음이면 (None, None)
+    """
+    rule = form.get('recurrence_rule', '').strip()
+    freq = form.get('recurrence', '').strip()
+    
+    if rule:
+        rule = recurrence.normalize_rule(rule)
+    elif freq and freq.lower() != 'none':
+        end_str = form.get('recurrence_end', '').strip()
+        until = datetime.strptime(end_str, '%Y-%m-%d').date() if end_str else None
+        rule = recurrence.build_rule(freq, until)
+    else:
+        return None, None
+    
+    return rule, recurrence.compute_until(rule, start_date)
+
+
 @app.route('/schedule/add', methods=['POST'])
 @login_required
 def add_schedule():
@@ -274,6 +409,9 @@ def add_schedule():
         due_date = datetime.strptime(due_date_str, '%Y-%m-%d').date()
         start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date() if start_date_str else due_date
         
+        # 반복 설정
+        recurrence_rule, recurrence_until = parse_recurrence_form(request.form, start_date)
+        
         # 시간 파싱
         from datetime import time
         start_time = None
@@ -306,7 +444,9 @@ def add_schedule():
             schedule_type=schedule_type,
             tags=tags,
             memo=memo,
-            is_ai_generated=False
+            is_ai_generated=False,
+            recurrence_rule=recurrence_rule,
+            recurrence_until=recurrence_until
         )
         
         db.session.add(schedule)
@@ -314,6 +454,8 @@ def add_schedule():
         
         flash('일정이 추가되었습니다.', 'success')
         
+    except recurrence.RecurrenceError as e:
+        flash(f'반복 설정이 올바르지 않습니다: {str(e)}', 'error')
     except ValueError as e:
         flash(f'날짜 형식이 올바르지 않습니다.', 'error')
     except Exception as e:
@@ -377,9 +519,18 @@ def update_schedule(schedule_id):
         schedule.memo = request.form.get('memo', '').strip() or None
         schedule.is_completed = 'is_completed' in request.form
         
+        # 반복 설정 (폼에 반복 항목이 있을 때만 변경)
+        if 'recurrence' in request.form or 'recurrence_rule' in request.form:
+            schedule.recurrence_rule, schedule.recurrence_until = parse_recurrence_form(
+                request.form, schedule.start_date or schedule.due_date
+            )
+        
         db.session.commit()
         flash('일정이 수정되었습니다.', 'success')
         
+    except recurrence.RecurrenceError as e:
+        db.session.rollback()
+        flash(f'반복 설정이 올바르지 않습니다: {str(e)}', 'error')
     except Exception as e:
         db.session.rollback()
         flash(f'일정 수정 중 오류가 발생했습니다: {str(e)}', 'error')
@@ -434,8 +585,43 @@ def complete_schedule(schedule_id):
 # 문서 업로드 및 AI 분석
 # ============================================
 
+def persist_upload(user_id, document_fields, extracted_text=None, schedules_data=None):
+    """
+    업로드 문서와 추출된 일정 저장 (쓰기 큐 스레드에서 실행)
+    
+    Returns:
+        생성된 일정 수
+    """
+    document = Document(user_id=user_id, **document_fields)
+    document.extracted_text = extracted_text
+    db.session.add(document)
+    created_count = 0
+    
+    if schedules_data is not None:
+        db.session.flush()  # document.id 생성
+        
+        # 추출된 일정 일괄 저장
+        schedule_ids = ScheduleService.bulk_create(
+            user_id,
+            schedules_data,
+            document_id=document.id,
+            is_ai_generated=True
+        )
+        created_count = len(schedule_ids)
+        
+        events.publish_after_commit(db.session, f'user:{user_id}', 'upload', {
+            'document_id': document.id,
+            'filename': document.filename,
+            'schedule_count': created_count
+        })
+    
+    db.session.commit()
+    return created_count
+
+
 @app.route('/upload', methods=['POST'])
 @login_required
+@traced('upload')
 def upload_document():
     """문서 업로드 및 AI 일정 추출"""
     if 'document' not in request.files:
@@ -466,57 +652,42 @@ def upload_document():
         save_filename = f"{current_user.id}_{timestamp}.{file_ext}"
         filepath = os.path.join(app.config['UPLOAD_FOLDER'], save_filename)
         
-        file.save(filepath)
+        with span('upload_save'):
+            file.save(filepath)
         
         # 파일 정보
         file_size = os.path.getsize(filepath)
         
-        # Document 레코드 생성
-        document = Document(
-            user_id=current_user.id,
-            filename=original_filename,
-            filepath=filepath,
-            file_type=file_ext,
-            file_size=file_size
-        )
+        # Document 레코드 값
+        document_fields = {
+            'filename': original_filename,
+            'filepath': filepath,
+            'file_type': file_ext,
+            'file_size': file_size
+        }
         
         # 문서 파싱
         success, message, extracted_text = DocumentParser.parse(filepath)
         
         if success and extracted_text:
-            document.extracted_text = extracted_text
-            
             # AI 일정 추출
-            extractor = get_ai_extractor()
-            schedules_data = extractor.extract_schedules(extracted_text)
-            
-            db.session.add(document)
-            db.session.flush()  # document.id 생성
+            with span('upload_extract'):
+                extractor = get_ai_extractor()
+                schedules_data = extractor.extract_schedules(extracted_text)
             
-            # 추출된 일정 저장
-            created_count = 0
-            for sched_data in schedules_data:
-                schedule = Schedule(
-                    user_id=current_user.id,
-                    document_id=document.id,
-                    title=sched_data.get('title', '새 일정'),
-                    task_description=sched_data.get('task_description', ''),
-                    due_date=sched_data.get('due_date'),
-                    schedule_type=sched_data.get('schedule_type', 'other'),
-                    is_ai_generated=True
+            # 문서 + 추출된 일정 일괄 저장 (쓰기 큐)
+            with span('upload_persist'):
+                created_count = write_queue.run(
+                    persist_upload, current_user.id, document_fields, extracted_text, schedules_data
                 )
-                db.session.add(schedule)
-                created_count += 1
-            
-            db.session.commit()
             
             if created_count > 0:
                 flash(f'문서에서 {created_count}개의 일정이 추출되었습니다.', 'success')
             else:
                 flash('문서를 분석했지만 일정을 찾지 못했습니다. 직접 일정을 추가해주세요.', 'info')
         else:
-            db.session.add(document)
-            db.session.commit()
+            with span('upload_persist'):
+                write_queue.run(persist_upload, current_user.id, document_fields)
             flash(f'문서가 업로드되었습니다. (텍스트 추출: {message})', 'warning')
         
     except Exception as e:
@@ -528,6 +699,7 @@ def upload_document():
 
 @app.route('/files')
 @login_required
+@read_replica
 def file_archive():
     """파일 보관함"""
     documents = Document.query.filter_by(user_id=current_user.id)\
@@ -541,13 +713,222 @@ def file_archive():
 
 @app.route('/api/schedules')
 @login_required
+@read_replica
 def api_get_schedules():
-    """캘린더용 일정 API"""
-    schedules = Schedule.query.filter_by(user_id=current_user.id).all()
-    events = [schedule.to_calendar_event() for schedule in schedules]
+    """
+    캘린더용 일정 API
+    
+    FullCalendar가 보내는 ?start=&end= 기간과 겹치는 일정만 반환하고,
+    반복 일정은 그 기간 안의 회차로 펼칩니다.
+    """
+    window_start = parse_iso_date(request.args.get('start'))
+    window_end = parse_iso_date(request.args.get('end'))
+    events = ScheduleService.calendar_events(current_user.id, window_start, window_end)
     return jsonify(events)
 
 
+def parse_iso_date(value):
+    """'2025-01-31' 또는 '2025-01-31T00:00:00+09:00' → date (실패 시 None)"""
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value[:10], '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
+@app.route('/api/schedule/<int:schedule_id>/occurrences/<occurrence_date>', methods=['POST', 'DELETE'])
+@login_required
+def api_schedule_occurrence(schedule_id, occurrence_date):
+    """
+    반복 일정 회차 예외 API
+    
+    POST: 회차 취소/변경 {cancelled, date, title, start_time, end_time, is_completed}
+    DELETE: 예외 삭제 (반복 규칙대로 되돌림)
+    """
+    schedule = Schedule.query.filter_by(id=schedule_id, user_id=current_user.id).first()
+    if not schedule:
+        return jsonify({'success': False, 'message': '일정을 찾을 수 없습니다.'}), 404
+    
+    occurrence = parse_iso_date(occurrence_date)
+    if occurrence is None:
+        return jsonify({'success': False, 'message': '날짜 형식이 올바르지 않습니다.'}), 400
+    
+    if request.method == 'DELETE':
+        ScheduleService.clear_occurrence_exception(schedule, occurrence)
+        return jsonify({'success': True, 'message': '회차가 원래대로 복원되었습니다.'})
+    
+    data = request.get_json(silent=True) or {}
+    changes = {}
+    try:
+        if 'cancelled' in data:
+            changes['is_cancelled'] = bool(data['cancelled'])
+        if 'date' in data:
+            changes['override_date'] = parse_iso_date(data['date']) if data['date'] else None
+            if data['date'] and changes['override_date'] is None:
+                raise ValueError('날짜 형식이 올바르지 않습니다.')
+        if 'title' in data:
+            changes['title'] = (data['title'] or '').strip() or None
+        for field in ('start_time', 'end_time'):
+            if field in data:
+                changes[field] = datetime.strptime(data[field], '%H:%M').time() if data[field] else None
+        if 'is_completed' in data:
+            changes['is_completed'] = None if data['is_completed'] is None else bool(data['is_completed'])
+        
+        exc = ScheduleService.set_occurrence_exception(schedule, occurrence, changes)
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 400
+    
+    return jsonify({'success': True, 'exception': exc.to_dict()})
+
+
+@app.route('/api/events')
+@login_required
+def api_event_stream():
+    """
+    일정 변경 실시간 알림 (Server-Sent Events)
+    
+    event: schedule  본인 일정 변경분 {action: created|updated|deleted|bulk_created, id, event?}
+    event: team      같은 팀 멤버 일정 변경 {usernames}
+    event: upload    문서 분석 완료 {document_id, filename, schedule_count}
+    event: resync    알림이 밀려 버려짐 - 전체 다시 조회 필요
+    """
+    subscription = events.broker.subscribe(events.user_channels(current_user))
+    
+    # 스트림이 열려 있는 동안 DB 연결을 잡고 있지 않도록 먼저 반납
+    db.session.remove()
+    
+    return Response(
+        events.iter_stream(subscription, app.config['EVENT_STREAM_HEARTBEAT']),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+@app.route('/api/dashboard/schedules')
+@login_required
+def api_dashboard_schedules():
+    """
+    대시보드 일정 목록 API (급한 순, 페이지 단위)
+    
+    필터는 대시보드와 같은 쿼리 인자, ?cursor=<이전 응답의 next_cursor>, ?limit= (기본 DASHBOARD_PAGE_SIZE)
+    has_more가 false가 될 때까지 next_cursor로 이어서 요청합니다.
+    """
+    try:
+        limit = int(request.args.get('limit', app.config['DASHBOARD_PAGE_SIZE']))
+        page = ScheduleListService.page(
+            current_user.id, parse_list_filters(request.args), request.args.get('cursor'), limit
+        )
+    except ListCursorError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    except ValueError:
+        return jsonify({'success': False, 'message': 'limit은 숫자여야 합니다.'}), 400
+    
+    today = page['today']
+    return jsonify({
+        'success': True,
+        'schedules': [schedule.to_dict(today) for schedule in page['schedules']],
+        'next_cursor': page['next_cursor'],
+        'has_more': page['has_more']
+    })
+
+
+@app.route('/api/schedules/changes')
+@login_required
+def api_schedule_changes():
+    """
+    일정 증분 동기화 API
+    
+    ?since=<이전 응답의 cursor> (없으면 전체), ?limit= (기본 500, 최대 1000)
+    deleted를 먼저 반영한 뒤 changes를 반영하고, has_more가 false가 될 때까지 cursor로 이어서 요청합니다.
+    최근 SYNC_COMMIT_LAG_SECONDS 구간은 다음 요청에서 다시 올 수 있으므로 id 기준으로 덮어씁니다.
+    커서 발급 후 보관 기간을 넘으면 410 - since 없이 전체 동기화를 다시 해야 합니다.
+    """
+    retention_days = app.config['SYNC_TOMBSTONE_RETENTION_DAYS']
+    SyncService.purge_tombstones(retention_days)
+    
+    try:
+        limit = int(request.args.get('limit', 500))
+        result = SyncService.changes(
+            current_user.id, request.args.get('since'), limit, retention_days,
+            app.config['SYNC_COMMIT_LAG_SECONDS']
+        )
+    except SyncCursorError as e:
+        return jsonify({'success': False, 'message': str(e), 'resync': e.expired}), 410 if e.expired else 400
+    except ValueError:
+        return jsonify({'success': False, 'message': 'limit은 숫자여야 합니다.'}), 400
+    
+    return jsonify({'success': True, **result})
+
+
+@app.route('/api/schedules/import', methods=['POST'])
+@login_required
+def api_import_schedules():
+    """
+    일정 일괄 가져오기 (CSV, ICS, JSON Lines)
+    
+    multipart 'file' 필드 또는 요청 본문 자체를 한 행씩 읽어 배치로 저장합니다.
+    형식은 ?format= > 파일 확장자 > Content-Type 순으로 결정합니다.
+    """
+    upload = request.files.get('file')
+    if upload:
+        fmt = schedule_io.detect_format(request.args.get('format'), upload.filename, upload.mimetype)
+        raw_stream = upload.stream
+    else:
+        fmt = schedule_io.detect_format(request.args.get('format'), None, request.mimetype)
+        raw_stream = request.stream
+    
+    if not fmt:
+        return jsonify({'success': False, 'message': '형식을 알 수 없습니다. (csv, ics, jsonl)'}), 400
+    
+    stream = io.TextIOWrapper(raw_stream, encoding='utf-8-sig', newline='')
+    try:
+        summary = ScheduleService.import_stream(current_user.id, fmt, stream)
+    except UnicodeDecodeError:
+        return jsonify({'success': False, 'message': 'UTF-8 인코딩만 지원합니다.'}), 400
+    except WriteQueueFull as e:
+        return jsonify({'success': False, 'message': str(e)}), 503
+    finally:
+        stream.detach()
+    
+    return jsonify({'success': True, **summary})
+
+
+@app.route('/api/schedules/export')
+@login_required
+def api_export_schedules():
+    """
+    일정 내보내기 (CSV, ICS, JSON Lines)
+    
+    ?format=csv|ics|jsonl, ?scope=user|team
+    일정을 나눠 읽으면서 바로 응답으로 흘려보냅니다.
+    """
+    fmt = (request.args.get('format') or 'csv').lower()
+    if fmt not in schedule_io.FORMATS:
+        return jsonify({'success': False, 'message': '지원하지 않는 형식입니다. (csv, ics, jsonl)'}), 400
+    
+    scope = request.args.get('scope', 'user')
+    if scope == 'team':
+        if not current_user.team_id:
+            return jsonify({'success': False, 'message': '소속된 팀이 없습니다.'}), 400
+        user_ids = list(org_cache.get().team_member_ids(current_user.team_id))
+    else:
+        user_ids = [current_user.id]
+    
+    schedules = ScheduleService.iter_user_schedules(user_ids)
+    body = schedule_io.iter_export(
+        fmt, schedules, uid_domain=request.host.split(':')[0], exceptions_for=ScheduleService.exceptions_for
+    )
+    
+    filename = f"schedules_{scope}_{date.today().strftime('%Y%m%d')}.{fmt}"
+    return Response(
+        stream_with_context(body),
+        mimetype=schedule_io.MIME_TYPES[fmt],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"'}
+    )
+
+
 @app.route('/api/schedule/<int:schedule_id>')
 @login_required
 def api_get_schedule(schedule_id):
@@ -562,44 +943,128 @@ def api_get_schedule(schedule_id):
 
 @app.route('/api/team-schedules')
 @login_required
+@read_replica
 def api_get_team_schedules():
-    """팀원 일정 API"""
-    users = []
+    """팀원 일정 API (팀원별 다가오는 일정 5건, upcoming_digests 요약 사용)"""
+    # 팀 > 회사 > 부서 순 범위 (조직도 캐시, 범위가 없으면 본인만)
+    member_ids = org_cache.get().scope_member_ids(current_user)
+    if len(member_ids) <= 1:
+        return jsonify({'success': True, 'team_schedules': {}})
+    scope = User.id.in_(member_ids)
     
-    # 팀이 있으면 같은 팀 멤버
-    if current_user.team_id:
-        users = AuthService.get_users_by_team(current_user.team_id)
-    # 팀이 없고 회사가 있으면 같은 회사 멤버
-    elif current_user.company_id:
-        users = AuthService.get_users_by_company(current_user.company_id)
-    # 둘 다 없으면 기존 department 기반 (하위 호환)
-    elif current_user.department:
-        users = AuthService.get_users_by_department(current_user.department)
-    
-    team_schedules = {}
-    today = date.today()
-    
-    for user in users:
-        if user.id == current_user.id:
-            continue  # 본인 제외
-        
-        schedules = Schedule.query.filter(
-            Schedule.user_id == user.id,
-            Schedule.is_completed == False,
-            Schedule.due_date >= today
-        ).order_by(Schedule.due_date.asc()).limit(5).all()
-        
-        if schedules:
-            team_schedules[user.username] = [
-                {'title': s.title, 'due_date': s.due_date.isoformat()}
-                for s in schedules
-            ]
+    # 본인 제외
+    team_schedules = DigestService.team_upcoming(scope, exclude_user_id=current_user.id)
     
     return jsonify({'success': True, 'team_schedules': team_schedules})
 
 
+def get_team_members(user):
+    """일정 공유 범위의 사용자 목록 (팀 > 회사 > 부서 순, 본인 포함, 조직도 캐시의 Member)"""
+    return org_cache.get().scope_members(user)
+
+
+def parse_hhmm(value, default):
+    """'09:00' → time (비어 있으면 기본값, 형식 오류 시 ValueError)"""
+    if not value:
+        return default
+    return datetime.strptime(value, '%H:%M').time()
+
+
+# 충돌/빈 시간 조회 기간 상한 (일)
+AVAILABILITY_MAX_DAYS = 62
+
+
+@app.route('/api/team/free-slots')
+@login_required
+def api_team_free_slots():
+    """
+    팀 공통 빈 시간 API
+    
+    ?start=&end= (기본: 오늘부터 7일), ?duration=분 (기본 60),
+    ?day_start=09:00&day_end=18:00, ?user_ids=1,2,3 (기본: 팀 전체),
+    ?weekends=1 (주말 포함), ?all_day=1 (종일 일정도 바쁜 시간으로 간주)
+    """
+    members = {user.id: user for user in get_team_members(current_user)}
+    members.setdefault(current_user.id, current_user)
+    
+    window_start = parse_iso_date(request.args.get('start')) or date.today()
+    window_end = parse_iso_date(request.args.get('end')) or window_start + timedelta(days=6)
+    if window_end < window_start or (window_end - window_start).days > AVAILABILITY_MAX_DAYS:
+        return jsonify({'success': False, 'message': f'조회 기간은 {AVAILABILITY_MAX_DAYS}일 이내여야 합니다.'}), 400
+    
+    try:
+        duration = int(request.args.get('duration', 60))
+        day_start = parse_hhmm(request.args.get('day_start'), time(9, 0))
+        day_end = parse_hhmm(request.args.get('day_end'), time(18, 0))
+        if request.args.get('user_ids'):
+            user_ids = [int(v) for v in request.args['user_ids'].split(',') if v.strip()]
+        else:
+            user_ids = list(members)
+    except ValueError:
+        return jsonify({'success': False, 'message': '요청 값 형식이 올바르지 않습니다.'}), 400
+    
+    if not 5 <= duration <= 24 * 60 or day_start >= day_end:
+        return jsonify({'success': False, 'message': '시간 범위가 올바르지 않습니다.'}), 400
+    if any(uid not in members for uid in user_ids):
+        return jsonify({'success': False, 'message': '같은 팀 멤버만 조회할 수 있습니다.'}), 403
+    
+    slots = AvailabilityService.free_slots(
+        user_ids, window_start, window_end,
+        duration=timedelta(minutes=duration),
+        day_start=day_start, day_end=day_end,
+        include_weekends=request.args.get('weekends') == '1',
+        include_all_day=request.args.get('all_day') == '1'
+    )
+    
+    return jsonify({
+        'success': True,
+        'members': [{'id': uid, 'username': members[uid].username} for uid in user_ids],
+        'slots': slots
+    })
+
+
+@app.route('/api/schedule/<int:schedule_id>/conflicts')
+@login_required
+def api_schedule_conflicts(schedule_id):
+    """
+    일정 충돌 API (본인 + 팀원 일정과 겹치는 시간)
+    
+    반복 일정은 ?start=&end= 기간(기본: 오늘부터 90일)의 회차별로 확인합니다.
+    ?scope=self 이면 본인 일정만, ?all_day=1 이면 종일 일정과의 겹침도 포함
+    """
+    schedule = Schedule.query.filter_by(id=schedule_id, user_id=current_user.id).first()
+    if not schedule:
+        return jsonify({'success': False, 'message': '일정을 찾을 수 없습니다.'}), 404
+    
+    if request.args.get('scope') == 'self':
+        members = {current_user.id: current_user}
+    else:
+        members = {user.id: user for user in get_team_members(current_user)}
+        members.setdefault(current_user.id, current_user)
+    
+    if schedule.is_recurring:
+        window_start = parse_iso_date(request.args.get('start')) or date.today()
+        window_end = parse_iso_date(request.args.get('end')) or window_start + timedelta(days=90)
+        if window_end < window_start or (window_end - window_start).days > 366:
+            return jsonify({'success': False, 'message': '조회 기간은 366일 이내여야 합니다.'}), 400
+    else:
+        window_start = schedule.start_date or schedule.due_date
+        window_end = max(schedule.due_date, window_start)
+    
+    conflicts = AvailabilityService.conflicts(
+        schedule, list(members), window_start, window_end,
+        include_all_day=request.args.get('all_day') == '1'
+    )
+    for entry in conflicts:
+        for item in entry['conflicts']:
+            item['username'] = members[item['user_id']].username
+    
+    return jsonify({'success': True, 'conflicts': conflicts})
+
+
 @app.route('/api/search')
 @login_required
+@read_replica
 def api_search():
     """일정 검색 API"""
     query = request.args.get('q', '').strip()
@@ -621,6 +1086,21 @@ def api_search():
     })
 
 
+@app.route('/api/tags')
+@login_required
+def api_tags():
+    """태그 자동완성 API (?q=앞부분, ?limit= 기본 10) - 많이 쓴 태그 순"""
+    try:
+        limit = int(request.args.get('limit', 10))
+    except ValueError:
+        return jsonify({'success': False, 'message': 'limit은 숫자여야 합니다.'}), 400
+    
+    return jsonify({
+        'success': True,
+        'tags': TagService.suggest(current_user.id, request.args.get('q', ''), limit)
+    })
+
+
 @app.route('/api/document/<int:doc_id>/text')
 @login_required
 def api_get_document_text(doc_id):
@@ -637,6 +1117,76 @@ def api_get_document_text(doc_id):
     })
 
 
+# ============================================
+# 캘린더 구독 (ICS 피드)
+# ============================================
+
+@app.route('/feeds/<token>.ics')
+def calendar_feed(token):
+    """
+    ICS 구독 피드 (로그인 없이 토큰으로 접근)
+    
+    저장된 ICS를 그대로 내려주며, 일정이 바뀐 경우에만 다시 생성합니다.
+    If-None-Match / If-Modified-Since가 맞으면 본문 없이 304를 반환합니다.
+    """
+    feed = FeedService.get_feed_by_token(token)
+    if not feed:
+        abort(404)
+    
+    feed = FeedService.ensure_rendered(feed, uid_domain=request.host.split(':')[0])
+    
+    response = Response(mimetype='text/calendar')
+    response.set_etag(feed.etag)
+    response.last_modified = feed.last_modified
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    
+    response.make_conditional(request)
+    if response.status_code != 304:
+        response.set_data(feed.body)
+    return response
+
+
+def feed_url(feed):
+    """피드 구독 URL"""
+    return url_for('calendar_feed', token=feed.token, _external=True)
+
+
+@app.route('/api/feeds')
+@login_required
+def api_get_feeds():
+    """내 일정 / 팀 일정 구독 URL"""
+    user_feed = FeedService.get_or_create_feed(CalendarFeed.OWNER_USER, current_user.id)
+    team_feed = None
+    if current_user.team_id:
+        team_feed = FeedService.get_or_create_feed(CalendarFeed.OWNER_TEAM, current_user.team_id)
+    
+    return jsonify({
+        'success': True,
+        'user': feed_url(user_feed),
+        'team': feed_url(team_feed) if team_feed else None
+    })
+
+
+@app.route('/api/feeds/<scope>/rotate', methods=['POST'])
+@login_required
+def api_rotate_feed(scope):
+    """구독 URL 재발급 (팀 피드는 팀장만)"""
+    if scope == CalendarFeed.OWNER_TEAM:
+        if not current_user.team_id:
+            return jsonify({'success': False, 'message': '소속된 팀이 없습니다.'}), 400
+        if not current_user.is_team_leader():
+            return jsonify({'success': False, 'message': '팀 피드 재발급 권한이 없습니다.'}), 403
+        feed = FeedService.get_or_create_feed(CalendarFeed.OWNER_TEAM, current_user.team_id)
+    elif scope == CalendarFeed.OWNER_USER:
+        feed = FeedService.get_or_create_feed(CalendarFeed.OWNER_USER, current_user.id)
+    else:
+        abort(404)
+    
+    FeedService.rotate_token(feed)
+    return jsonify({'success': True, 'url': feed_url(feed)})
+
+
 # ============================================
 # 회사/팀 관리 라우트
 # ============================================
@@ -648,17 +1198,26 @@ def company_page():
     company = None
     teams = []
     members = []
+    member_counts = {}
+    has_more = False
     
     if current_user.company_id:
         company = Company.query.get(current_user.company_id)
         if company:
+            # 팀 목록 + 팀별 인원(GROUP BY 1회) + 멤버 첫 페이지 - 나머지 멤버는 /api/company/members
             teams = CompanyService.get_company_teams(company.id)
-            members = CompanyService.get_company_members(company.id)
+            member_counts = CompanyService.team_member_counts(company.id)
+            members, has_more = CompanyService.get_company_members_page(
+                company.id, limit=app.config['COMPANY_MEMBERS_PAGE_SIZE']
+            )
     
     return render_template('company.html', 
                          company=company, 
                          teams=teams, 
-                         members=members)
+                         members=members,
+                         member_counts=member_counts,
+                         member_total=sum(member_counts.values()),
+                         next_cursor=members[-1].username if has_more else None)
 
 
 @app.route('/company/create', methods=['POST'])
@@ -766,12 +1325,173 @@ def api_get_company_teams():
         return jsonify({'success': False, 'teams': []})
     
     teams = CompanyService.get_company_teams(current_user.company_id)
+    member_counts = CompanyService.team_member_counts(current_user.company_id)
+    return jsonify({
+        'success': True,
+        'teams': [t.to_dict(member_counts.get(t.id, 0)) for t in teams]
+    })
+
+
+@app.route('/api/company/members')
+@login_required
+def api_get_company_members():
+    """
+    회사 멤버 목록 API (사용자명 순, 페이지 단위)
+    
+    ?cursor=<이전 응답의 next_cursor>, ?limit= (기본 COMPANY_MEMBERS_PAGE_SIZE, 최대 200), ?team_id=
+    """
+    if not current_user.company_id:
+        return jsonify({'success': False, 'members': []})
+    
+    try:
+        limit = max(1, min(int(request.args.get('limit', app.config['COMPANY_MEMBERS_PAGE_SIZE'])), 200))
+        team_id = int(request.args['team_id']) if request.args.get('team_id') else None
+    except ValueError:
+        return jsonify({'success': False, 'message': 'limit, team_id는 숫자여야 합니다.'}), 400
+    
+    members, has_more = CompanyService.get_company_members_page(
+        current_user.company_id, request.args.get('cursor'), limit, team_id
+    )
     return jsonify({
         'success': True,
-        'teams': [t.to_dict() for t in teams]
+        'members': [
+            {
+                'id': member.id,
+                'username': member.username,
+                'role': member.role,
+                'team_id': member.team_id,
+                'team_name': member.team.name if member.team else None
+            }
+            for member in members
+        ],
+        'next_cursor': members[-1].username if has_more else None,
+        'has_more': has_more
     })
 
 
+# ============================================
+# 모니터링
+# ============================================
+
+# METRICS_TOKEN이 없을 때 /metrics 조회를 허용하는 주소 (같은 호스트의 수집기만)
+LOOPBACK_ADDRESSES = {'127.0.0.1', '::1'}
+
+
+def check_metrics_token():
+    """METRICS_TOKEN이 설정되어 있으면 Bearer 토큰 확인, 없으면 로컬 요청만 허용"""
+    token = app.config.get('METRICS_TOKEN')
+    if token:
+        if not bearer_token_matches(token):
+            abort(401)
+    elif request.remote_addr not in LOOPBACK_ADDRESSES:
+        abort(404)
+
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Prometheus 지표 (단계별 소요 시간, 요청별 SQL 쿼리 히스토그램)"""
+    check_metrics_token()
+    return Response(metrics.registry.render(), mimetype='text/plain; version=0.0.4')
+
+
+@app.route('/metrics/sql')
+def sql_metrics():
+    """엔드포인트별 SQL 쿼리 집계 (평균 쿼리 수 내림차순)"""
+    check_metrics_token()
+    return jsonify({'success': True, 'endpoints': endpoint_summary()})
+
+
+# ============================================
+# 조직 일괄 등록
+# ============================================
+
+def run_provisioning(fmt, stream, issue_passwords=False):
+    """조직도 스트림 → 등록 결과 (API/CLI 공용, 임시 비밀번호는 CLI에서만 발급)"""
+    return ProvisioningService.provision(
+        read_org_chart(fmt, stream),
+        rounds=password_hasher.rounds,
+        processes=app.config['PROVISION_HASH_PROCESSES'],
+        batch_size=app.config['PROVISION_BATCH_SIZE'],
+        issue_passwords=issue_passwords
+    )
+
+
+@app.route('/api/admin/provision', methods=['POST'])
+def api_provision():
+    """
+    조직도(CSV/JSON)로 회사, 팀, 사용자 일괄 등록
+    
+    PROVISION_TOKEN Bearer 토큰이 필요하며, 설정되지 않았으면 404입니다.
+    multipart 'file' 필드 또는 요청 본문, ?format=csv|json (없으면 파일 확장자/Content-Type)
+    응답에 비밀번호를 싣지 않으므로 비밀번호가 빈 행은 오류로 건너뜁니다. (임시 비밀번호는 CLI로 발급)
+    """
+    token = app.config.get('PROVISION_TOKEN')
+    if not token:
+        abort(404)
+    if not bearer_token_matches(token):
+        abort(401)
+    
+    upload = request.files.get('file')
+    raw_stream = upload.stream if upload else request.stream
+    fmt = (request.args.get('format') or '').lower()
+    if not fmt:
+        name = (upload.filename if upload else '') or ''
+        mimetype = upload.mimetype if upload else request.mimetype
+        fmt = 'json' if name.lower().endswith('.json') or 'json' in (mimetype or '') else 'csv'
+    if fmt not in PROVISION_FORMATS:
+        return jsonify({'success': False, 'message': '지원하지 않는 형식입니다. (csv, json)'}), 400
+    
+    stream = io.TextIOWrapper(raw_stream, encoding='utf-8-sig', newline='')
+    try:
+        summary = run_provisioning(fmt, stream)
+    except ProvisionError as e:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': str(e)}), 400
+    except UnicodeDecodeError:
+        db.session.rollback()
+        return jsonify({'success': False, 'message': 'UTF-8 인코딩만 지원합니다.'}), 400
+    finally:
+        stream.detach()
+    
+    summary.pop('temporary_passwords', None)
+    return jsonify({'success': True, **summary})
+
+
+@app.cli.command('provision-org')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'fmt', type=click.Choice(PROVISION_FORMATS), help='생략하면 파일 확장자로 판단')
+@click.option('--show-passwords', is_flag=True,
+              help='비밀번호가 빈 사용자에게 임시 비밀번호를 발급하고 화면에 출력 (없으면 그 행은 건너뜀)')
+def provision_org_command(path, fmt, show_passwords):
+    """조직도 파일(CSV/JSON)로 회사, 팀, 사용자 일괄 등록"""
+    fmt = fmt or ('json' if path.lower().endswith('.json') else 'csv')
+    with open(path, encoding='utf-8-sig', newline='') as stream:
+        try:
+            summary = run_provisioning(fmt, stream, issue_passwords=show_passwords)
+        except ProvisionError as e:
+            raise click.ClickException(str(e))
+    
+    click.echo(f"회사: 생성 {summary['companies']['created']} / 기존 {summary['companies']['existing']}")
+    click.echo(f"팀: 생성 {summary['teams']['created']} / 기존 {summary['teams']['existing']}")
+    click.echo(f"사용자: 생성 {summary['users']['created']} / 건너뜀 {summary['users']['skipped']}")
+    for error in summary['errors']:
+        click.echo(f"  {error['row']}행: {error['message']}", err=True)
+    if summary['temporary_passwords']:
+        click.echo('임시 비밀번호 (사용자에게 전달 후 변경 안내):')
+        for item in summary['temporary_passwords']:
+            click.echo(f"  {item['username']}\t{item['password']}")
+
+
+@app.cli.command('refresh-digests')
+def refresh_digests_command():
+    """전체 사용자의 팀원 일정 요약을 오늘 기준으로 미리 다시 계산 (선택 - 조회 때도 쓰기 큐에서 갱신됨)"""
+    user_ids = [user_id for (user_id,) in db.session.query(User.id).order_by(User.id)]
+    for start in range(0, len(user_ids), 500):
+        DigestService.rebuild(user_ids[start:start + 500])
+        db.session.commit()
+    click.echo(f'요약 갱신: {len(user_ids)}명')
+
+
 # ============================================
 # 에러 핸들러
 # ============================================
@@ -0,0 +1,7 @@
+# ============================================
+# 업무 일정 관리 시스템 - 벤치마크 패키지
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\benchmarks\__init__.py
+# ============================================
+
+# 추출 파이프라인 성능/정확도 측정 도구
+# 실행: python -m benchmarks.extraction_bench --help
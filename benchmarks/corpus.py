@@ -0,0 +1,261 @@
+# ============================================
+# 업무 일정 관리 시스템 - 벤치마크용 합성 문서 생성기
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\benchmarks\corpus.py
+# ============================================
+
+import csv
+import os
+import random
+import struct
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import List
+
+
+# 형식별 생성 대상 (DocumentParser 지원 형식 중 생성 가능한 것)
+FORMATS = ('hwp', 'docx', 'pdf', 'xlsx', 'csv')
+
+# 일정 유형별 한글 문장 템플릿
+KOREAN_TEMPLATES = {
+    'deadline': '{title} 보고서는 {date_ko}까지 마감입니다',
+    'submit': '{title} 결과를 {date_ko}에 본부로 제출해야 합니다',
+    'meeting': '{date_ko} 오후 2시 {title} 회의가 있습니다',
+    'trip': '{date_ko} {title} 관련 부산 출장 예정',
+}
+
+# PDF는 기본 폰트(Helvetica)만 사용하므로 영문 템플릿 사용
+ENGLISH_TEMPLATES = {
+    'deadline': 'The {title} report deadline is {date_iso}',
+    'submit': 'Submit the {title} results on {date_iso}',
+    'meeting': 'Project meeting about {title} on {date_iso}',
+    'trip': 'Business trip to visit the {title} site on {date_iso}',
+}
+
+TITLES = ['예산', '인사평가', '보안점검', '신규사업', '분기실적', '교육계획', '장비구매', '고객만족도']
+ENGLISH_TITLES = ['budget', 'audit', 'security', 'roadmap', 'quarterly', 'training', 'procurement', 'survey']
+
+# 날짜가 없는 잡음 문장 (정밀도 측정용)
+NOISE_LINES = [
+    '본 문서는 내부 검토용으로 작성되었습니다',
+    '관련 문의는 담당 부서로 연락 바랍니다',
+    '세부 사항은 첨부 자료를 참고하십시오',
+]
+
+
+@dataclass
+class LabeledItem:
+    """정답 일정 항목"""
+    title: str
+    due_date: date
+    schedule_type: str
+
+
+@dataclass
+class CorpusDocument:
+    """라벨이 붙은 합성 문서"""
+    key: str
+    file_type: str
+    filepath: str
+    items: List[LabeledItem] = field(default_factory=list)
+
+    @property
+    def expected_dates(self) -> set:
+        return {item.due_date for item in self.items}
+
+
+def build_corpus(output_dir: str, docs_per_format: int = 2, items_per_doc: int = 5,
+                 year: int = None, seed: int = 42) -> List[CorpusDocument]:
+    """
+    형식별 합성 문서 생성
+
+    Args:
+        output_dir: 문서를 저장할 폴더
+        docs_per_format: 형식별 문서 수
+        items_per_doc: 문서당 일정 수
+        year: 일정 연도 (기본: 내년 - 과거 날짜 필터에 걸리지 않도록)
+        seed: 난수 시드 (같은 시드면 같은 코퍼스)
+
+    Returns:
+        생성된 문서 목록
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    rng = random.Random(seed)
+    year = year or date.today().year + 1
+
+    corpus = []
+    for file_type in FORMATS:
+        for index in range(docs_per_format):
+            key = f'{file_type}_{index:03d}'
+            items = _random_items(rng, year, items_per_doc)
+            filepath = os.path.join(output_dir, f'{key}.{file_type}')
+
+            if file_type == 'pdf':
+                lines = _english_lines(rng, items)
+            else:
+                lines = _korean_lines(rng, items)
+
+            WRITERS[file_type](filepath, lines)
+            corpus.append(CorpusDocument(key=key, file_type=file_type, filepath=filepath, items=items))
+
+    return corpus
+
+
+def _random_items(rng: random.Random, year: int, count: int) -> List[LabeledItem]:
+    """서로 다른 날짜의 정답 일정 생성"""
+    start = date(year, 1, 1)
+    offsets = rng.sample(range(365), count)
+    types = list(KOREAN_TEMPLATES)
+    return [
+        LabeledItem(
+            title=rng.choice(TITLES),
+            due_date=start + timedelta(days=offset),
+            schedule_type=rng.choice(types)
+        )
+        for offset in sorted(offsets)
+    ]
+
+
+def _korean_lines(rng: random.Random, items: List[LabeledItem]) -> List[str]:
+    lines = []
+    for item in items:
+        date_ko = f'{item.due_date.year}년 {item.due_date.month}월 {item.due_date.day}일'
+        lines.append(KOREAN_TEMPLATES[item.schedule_type].format(title=item.title, date_ko=date_ko))
+        lines.append(rng.choice(NOISE_LINES))
+    return lines
+
+
+def _english_lines(rng: random.Random, items: List[LabeledItem]) -> List[str]:
+    lines = []
+    for item in items:
+        title = ENGLISH_TITLES[TITLES.index(item.title)]
+        lines.append(ENGLISH_TEMPLATES[item.schedule_type].format(title=title, date_iso=item.due_date.isoformat()))
+        lines.append('Please refer to the attached material for details')
+    return lines
+
+
+# ============================================
+# 형식별 작성기
+# ============================================
+
+def _write_docx(filepath: str, lines: List[str]) -> None:
+    from docx import Document
+    doc = Document()
+    for line in lines:
+        doc.add_paragraph(line)
+    doc.save(filepath)
+
+
+def _write_xlsx(filepath: str, lines: List[str]) -> None:
+    import openpyxl
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.title = '일정'
+    sheet.append(['번호', '내용'])
+    for index, line in enumerate(lines, start=1):
+        sheet.append([index, line])
+    wb.save(filepath)
+
+
+def _write_csv(filepath: str, lines: List[str]) -> None:
+    with open(filepath, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['번호', '내용'])
+        for index, line in enumerate(lines, start=1):
+            writer.writerow([index, line])
+
+
+def _write_pdf(filepath: str, lines: List[str]) -> None:
+    """기본 폰트(Helvetica)만 사용하는 최소 PDF 작성"""
+    def escape(text: str) -> str:
+        return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+    commands = ['BT', '/F1 11 Tf', '14 TL', '50 780 Td']
+    for line in lines:
+        commands.append(f'({escape(line)}) Tj T*')
+    commands.append('ET')
+    content = '\n'.join(commands).encode('latin-1')
+
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] '
+        b'/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>',
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+        b'<< /Length ' + str(len(content)).encode() + b' >>\nstream\n' + content + b'\nendstream',
+    ]
+
+    output = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += f'{number} 0 obj\n'.encode() + body + b'\nendobj\n'
+
+    xref_offset = len(output)
+    output += f'xref\n0 {len(objects) + 1}\n'.encode()
+    output += b'0000000000 65535 f \n'
+    for offset in offsets:
+        output += f'{offset:010d} 00000 n \n'.encode()
+    output += f'trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n'.encode()
+    output += f'startxref\n{xref_offset}\n%%EOF\n'.encode()
+
+    with open(filepath, 'wb') as f:
+        f.write(output)
+
+
+def _write_hwp(filepath: str, lines: List[str]) -> None:
+    """
+    PrvText 스트림 하나만 가진 최소 HWP(OLE 복합 문서) 작성
+
+    DocumentParser._parse_hwp는 PrvText(UTF-16 LE)를 읽으므로 이것만으로 충분합니다.
+    스트림은 미니 스트림 기준(4096 bytes) 이상으로 패딩해 일반 FAT 섹터에만 둡니다.
+    """
+    sector_size = 512
+    end_of_chain, free_sect, fat_sect, no_stream = 0xFFFFFFFE, 0xFFFFFFFF, 0xFFFFFFFD, 0xFFFFFFFF
+
+    data = '\r\n'.join(lines).encode('utf-16-le')
+    if len(data) < 4096:
+        data += ' '.encode('utf-16-le') * ((4096 - len(data)) // 2)
+    data_sectors = -(-len(data) // sector_size)
+    if data_sectors > 126:
+        raise ValueError('HWP 벤치마크 문서가 너무 큽니다.')
+
+    # 섹터 배치: 0 = FAT, 1 = 디렉터리, 2.. = PrvText
+    fat = [fat_sect, end_of_chain]
+    fat += [2 + i + 1 for i in range(data_sectors - 1)] + [end_of_chain]
+    fat += [free_sect] * (128 - len(fat))
+
+    def dir_entry(name: str, entry_type: int, child: int, start: int, size: int) -> bytes:
+        encoded = (name + '\0').encode('utf-16-le') if name else b''
+        return struct.pack(
+            '<64sHBBIII16sIQQIQ',
+            encoded, len(encoded), entry_type, 1 if name else 0,
+            no_stream, no_stream, child, b'\0' * 16, 0, 0, 0, start, size
+        )
+
+    directory = (
+        dir_entry('Root Entry', 5, 1, end_of_chain, 0)
+        + dir_entry('PrvText', 2, no_stream, 2, len(data))
+        + dir_entry('', 0, no_stream, 0, 0) * 2
+    )
+
+    header = struct.pack(
+        '<8s16sHHHHH6sIIIIIIIIII',
+        bytes.fromhex('D0CF11E0A1B11AE1'), b'\0' * 16,
+        0x003E, 0x0003, 0xFFFE, 9, 6, b'\0' * 6,
+        0, 1, 1, 0, 4096, end_of_chain, 0, end_of_chain, 0, 0
+    ) + struct.pack('<108I', *([free_sect] * 108))
+
+    with open(filepath, 'wb') as f:
+        f.write(header)
+        f.write(struct.pack('<128I', *fat))
+        f.write(directory)
+        f.write(data.ljust(data_sectors * sector_size, b'\0'))
+
+
+WRITERS = {
+    'hwp': _write_hwp,
+    'docx': _write_docx,
+    'pdf': _write_pdf,
+    'xlsx': _write_xlsx,
+    'csv': _write_csv,
+}
@@ -0,0 +1,252 @@
+# ============================================
+# 업무 일정 관리 시스템 - 추출 파이프라인 벤치마크
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\benchmarks\extraction_bench.py
+# ============================================
+#
+# DocumentParser.parse + AIScheduleExtractor.extract_schedules를 라벨이 붙은
+# 합성 코퍼스에 대해 실행하고 단계별 지연시간, 최대 메모리, 전송 토큰, 날짜 정밀도/재현율을 기록합니다.
+#
+# 실행 예:
+#   python -m benchmarks.extraction_bench                       # 규칙 기반만 (오프라인)
+#   python -m benchmarks.extraction_bench --llm oracle          # 이상적인 LLM 응답 (오프라인)
+#   python -m benchmarks.extraction_bench --llm record --recording benchmarks/recordings.json
+#   python -m benchmarks.extraction_bench --llm replay --recording benchmarks/recordings.json
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional
+
+from benchmarks.corpus import FORMATS, CorpusDocument, build_corpus
+from benchmarks.llm_recorder import RecordedLLMClient
+from services.ai_extractor import AIScheduleExtractor
+from services.document_parser import DocumentParser
+
+
+@dataclass
+class DocumentResult:
+    """문서 1건 실행 결과"""
+    key: str
+    file_type: str
+    parse_ms: float
+    ai_ms: float
+    rules_ms: float
+    extract_ms: float
+    total_ms: float
+    prompt_chars: int
+    prompt_tokens: Optional[int]
+    expected: int
+    extracted: int
+    true_positives: int
+    peak_kb: Optional[float] = None
+
+
+def _timed(stage_times: Dict[str, float], name: str, func):
+    """인스턴스 메서드를 감싸 누적 실행 시간을 기록"""
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            stage_times[name] = stage_times.get(name, 0.0) + time.perf_counter() - start
+    return wrapper
+
+
+def build_extractor(client: Optional[RecordedLLMClient]):
+    """
+    벤치마크용 추출기 생성
+
+    Returns:
+        Tuple[추출기, 단계별 시간 dict]
+    """
+    extractor = AIScheduleExtractor(api_key='benchmark', reference_date=client.reference_date if client else None)
+    if client is not None:
+        extractor.client = client
+        extractor._api_ready = True
+
+    stage_times: Dict[str, float] = {}
+    extractor._extract_by_ai = _timed(stage_times, 'ai', extractor._extract_by_ai)
+    extractor._extract_by_rules = _timed(stage_times, 'rules', extractor._extract_by_rules)
+    return extractor, stage_times
+
+
+def run_document(document: CorpusDocument, extractor: AIScheduleExtractor,
+                 stage_times: Dict[str, float], client: Optional[RecordedLLMClient],
+                 trace_memory: bool = False) -> DocumentResult:
+    """문서 1건에 대해 파싱 → 추출 실행"""
+    stage_times.clear()
+    if client is not None:
+        client.current_key = document.key
+        client.last_prompt_chars = 0
+        client.last_prompt_tokens = None
+
+    if trace_memory:
+        tracemalloc.start()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        success, message, text = DocumentParser.parse(document.filepath)
+        parsed = time.perf_counter()
+        schedules = extractor.extract_schedules(text) if success and text else []
+        finished = time.perf_counter()
+
+    peak_kb = None
+    if trace_memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_kb = peak / 1024
+
+    extracted_dates = {s['due_date'] for s in schedules}
+    return DocumentResult(
+        key=document.key,
+        file_type=document.file_type,
+        parse_ms=(parsed - start) * 1000,
+        ai_ms=stage_times.get('ai', 0.0) * 1000,
+        rules_ms=stage_times.get('rules', 0.0) * 1000,
+        extract_ms=(finished - parsed) * 1000,
+        total_ms=(finished - start) * 1000,
+        prompt_chars=client.last_prompt_chars if client else 0,
+        prompt_tokens=client.last_prompt_tokens if client else None,
+        expected=len(document.expected_dates),
+        extracted=len(extracted_dates),
+        true_positives=len(extracted_dates & document.expected_dates),
+        peak_kb=peak_kb
+    )
+
+
+def summarize(results: List[DocumentResult]) -> dict:
+    """지연시간 분위수와 정밀도/재현율 집계"""
+    def percentile(values: List[float], q: float) -> float:
+        if len(values) == 1:
+            return values[0]
+        return statistics.quantiles(values, n=100, method='inclusive')[int(q) - 1]
+
+    summary = {'documents': len(results)}
+    for stage in ('parse_ms', 'ai_ms', 'rules_ms', 'extract_ms', 'total_ms'):
+        values = [getattr(r, stage) for r in results]
+        summary[stage] = {
+            'mean': statistics.fmean(values),
+            'p50': percentile(values, 50),
+            'p95': percentile(values, 95),
+        }
+
+    peaks = [r.peak_kb for r in results if r.peak_kb is not None]
+    if peaks:
+        summary['peak_kb_max'] = max(peaks)
+
+    tokens = [r.prompt_tokens for r in results if r.prompt_tokens is not None]
+    summary['prompt_chars'] = sum(r.prompt_chars for r in results)
+    summary['prompt_tokens'] = sum(tokens) if tokens else None
+
+    tp = sum(r.true_positives for r in results)
+    extracted = sum(r.extracted for r in results)
+    expected = sum(r.expected for r in results)
+    summary['precision'] = tp / extracted if extracted else 0.0
+    summary['recall'] = tp / expected if expected else 0.0
+    return summary
+
+
+def run(corpus: List[CorpusDocument], client: Optional[RecordedLLMClient],
+        repeat: int = 1, trace_memory: bool = False) -> List[DocumentResult]:
+    """전체 코퍼스 실행 (repeat회 반복, 메모리 측정은 별도 패스)"""
+    extractor, stage_times = build_extractor(client)
+    results = []
+    for _ in range(repeat):
+        for document in corpus:
+            results.append(run_document(document, extractor, stage_times, client))
+
+    if trace_memory:
+        # tracemalloc은 실행 속도를 떨어뜨리므로 지연시간 측정과 분리
+        peaks = {}
+        for document in corpus:
+            peaks[document.key] = run_document(document, extractor, stage_times, client, True).peak_kb
+        for result in results:
+            result.peak_kb = peaks[result.key]
+
+    return results
+
+
+def print_report(results: List[DocumentResult]) -> None:
+    """형식별/전체 요약 출력"""
+    header = f"{'format':<8}{'docs':>6}{'parse p50':>11}{'ai p50':>9}{'rules p50':>11}" \
+             f"{'total p95':>11}{'peak KB':>9}{'prompt':>9}{'prec':>7}{'recall':>8}"
+    print(header)
+    print('-' * len(header))
+
+    groups = [(fmt, [r for r in results if r.file_type == fmt]) for fmt in FORMATS]
+    groups.append(('all', results))
+    for name, group in groups:
+        if not group:
+            continue
+        s = summarize(group)
+        peak = f"{s['peak_kb_max']:.0f}" if 'peak_kb_max' in s else '-'
+        prompt = s['prompt_tokens'] if s['prompt_tokens'] is not None else s['prompt_chars']
+        print(f"{name:<8}{s['documents']:>6}{s['parse_ms']['p50']:>10.2f}m{s['ai_ms']['p50']:>8.2f}m"
+              f"{s['rules_ms']['p50']:>10.2f}m{s['total_ms']['p95']:>10.2f}m{peak:>9}{prompt:>9}"
+              f"{s['precision']:>7.2f}{s['recall']:>8.2f}")
+    print("\n(m = ms, prompt = 토큰 수 또는 토큰 정보가 없으면 문자 수)")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='문서 파싱 + 일정 추출 벤치마크')
+    parser.add_argument('--docs', type=int, default=4, help='형식별 문서 수')
+    parser.add_argument('--items', type=int, default=5, help='문서당 일정 수')
+    parser.add_argument('--repeat', type=int, default=1, help='반복 횟수')
+    parser.add_argument('--seed', type=int, default=42, help='코퍼스 난수 시드')
+    parser.add_argument('--llm', choices=('none',) + RecordedLLMClient.MODES, default='none',
+                        help='none: 규칙 기반만, oracle: 정답 응답, record: Groq 호출 후 저장, replay: 저장된 응답')
+    parser.add_argument('--recording', help='record/replay 모드의 응답 파일 경로')
+    parser.add_argument('--memory', action='store_true', help='tracemalloc으로 최대 메모리 측정')
+    parser.add_argument('--corpus-dir', help='코퍼스 저장 폴더 (기본: 임시 폴더)')
+    parser.add_argument('--json', dest='json_path', help='문서별 결과와 요약을 JSON으로 저장')
+    args = parser.parse_args(argv)
+
+    # replay 시에는 녹화 당시의 연도로 코퍼스를 재생성해야 정답이 맞음
+    corpus_year = None
+    if args.llm == 'replay':
+        if not args.recording:
+            parser.error('--llm replay에는 --recording이 필요합니다.')
+        corpus_year = RecordedLLMClient.load_recordings(args.recording)['corpus_year']
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        corpus_dir = args.corpus_dir or tmp_dir
+        corpus = build_corpus(corpus_dir, args.docs, args.items, year=corpus_year, seed=args.seed)
+        corpus_year = corpus[0].items[0].due_date.year
+
+        client = None
+        if args.llm != 'none':
+            live_client = None
+            if args.llm == 'record':
+                from groq import Groq
+                live_client = Groq(api_key=os.environ.get('GROQ_API_KEY'))
+            client = RecordedLLMClient(args.llm, corpus, args.recording, live_client)
+
+        results = run(corpus, client, repeat=args.repeat, trace_memory=args.memory)
+
+        if client is not None:
+            client.save(corpus_year)
+
+    print_report(results)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'llm': args.llm,
+                'corpus_year': corpus_year,
+                'summary': summarize(results),
+                'documents': [asdict(r) for r in results],
+            }, f, ensure_ascii=False, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
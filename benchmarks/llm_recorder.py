@@ -0,0 +1,136 @@
+# ============================================
+# 업무 일정 관리 시스템 - LLM 응답 녹화/재생 클라이언트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\benchmarks\llm_recorder.py
+# ============================================
+
+import json
+import os
+from datetime import date
+from types import SimpleNamespace
+from typing import Dict, List, Optional
+
+from benchmarks.corpus import CorpusDocument
+
+
+def _completion(content: str, prompt_tokens: Optional[int] = None) -> SimpleNamespace:
+    """Groq 응답과 같은 모양의 객체 생성 (choices[0].message.content, usage)"""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(prompt_tokens=prompt_tokens)
+    )
+
+
+class RecordedLLMClient:
+    """
+    client.chat.completions.create 호환 클라이언트
+
+    AIScheduleExtractor.client 자리에 넣어 사용합니다.
+    벤치마크는 문서마다 current_key를 지정하고, 응답은 문서 키 기준으로 저장/재생됩니다.
+    (프롬프트에 오늘 날짜가 들어가므로 프롬프트 해시는 키로 쓰지 않습니다.)
+    녹화된 응답에는 절대 날짜가 들어 있으므로 재생 시 추출기의 기준 날짜를
+    녹화일(reference_date)로 고정해야 시간이 지나도 같은 점수가 나옵니다.
+
+    모드:
+        oracle: 정답 라벨로 만든 이상적인 JSON 응답 (네트워크 없음, 파싱 경로 측정용)
+        record: 실제 Groq API 호출 후 응답을 파일에 저장
+        replay: 저장된 응답 재생 (오프라인, 재현 가능)
+    """
+
+    MODES = ('oracle', 'record', 'replay')
+
+    def __init__(self, mode: str, corpus: List[CorpusDocument],
+                 recording_path: str = None, live_client=None):
+        if mode not in self.MODES:
+            raise ValueError(f'알 수 없는 모드: {mode}')
+        if mode in ('record', 'replay') and not recording_path:
+            raise ValueError(f'{mode} 모드에는 recording_path가 필요합니다.')
+        if mode == 'record' and live_client is None:
+            raise ValueError('record 모드에는 실제 Groq 클라이언트가 필요합니다.')
+
+        self.mode = mode
+        self.recording_path = recording_path
+        self.live_client = live_client
+        self.current_key = None
+        self._documents: Dict[str, CorpusDocument] = {doc.key: doc for doc in corpus}
+        self._recordings: Dict[str, dict] = {}
+        # 추출기의 '오늘' (record/oracle: 실제 오늘, replay: 녹화일)
+        self.reference_date: Optional[date] = None
+
+        # 호출별 통계 (벤치마크가 문서마다 읽어감)
+        self.last_prompt_chars = 0
+        self.last_prompt_tokens = None
+
+        if mode == 'replay':
+            recordings = self.load_recordings(recording_path)
+            self._recordings = recordings['responses']
+            self.reference_date = self.recorded_on(recordings)
+
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    @staticmethod
+    def load_recordings(path: str) -> dict:
+        """녹화 파일 읽기 ({'corpus_year': int, 'recorded_on': 'YYYY-MM-DD', 'responses': {key: {...}}})"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def recorded_on(recordings: dict) -> date:
+        """
+        녹화일
+
+        녹화일이 없는 예전 파일은 코퍼스 연도의 전년도 1월 1일로 간주합니다.
+        (코퍼스는 녹화 시점의 다음 해 날짜로 만들어지므로 모든 정답이 미래 날짜가 됨)
+        """
+        if recordings.get('recorded_on'):
+            return date.fromisoformat(recordings['recorded_on'])
+        return date(recordings['corpus_year'] - 1, 1, 1)
+
+    def save(self, corpus_year: int) -> None:
+        """녹화 내용 저장 (record 모드)"""
+        if self.mode != 'record':
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.recording_path)), exist_ok=True)
+        with open(self.recording_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'corpus_year': corpus_year,
+                'recorded_on': date.today().isoformat(),
+                'responses': self._recordings,
+            }, f, ensure_ascii=False, indent=2)
+
+    def _create(self, **kwargs) -> SimpleNamespace:
+        messages = kwargs.get('messages') or []
+        self.last_prompt_chars = sum(len(m.get('content') or '') for m in messages)
+        self.last_prompt_tokens = None
+
+        if self.mode == 'oracle':
+            return _completion(self._oracle_response(self.current_key))
+
+        if self.mode == 'replay':
+            recorded = self._recordings.get(self.current_key)
+            if recorded is None:
+                raise KeyError(f'녹화된 응답이 없습니다: {self.current_key}')
+            self.last_prompt_tokens = recorded.get('prompt_tokens')
+            return _completion(recorded['content'], self.last_prompt_tokens)
+
+        completion = self.live_client.chat.completions.create(**kwargs)
+        usage = getattr(completion, 'usage', None)
+        self.last_prompt_tokens = getattr(usage, 'prompt_tokens', None)
+        self._recordings[self.current_key] = {
+            'content': completion.choices[0].message.content,
+            'prompt_tokens': self.last_prompt_tokens,
+        }
+        return completion
+
+    def _oracle_response(self, key: str) -> str:
+        document = self._documents[key]
+        return json.dumps({
+            'schedules': [
+                {
+                    'title': item.title,
+                    'date': item.due_date.isoformat(),
+                    'type': item.schedule_type,
+                    'description': item.title,
+                }
+                for item in document.items
+            ]
+        }, ensure_ascii=False)
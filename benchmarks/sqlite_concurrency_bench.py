@@ -0,0 +1,227 @@
+# ============================================
+# 업무 일정 관리 시스템 - SQLite 동시성 벤치마크
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\benchmarks\sqlite_concurrency_bench.py
+# ============================================
+#
+# 쓰기 스레드(업로드/가져오기처럼 일정 여러 건을 한 트랜잭션으로 INSERT)와
+# 읽기 스레드(대시보드처럼 사용자별 일정 조회, 내보내기/ICS 피드처럼 결과를 나눠 읽는 동안 읽기 잠금 유지)를
+# 동시에 돌려 처리량, 지연시간, 잠금 오류를 비교합니다.
+# - default: 기본 설정 (rollback journal, PRAGMA 없음)
+# - wal:     SQLite 운영 프로필 PRAGMA (services.sqlite_profile)
+# - wal+queue: 운영 프로필 + 단일 쓰기 큐 (services.write_queue)
+#
+# 실행 예:
+#   python -m benchmarks.sqlite_concurrency_bench
+#   python -m benchmarks.sqlite_concurrency_bench --writers 8 --readers 8 --seconds 10 --json result.json
+
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import List
+
+from sqlalchemy import bindparam, create_engine, event, insert, select
+from sqlalchemy.exc import OperationalError
+
+from models import db, load_models
+from services.sqlite_profile import apply_pragmas, build_pragmas
+from services.write_queue import WriteQueue
+
+MODES = ('default', 'wal', 'wal+queue')
+
+# 일정을 나눠 가질 사용자 수
+USERS = 50
+
+
+@dataclass
+class ModeResult:
+    """모드 1개 실행 결과"""
+    mode: str
+    seconds: float
+    write_batches: int = 0
+    rows_written: int = 0
+    reads: int = 0
+    write_errors: int = 0
+    read_errors: int = 0
+    write_ms: List[float] = field(default_factory=list, repr=False)
+    read_ms: List[float] = field(default_factory=list, repr=False)
+
+    def summary(self) -> dict:
+        def percentile(values: List[float], q: float) -> float:
+            if not values:
+                return 0.0
+            ordered = sorted(values)
+            return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))]
+
+        return {
+            'mode': self.mode,
+            'write_batches_per_s': round(self.write_batches / self.seconds, 1),
+            'rows_per_s': round(self.rows_written / self.seconds, 1),
+            'reads_per_s': round(self.reads / self.seconds, 1),
+            'write_p50_ms': round(percentile(self.write_ms, 0.5), 2),
+            'write_p95_ms': round(percentile(self.write_ms, 0.95), 2),
+            'read_p50_ms': round(percentile(self.read_ms, 0.5), 2),
+            'read_p95_ms': round(percentile(self.read_ms, 0.95), 2),
+            'read_mean_ms': round(statistics.fmean(self.read_ms), 2) if self.read_ms else 0.0,
+            'write_errors': self.write_errors,
+            'read_errors': self.read_errors,
+        }
+
+
+def build_engine(path: str, mode: str):
+    engine = create_engine(f'sqlite:///{path}', pool_size=32, max_overflow=0)
+    if mode != 'default':
+        pragmas = build_pragmas()
+        event.listen(engine, 'connect', lambda dbapi_connection, record: apply_pragmas(dbapi_connection, pragmas))
+    return engine
+
+
+def run_mode(mode: str, workdir: str, writers: int, readers: int, seconds: float,
+             batch: int, read_hold_ms: float, seed: int) -> ModeResult:
+    path = os.path.join(workdir, f"bench_{mode.replace('+', '_')}.db")
+    engine = build_engine(path, mode)
+    load_models()
+    db.metadata.create_all(engine)
+    schedules = db.metadata.tables['schedules']
+
+    queue = WriteQueue()
+    queue.configure(None, enabled=(mode == 'wal+queue'), max_pending=writers * 2, timeout=seconds * 10)
+
+    result = ModeResult(mode, seconds)
+    lock = threading.Lock()
+    stop = threading.Event()
+
+    def write_batch(rows):
+        with engine.begin() as connection:
+            connection.execute(insert(schedules), rows)
+
+    def writer(index: int):
+        rng = random.Random(seed + index)
+        while not stop.is_set():
+            user_id = rng.randint(1, USERS)
+            today = date.today()
+            rows = [{
+                'user_id': user_id,
+                'title': f'bench {index}-{i}',
+                'task_description': '',
+                'start_date': today + timedelta(days=rng.randint(0, 60)),
+                'due_date': today + timedelta(days=rng.randint(0, 60)),
+                'is_all_day': True,
+                'schedule_type': 'other',
+                'is_completed': False,
+                'is_ai_generated': True,
+                'created_at': datetime.utcnow(),
+                'updated_at': datetime.utcnow(),
+            } for i in range(batch)]
+            started = time.perf_counter()
+            try:
+                queue.run(write_batch, rows)
+            except OperationalError:
+                with lock:
+                    result.write_errors += 1
+                continue
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                result.write_batches += 1
+                result.rows_written += batch
+                result.write_ms.append(elapsed)
+
+    def reader(index: int):
+        rng = random.Random(seed * 7 + index)
+        query = (
+            select(schedules.c.id, schedules.c.title, schedules.c.due_date)
+            .where(schedules.c.user_id == bindparam('user_id'), schedules.c.is_completed == False)
+            .order_by(schedules.c.due_date)
+            .limit(50)
+        )
+        export = (
+            select(schedules.c.id, schedules.c.title, schedules.c.due_date)
+            .where(schedules.c.user_id == bindparam('user_id'))
+            .order_by(schedules.c.id)
+        )
+        while not stop.is_set():
+            started = time.perf_counter()
+            try:
+                with engine.connect() as connection:
+                    user_id = rng.randint(1, USERS)
+                    connection.execute(query, {'user_id': user_id}).all()
+                    # 스트리밍 응답처럼 일부만 읽고 잠시 멈춘 뒤 나머지를 읽음 (그동안 읽기 잠금 유지)
+                    rows = connection.execute(export, {'user_id': user_id})
+                    rows.fetchmany(10)
+                    if read_hold_ms:
+                        time.sleep(read_hold_ms / 1000)
+                    rows.fetchall()
+            except OperationalError:
+                with lock:
+                    result.read_errors += 1
+                continue
+            elapsed = (time.perf_counter() - started) * 1000
+            with lock:
+                result.reads += 1
+                result.read_ms.append(elapsed)
+
+    threads = [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+    threads += [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(seconds)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+    return result
+
+
+def print_report(summaries: List[dict]) -> None:
+    header = (f"{'mode':<11}{'batch/s':>9}{'rows/s':>10}{'reads/s':>10}"
+              f"{'w p50':>9}{'w p95':>9}{'r p50':>9}{'r p95':>9}{'w err':>7}{'r err':>7}")
+    print(header)
+    print('-' * len(header))
+    for s in summaries:
+        print(f"{s['mode']:<11}{s['write_batches_per_s']:>9.1f}{s['rows_per_s']:>10.1f}{s['reads_per_s']:>10.1f}"
+              f"{s['write_p50_ms']:>8.1f}m{s['write_p95_ms']:>8.1f}m{s['read_p50_ms']:>8.1f}m{s['read_p95_ms']:>8.1f}m"
+              f"{s['write_errors']:>7}{s['read_errors']:>7}")
+    print("\n(m = ms, err = database is locked 등 OperationalError 수)")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='SQLite 동시 쓰기/읽기 벤치마크')
+    parser.add_argument('--writers', type=int, default=4, help='쓰기 스레드 수')
+    parser.add_argument('--readers', type=int, default=8, help='읽기 스레드 수')
+    parser.add_argument('--seconds', type=float, default=5.0, help='모드별 실행 시간 (초)')
+    parser.add_argument('--batch', type=int, default=200, help='쓰기 트랜잭션당 일정 수')
+    parser.add_argument('--read-hold-ms', type=float, default=20, help='읽기 중간에 결과를 붙잡고 있는 시간 (ms)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    parser.add_argument('--modes', default=','.join(MODES), help=f"비교할 모드 (쉼표 구분: {', '.join(MODES)})")
+    parser.add_argument('--workdir', help='DB 파일 폴더 (기본: 임시 폴더)')
+    parser.add_argument('--json', dest='json_path', help='요약을 JSON으로 저장')
+    args = parser.parse_args(argv)
+
+    modes = [mode.strip() for mode in args.modes.split(',') if mode.strip()]
+    unknown = [mode for mode in modes if mode not in MODES]
+    if unknown:
+        parser.error(f'알 수 없는 모드: {unknown}')
+
+    workdir = args.workdir or tempfile.mkdtemp(prefix='sqlite_bench_')
+    summaries = []
+    for mode in modes:
+        result = run_mode(
+            mode, workdir, args.writers, args.readers, args.seconds, args.batch, args.read_hold_ms, args.seed
+        )
+        summaries.append(result.summary())
+
+    print_report(summaries)
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump({'args': vars(args), 'results': summaries}, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
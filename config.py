@@ -20,6 +20,32 @@ class Config:
         f'sqlite:///{os.path.join(BASE_DIR, "database", "app.db")}'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     
+    # 연결 풀 (워커 프로세스마다) - SQLite 메모리 DB에는 풀 크기 옵션을 적용하지 않음
+    DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = float(os.environ.get('DB_POOL_TIMEOUT', 30))  # 풀이 찼을 때 연결 대기 (초)
+    DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', 1800))  # 이 시간(초)이 지난 연결은 새로 연결
+    DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', 'true').lower() == 'true'  # 끊긴 연결 감지
+    DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 0))  # PostgreSQL 쿼리 시간 제한 (0이면 없음)
+    
+    # 읽기 복제본 (설정 시 일정/검색/팀원 일정/파일 보관함 조회를 복제본에서 읽음)
+    DATABASE_REPLICA_URL = os.environ.get('DATABASE_REPLICA_URL')
+    DATABASE_REPLICA_STICKY_SECONDS = float(os.environ.get('DATABASE_REPLICA_STICKY_SECONDS', 5))  # 쓰기 후 주 DB에서 읽는 시간
+    # SQLite 운영 프로필 - 연결마다 WAL, synchronous=NORMAL, busy_timeout, mmap/cache PRAGMA 적용 (SQLite가 아니면 무시)
+    SQLITE_PROFILE = os.environ.get('SQLITE_PROFILE', 'true').lower() == 'true'
+    SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000))  # 쓰기 잠금 대기 (ms)
+    SQLITE_MMAP_SIZE = int(os.environ.get('SQLITE_MMAP_SIZE', 256 * 1024 * 1024))  # 메모리 매핑 크기 (bytes)
+    SQLITE_CACHE_SIZE_KB = int(os.environ.get('SQLITE_CACHE_SIZE_KB', 64 * 1024))  # 연결별 페이지 캐시 (KB)
+    
+    # 단일 쓰기 큐 (업로드 저장, 일정 일괄 가져오기를 전용 스레드에서 순서대로 실행)
+    WRITE_QUEUE_ENABLED = os.environ.get('WRITE_QUEUE_ENABLED', 'true').lower() == 'true'
+    WRITE_QUEUE_MAX_PENDING = int(os.environ.get('WRITE_QUEUE_MAX_PENDING', 64))  # 대기 작업 상한
+    WRITE_QUEUE_TIMEOUT = float(os.environ.get('WRITE_QUEUE_TIMEOUT', 30))  # 큐가 찼을 때 대기 (초)
+    
+    # 시작 시 스키마 버전만 확인하고 새 DB/뒤처진 DB면 python migrate_db.py 안내 후 종료
+    # (true면 시작 시 직접 적용 - 워커가 여러 개면 동시에 적용하려 하므로 단일 프로세스 개발 환경에서만 사용)
+    AUTO_MIGRATE = os.environ.get('AUTO_MIGRATE', 'false').lower() == 'true'
+    
     # 파일 업로드 설정
     UPLOAD_FOLDER = os.path.join(BASE_DIR, 'uploads')
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 최대 16MB
@@ -27,6 +53,53 @@ class Config:
     
     # 세션 설정
     PERMANENT_SESSION_LIFETIME = 86400  # 24시간 (초)
+    
+    # 모니터링 설정
+    TRACE_LOG_ENABLED = os.environ.get('TRACE_LOG_ENABLED', 'false').lower() == 'true'  # 단계별 JSON 로그
+    METRICS_TOKEN = os.environ.get('METRICS_TOKEN')  # 설정 시 /metrics에 Bearer 토큰 필요 (미설정 시 로컬 요청만 허용)
+    
+    # SQL 쿼리 감시 기준 (초과 시 경고 로그)
+    SQL_SLOW_REQUEST_QUERIES = int(os.environ.get('SQL_SLOW_REQUEST_QUERIES', 20))  # 요청당 쿼리 수
+    SQL_SLOW_REQUEST_MS = float(os.environ.get('SQL_SLOW_REQUEST_MS', 200))  # 요청당 DB 시간 합계
+    SQL_SLOW_STATEMENT_MS = float(os.environ.get('SQL_SLOW_STATEMENT_MS', 100))  # 개별 쿼리
+    
+    # 실시간 알림 (SSE) - 연결 유지용 ping 간격 (초)
+    EVENT_STREAM_HEARTBEAT = float(os.environ.get('EVENT_STREAM_HEARTBEAT', 25))
+    
+    # 증분 동기화 - 삭제 기록 보관 기간 (일, 이보다 오래된 커서는 전체 동기화 필요)
+    SYNC_TOMBSTONE_RETENTION_DAYS = int(os.environ.get('SYNC_TOMBSTONE_RETENTION_DAYS', 90))
+    # 증분 동기화 - 늦게 커밋된 변경을 놓치지 않도록 마지막 페이지에서 다시 읽는 최근 구간 (초)
+    SYNC_COMMIT_LAG_SECONDS = float(os.environ.get('SYNC_COMMIT_LAG_SECONDS', 30))
+    
+    # 비밀번호 해시 - bcrypt 비용(log rounds, 바꾸면 다음 로그인 때 다시 해시), 작업 스레드 수, 대기 상한
+    BCRYPT_LOG_ROUNDS = int(os.environ.get('BCRYPT_LOG_ROUNDS', 12))
+    PASSWORD_HASH_WORKERS = int(os.environ.get('PASSWORD_HASH_WORKERS', 4))
+    PASSWORD_HASH_MAX_PENDING = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', 32))
+    
+    # 로그인 시도 제한 (슬라이딩 윈도, 초) - IP별 실패 / 사용자명별 실패
+    LOGIN_RATE_LIMIT_WINDOW = float(os.environ.get('LOGIN_RATE_LIMIT_WINDOW', 300))
+    LOGIN_RATE_LIMIT_IP = int(os.environ.get('LOGIN_RATE_LIMIT_IP', 50))
+    LOGIN_RATE_LIMIT_USER = int(os.environ.get('LOGIN_RATE_LIMIT_USER', 10))
+    
+    # 앞단 리버스 프록시(nginx, 로드밸런서) 수 - X-Forwarded-For/Proto를 이 단계만큼 신뢰 (0이면 무시하고 접속 IP 사용)
+    PROXY_FIX_HOPS = int(os.environ.get('PROXY_FIX_HOPS', 0))
+    
+    # 로그인 사용자 캐시 보관 시간 (초, 0이면 요청마다 조회) - 다른 프로세스의 권한/소속 변경은 이 시간 안에 반영
+    USER_CACHE_TTL = float(os.environ.get('USER_CACHE_TTL', 60))
+    
+    # 조직도 캐시 보관 시간 (초, 0이면 요청마다 조회) - 다른 프로세스의 소속 변경은 이 시간 안에 반영
+    ORG_CACHE_TTL = float(os.environ.get('ORG_CACHE_TTL', 60))
+    
+    # 회사 관리 화면 멤버 목록 페이지 크기 (나머지는 /api/company/members에서 이어 읽기)
+    COMPANY_MEMBERS_PAGE_SIZE = int(os.environ.get('COMPANY_MEMBERS_PAGE_SIZE', 50))
+    
+    # 조직 일괄 등록 (/api/admin/provision, flask provision-org)
+    PROVISION_TOKEN = os.environ.get('PROVISION_TOKEN')  # 미설정 시 API 비활성 (CLI는 사용 가능)
+    PROVISION_HASH_PROCESSES = int(os.environ.get('PROVISION_HASH_PROCESSES', os.cpu_count() or 1))  # 해시 계산 프로세스 수
+    PROVISION_BATCH_SIZE = int(os.environ.get('PROVISION_BATCH_SIZE', 500))  # 트랜잭션당 사용자 수
+    
+    # 대시보드 일정 목록 페이지 크기 (나머지는 '더 보기'로 /api/dashboard/schedules에서 이어 읽기)
+    DASHBOARD_PAGE_SIZE = int(os.environ.get('DASHBOARD_PAGE_SIZE', 50))
 
 
 class DevelopmentConfig(Config):
@@ -1,35 +1,53 @@
+import json
 import os
 
-from flask import Flask, jsonify, request
+from flask import Flask, Response, jsonify, request, stream_with_context
 from groq import Groq
 
 app = Flask(__name__, static_folder="static", static_url_path="/static")
 
+MODEL = "qwen/qwen3-32b"
+
 
 @app.route("/")
 def index():
     return app.send_static_file("index.html")
 
 
-@app.route("/chat", methods=["POST"])
-def chat():
+def _read_message():
+    """Validate the chat request and return (message, error_response)."""
     data = request.get_json(silent=True) or {}
     user_message = (data.get("message") or "").strip()
 
     if not user_message:
-        return jsonify({"error": "message is required"}), 400
+        return None, (jsonify({"error": "message is required"}), 400)
 
     api_key = os.environ.get("GROQ_API_KEY")
     if not api_key:
-        return jsonify({
+        return None, (jsonify({
             "error": "GROQ_API_KEY environment variable is not set."
-        }), 500
+        }), 500)
+
+    return user_message, None
+
+
+def _sse(data, event=None):
+    """Format one server-sent event frame."""
+    frame = f"event: {event}\n" if event else ""
+    return frame + f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@app.route("/chat", methods=["POST"])
+def chat():
+    user_message, error = _read_message()
+    if error:
+        return error
 
     client = Groq()
 
     try:
         completion = client.chat.completions.create(
-            model="qwen/qwen3-32b",
+            model=MODEL,
             messages=[{"role": "user", "content": user_message}],
             temperature=0.6,
             max_completion_tokens=512,
@@ -45,6 +63,66 @@ def chat():
     return jsonify({"reply": reply})
 
 
+@app.route("/chat/stream", methods=["POST"])
+def chat_stream():
+    """Stream the completion as server-sent events.
+
+    Frames are `data: {"delta": "..."}` per token chunk, followed by
+    `event: done` (or `event: error`). The response is a generator, so the
+    WSGI server only pulls the next upstream chunk once the previous one has
+    been written to the socket; a slow client therefore slows the upstream
+    read instead of growing a buffer. The Groq stream is closed from the
+    response's close callback, which the WSGI server calls even when the
+    client disconnects before the first chunk (when the generator never
+    started and its own cleanup would not run); closing it drops the
+    upstream HTTP connection and aborts generation.
+    """
+    user_message, error = _read_message()
+    if error:
+        return error
+
+    client = Groq()
+
+    try:
+        stream = client.chat.completions.create(
+            model=MODEL,
+            messages=[{"role": "user", "content": user_message}],
+            temperature=0.6,
+            max_completion_tokens=512,
+            top_p=0.95,
+            stream=True,
+            stop=None,
+        )
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+    def generate():
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield _sse({"delta": delta})
+            yield _sse({}, event="done")
+        except GeneratorExit:
+            # Client went away; call_on_close aborts the upstream call.
+            raise
+        except Exception as e:
+            yield _sse({"error": str(e)}, event="error")
+
+    response = Response(
+        stream_with_context(generate()),
+        mimetype="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
+    response.call_on_close(stream.close)
+    return response
+
+
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5000))
-    app.run(host="0.0.0.0", port=port, debug=True)
+    app.run(host="0.0.0.0", port=port, debug=True, threaded=True)
@@ -1,119 +1,49 @@
 # migrate_db.py
-# DB migration script
-# Run: python migrate_db.py
+# DB migration script - migrations/ 폴더의 버전별 스크립트 중 적용되지 않은 것을 순서대로 적용
+# Run: python migrate_db.py          (적용)
+#      python migrate_db.py --status (현재/최신 버전만 확인)
 
-import sqlite3
+import os
+import sys
 
-print("=" * 50)
-print("DB Migration Start")
-print("=" * 50)
+from sqlalchemy import create_engine
 
-conn = sqlite3.connect('database/app.db')
-cursor = conn.cursor()
+from config import Config
+from migrations import check, current_version, discover, latest_version
 
-print("\n[1] Adding columns to users table...")
 
-try:
-    cursor.execute('ALTER TABLE users ADD COLUMN company_id INTEGER')
-    print("  OK: company_id added")
-except sqlite3.OperationalError as e:
-    if "duplicate column" in str(e).lower():
-        print("  SKIP: company_id exists")
-    else:
-        print("  ERROR:", e)
-
-try:
-    cursor.execute('ALTER TABLE users ADD COLUMN team_id INTEGER')
-    print("  OK: team_id added")
-except sqlite3.OperationalError as e:
-    if "duplicate column" in str(e).lower():
-        print("  SKIP: team_id exists")
-    else:
-        print("  ERROR:", e)
+def main():
+    uri = Config.SQLALCHEMY_DATABASE_URI
+    if uri.startswith('sqlite:///'):
+        os.makedirs(os.path.dirname(uri.replace('sqlite:///', '')) or '.', exist_ok=True)
+    engine = create_engine(uri)
 
-try:
-    cursor.execute("ALTER TABLE users ADD COLUMN role VARCHAR(20) DEFAULT 'member'")
-    print("  OK: role added")
-except sqlite3.OperationalError as e:
-    if "duplicate column" in str(e).lower():
-        print("  SKIP: role exists")
-    else:
-        print("  ERROR:", e)
+    print("=" * 50)
+    print("DB Migration")
+    print("=" * 50)
 
-print("\n[2] Adding columns to schedules table...")
+    with engine.connect() as connection:
+        version = current_version(connection)
+    latest = latest_version()
+    print(f"  current: {'(none)' if version is None else version} / latest: {latest}")
 
-try:
-    cursor.execute('ALTER TABLE schedules ADD COLUMN start_date DATE')
-    print("  OK: start_date added")
-except sqlite3.OperationalError as e:
-    if "duplicate column" in str(e).lower():
-        print("  SKIP: start_date exists")
-    else:
-        print("  ERROR:", e)
+    if '--status' in sys.argv:
+        for migration in discover():
+            mark = 'x' if version is not None and migration.version <= version else ' '
+            print(f"  [{mark}] {migration.version:04d} {migration.description}")
+        return
 
-try:
-    cursor.execute('ALTER TABLE schedules ADD COLUMN start_time TIME')
-    print("  OK: start_time added")
-except sqlite3.OperationalError as e:
-    if "duplicate column" in str(e).lower():
-        print("  SKIP: start_time exists")
+    if version == latest:
+        print("  SKIP: already up to date")
     else:
-        print("  ERROR:", e)
-
-try:
-    cursor.execute('ALTER TABLE schedules ADD COLUMN end_time TIME')
-    print("  OK: end_time added")
-except sqlite3.OperationalError as e:
-    if "duplicate column" in str(e).lower():
-        print("  SKIP: end_time exists")
-    else:
-        print("  ERROR:", e)
-
-try:
-    cursor.execute('ALTER TABLE schedules ADD COLUMN is_all_day BOOLEAN DEFAULT 1')
-    print("  OK: is_all_day added")
-except sqlite3.OperationalError as e:
-    if "duplicate column" in str(e).lower():
-        print("  SKIP: is_all_day exists")
-    else:
-        print("  ERROR:", e)
-
-print("\n[3] Creating companies table...")
-cursor.execute('''
-CREATE TABLE IF NOT EXISTS companies (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name VARCHAR(100) NOT NULL,
-    code VARCHAR(20) UNIQUE NOT NULL,
-    description VARCHAR(200),
-    admin_id INTEGER,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-)
-''')
-print("  OK: companies table ready")
-
-print("\n[4] Creating teams table...")
-cursor.execute('''
-CREATE TABLE IF NOT EXISTS teams (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    company_id INTEGER NOT NULL,
-    name VARCHAR(50) NOT NULL,
-    code VARCHAR(20) UNIQUE NOT NULL,
-    description VARCHAR(200),
-    leader_id INTEGER,
-    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (company_id) REFERENCES companies(id)
-)
-''')
-print("  OK: teams table ready")
+        # 새 DB는 모델 기준으로 생성, schema_version이 없는 기존 DB는 1번부터 적용
+        check(engine, auto_upgrade=True, log=lambda message: print("  " + message))
 
-print("\n[5] Updating existing schedules (set start_date = due_date where NULL)...")
-cursor.execute('UPDATE schedules SET start_date = due_date WHERE start_date IS NULL')
-print("  OK: existing schedules updated")
+    print("\n" + "=" * 50)
+    print("Migration Complete!")
+    print("=" * 50)
+    print("\nNow run: python app.py")
 
-conn.commit()
-conn.close()
 
-print("\n" + "=" * 50)
-print("Migration Complete!")
-print("=" * 50)
-print("\nNow run: python app.py")
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,202 @@
+# ============================================
+# 업무 일정 관리 시스템 - 버전별 스키마 마이그레이션
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\migrations\__init__.py
+# ============================================
+#
+# migrations/mNNNN_이름.py 스크립트를 번호 순으로 한 번씩 적용하고,
+# 적용한 번호를 schema_version 테이블에 기록합니다.
+# - 앱 시작 시에는 schema_version의 최대 번호만 확인 (스키마 전체를 조회/비교하지 않음)
+# - 적용은 배포 시 python migrate_db.py로 한 번만 실행 (워커 여러 개가 동시에 DDL을 실행하지 않도록)
+# - 새 DB는 모델 기준으로 테이블을 만들고 최신 번호로 기록 (스크립트 실행 생략)
+# - schema_version이 없는 기존 DB는 1번부터 적용 (모든 스크립트는 다시 실행해도 안전하게 작성)
+# - 큰 테이블 UPDATE는 backfill()로 id 구간을 나눠 구간마다 커밋 (쓰기 잠금을 짧게 유지)
+#
+# 새 스크립트 추가: 다음 번호로 mNNNN_설명.py를 만들고 upgrade(connection)를 정의
+# (모듈 docstring 첫 줄이 적용 로그에 표시됨)
+# SQLite와 PostgreSQL 모두에서 돌도록 테이블/컬럼은 SQLAlchemy Table/Column으로 정의하고
+# 방언별 문법(INSERT OR IGNORE, AUTOINCREMENT, DATETIME 등)을 직접 쓰지 않습니다.
+
+import importlib
+import pkgutil
+import re
+from datetime import datetime
+from typing import Callable, List, NamedTuple, Optional
+
+from sqlalchemy import Column, DateTime, Engine, Integer, MetaData, String, Table, func, inspect, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import CreateColumn
+
+VERSION_TABLE = 'schema_version'
+
+# 적용 기록 테이블 (모델 메타데이터와 분리 - 마이그레이션 도구 전용)
+version_metadata = MetaData()
+version_table = Table(
+    VERSION_TABLE, version_metadata,
+    Column('version', Integer, primary_key=True, autoincrement=False),
+    Column('name', String(100), nullable=False),
+    Column('applied_at', DateTime, nullable=False),
+)
+
+# backfill 한 번에 처리할 id 구간 크기
+BACKFILL_BATCH = 1000
+
+MODULE_PATTERN = re.compile(r'^m(\d{4})_\w+$')
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    description: str
+    upgrade: Callable[[Connection], None]
+
+
+class SchemaOutdated(RuntimeError):
+    """DB 스키마가 코드보다 오래됨 (마이그레이션 필요)"""
+
+
+def discover() -> List[Migration]:
+    """migrations 패키지의 스크립트 목록 (번호 순)"""
+    migrations = []
+    for module_info in pkgutil.iter_modules(__path__):
+        match = MODULE_PATTERN.match(module_info.name)
+        if not match:
+            continue
+        module = importlib.import_module(f'{__name__}.{module_info.name}')
+        description = (module.__doc__ or '').strip().splitlines()
+        migrations.append(Migration(
+            int(match.group(1)), module_info.name, description[0] if description else '', module.upgrade
+        ))
+    migrations.sort(key=lambda m: m.version)
+    versions = [m.version for m in migrations]
+    if len(set(versions)) != len(versions):
+        raise RuntimeError(f'마이그레이션 번호가 중복됩니다: {versions}')
+    return migrations
+
+
+def latest_version() -> int:
+    migrations = discover()
+    return migrations[-1].version if migrations else 0
+
+
+def current_version(connection: Connection) -> Optional[int]:
+    """적용된 최신 번호 (schema_version 테이블이 없으면 None)"""
+    if not inspect(connection).has_table(VERSION_TABLE):
+        return None
+    return connection.execute(select(func.max(version_table.c.version))).scalar() or 0
+
+
+def check(engine: Engine, auto_upgrade: bool = False, log: Callable[[str], None] = print) -> int:
+    """
+    앱 시작 시 스키마 버전 확인
+
+    auto_upgrade면 새 DB는 모델 기준으로 만들고 뒤처진 DB는 적용, 아니면 SchemaOutdated.
+
+    Returns:
+        현재 번호
+    """
+    latest = latest_version()
+    with engine.connect() as connection:
+        version = current_version(connection)
+        if version is None and not inspect(connection).has_table('users'):
+            if not auto_upgrade:
+                raise SchemaOutdated('빈 데이터베이스입니다. python migrate_db.py를 실행해 테이블을 만드세요.')
+            _create_fresh(connection)
+            log(f'✅ 새 데이터베이스를 만들었습니다. (스키마 버전 {latest})')
+            return latest
+    if version == latest:
+        return latest
+    if version is not None and version > latest:
+        raise SchemaOutdated(f'DB 스키마 버전({version})이 코드({latest})보다 높습니다.')
+    if not auto_upgrade:
+        raise SchemaOutdated(
+            f'DB 스키마 버전({version or 0})이 최신({latest})이 아닙니다. python migrate_db.py를 실행하세요.'
+        )
+    upgrade(engine, log)
+    return latest
+
+
+def upgrade(engine: Engine, log: Callable[[str], None] = print) -> List[Migration]:
+    """적용되지 않은 스크립트를 번호 순으로 적용 (스크립트마다 기록 후 커밋)"""
+    applied = []
+    with engine.connect() as connection:
+        _ensure_version_table(connection)
+        connection.commit()
+        version = current_version(connection)
+        for migration in discover():
+            if migration.version <= version:
+                continue
+            log(f'[{migration.version:04d}] {migration.description or migration.name}')
+            migration.upgrade(connection)
+            _record(connection, migration)
+            connection.commit()
+            applied.append(migration)
+    return applied
+
+
+# ============================================
+# 스크립트용 도우미 (모두 다시 실행해도 안전)
+# ============================================
+
+def add_column(connection: Connection, table: str, column: Column) -> bool:
+    """컬럼이 없을 때만 ALTER TABLE ADD COLUMN (예: Column('team_id', Integer), 타입/기본값은 DB 방언에 맞게 변환)"""
+    if column.name in {existing['name'] for existing in inspect(connection).get_columns(table)}:
+        return False
+    ddl = CreateColumn(column).compile(dialect=connection.dialect)
+    connection.execute(text(f'ALTER TABLE {table} ADD COLUMN {ddl}'))
+    return True
+
+
+def create_index(connection: Connection, name: str, table: str, columns: str) -> None:
+    """색인이 없을 때만 생성 (CREATE INDEX IF NOT EXISTS - SQLite, PostgreSQL 공통)"""
+    connection.execute(text(f'CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})'))
+
+
+def backfill(connection: Connection, table: str, assignments: str, condition: str,
+             batch: int = BACKFILL_BATCH) -> int:
+    """
+    UPDATE table SET assignments WHERE condition 을 id 구간별로 나눠 실행 (구간마다 커밋)
+
+    한 번에 전체를 UPDATE하면 끝날 때까지 DB 쓰기가 막히므로, 구간마다 잠금을 풀어
+    앱의 다른 쓰기가 사이사이 들어올 수 있게 합니다. 중간에 멈춰도 다시 실행하면 이어서 처리됩니다.
+
+    Returns:
+        바뀐 행 수
+    """
+    max_id = connection.execute(text(f'SELECT MAX(id) FROM {table}')).scalar() or 0
+    statement = text(f'UPDATE {table} SET {assignments} WHERE id > :low AND id <= :high AND ({condition})')
+    updated = 0
+    for low in range(0, max_id, batch):
+        updated += connection.execute(statement, {'low': low, 'high': low + batch}).rowcount
+        connection.commit()
+    return updated
+
+
+# ============================================
+# 내부
+# ============================================
+
+def _ensure_version_table(connection: Connection) -> None:
+    version_metadata.create_all(connection)
+
+
+def _record(connection: Connection, migration: Migration) -> None:
+    """적용 번호 기록 (이미 있으면 그대로 - 마이그레이션은 한 프로세스에서만 실행)"""
+    exists = connection.execute(
+        select(version_table.c.version).where(version_table.c.version == migration.version)
+    ).first()
+    if exists is None:
+        connection.execute(version_table.insert().values(
+            version=migration.version, name=migration.name, applied_at=datetime.utcnow()
+        ))
+
+
+def _create_fresh(connection: Connection) -> None:
+    """새 DB: 모델 기준으로 모든 테이블을 만들고 모든 스크립트를 적용한 것으로 기록"""
+    from models import db, load_models
+
+    load_models()
+    db.metadata.create_all(connection)
+    _ensure_version_table(connection)
+    for migration in discover():
+        _record(connection, migration)
+    connection.commit()
@@ -0,0 +1,11 @@
+"""users: 회사/팀/권한 컬럼 추가"""
+
+from sqlalchemy import Column, Integer, String
+
+from migrations import add_column
+
+
+def upgrade(connection):
+    add_column(connection, 'users', Column('company_id', Integer))
+    add_column(connection, 'users', Column('team_id', Integer))
+    add_column(connection, 'users', Column('role', String(20), server_default='member'))
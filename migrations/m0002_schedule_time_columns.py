@@ -0,0 +1,14 @@
+"""schedules: 기간/시간/반복 컬럼 추가"""
+
+from sqlalchemy import Boolean, Column, Date, String, Time, true
+
+from migrations import add_column
+
+
+def upgrade(connection):
+    add_column(connection, 'schedules', Column('start_date', Date))
+    add_column(connection, 'schedules', Column('start_time', Time))
+    add_column(connection, 'schedules', Column('end_time', Time))
+    add_column(connection, 'schedules', Column('is_all_day', Boolean, server_default=true()))
+    add_column(connection, 'schedules', Column('recurrence_rule', String(200)))
+    add_column(connection, 'schedules', Column('recurrence_until', Date))
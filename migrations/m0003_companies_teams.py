@@ -0,0 +1,31 @@
+"""companies, teams 테이블 생성"""
+
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, MetaData, String, Table, func
+
+metadata = MetaData()
+
+companies = Table(
+    'companies', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('name', String(100), nullable=False),
+    Column('code', String(20), unique=True, nullable=False),
+    Column('description', String(200)),
+    Column('admin_id', Integer),
+    Column('created_at', DateTime, server_default=func.current_timestamp()),
+)
+
+teams = Table(
+    'teams', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('company_id', Integer, ForeignKey('companies.id'), nullable=False),
+    Column('name', String(50), nullable=False),
+    Column('code', String(20), unique=True, nullable=False),
+    Column('description', String(200)),
+    Column('leader_id', Integer),
+    Column('created_at', DateTime, server_default=func.current_timestamp()),
+)
+
+
+def upgrade(connection):
+    # 없는 테이블만 생성
+    metadata.create_all(connection)
@@ -0,0 +1,34 @@
+"""반복 일정 회차 예외(schedule_exceptions) 테이블 생성"""
+
+from sqlalchemy import (
+    Boolean, Column, Date, DateTime, ForeignKey, Integer, MetaData, String, Table, Time, UniqueConstraint,
+    false, func
+)
+
+from migrations import create_index
+
+metadata = MetaData()
+
+# 외래키 대상 (생성하지 않음)
+schedules = Table('schedules', metadata, Column('id', Integer, primary_key=True))
+
+schedule_exceptions = Table(
+    'schedule_exceptions', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('schedule_id', Integer, ForeignKey('schedules.id'), nullable=False),
+    Column('occurrence_date', Date, nullable=False),
+    Column('is_cancelled', Boolean, server_default=false()),
+    Column('override_date', Date),
+    Column('title', String(200)),
+    Column('start_time', Time),
+    Column('end_time', Time),
+    Column('is_completed', Boolean),
+    Column('created_at', DateTime, server_default=func.current_timestamp()),
+    UniqueConstraint('schedule_id', 'occurrence_date', name='uq_schedule_exception_occurrence'),
+)
+
+
+def upgrade(connection):
+    metadata.create_all(connection, tables=[schedule_exceptions])
+    create_index(connection, 'ix_schedule_exceptions_schedule_id', 'schedule_exceptions', 'schedule_id')
+    create_index(connection, 'ix_schedules_recurrence_until', 'schedules', 'recurrence_until')
@@ -0,0 +1,7 @@
+"""schedules: 시작일이 없는 일정은 마감일로 채움 (구간별 커밋)"""
+
+from migrations import backfill
+
+
+def upgrade(connection):
+    backfill(connection, 'schedules', 'start_date = due_date', 'start_date IS NULL')
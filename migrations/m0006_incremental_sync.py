@@ -0,0 +1,24 @@
+"""증분 동기화: updated_at 채움, 색인, 삭제 기록(schedule_tombstones) 테이블"""
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table
+
+from migrations import add_column, backfill, create_index
+
+metadata = MetaData()
+
+schedule_tombstones = Table(
+    'schedule_tombstones', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('schedule_id', Integer, nullable=False),
+    Column('user_id', Integer, nullable=False),
+    Column('deleted_at', DateTime),
+)
+
+
+def upgrade(connection):
+    add_column(connection, 'schedules', Column('updated_at', DateTime))
+    backfill(connection, 'schedules', 'updated_at = COALESCE(created_at, CURRENT_TIMESTAMP)', 'updated_at IS NULL')
+    create_index(connection, 'ix_schedules_user_id_updated_at', 'schedules', 'user_id, updated_at, id')
+    metadata.create_all(connection)
+    create_index(connection, 'ix_schedule_tombstones_user_id_id', 'schedule_tombstones', 'user_id, id')
+    create_index(connection, 'ix_schedule_tombstones_deleted_at', 'schedule_tombstones', 'deleted_at')
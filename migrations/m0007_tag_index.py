@@ -0,0 +1,81 @@
+"""태그 색인(tags, schedule_tags) 생성 및 schedules.tags에서 채움"""
+
+from sqlalchemy import (
+    Column, ForeignKey, Integer, MetaData, String, Table, Text, UniqueConstraint, func, select
+)
+
+from migrations import BACKFILL_BATCH, create_index
+from models.tag import Tag
+
+metadata = MetaData()
+
+# 외래키 대상 / 읽기용 (생성하지 않음)
+users = Table('users', metadata, Column('id', Integer, primary_key=True))
+schedules = Table(
+    'schedules', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('user_id', Integer),
+    Column('tags', Text),
+)
+
+tags = Table(
+    'tags', metadata,
+    Column('id', Integer, primary_key=True),
+    Column('user_id', Integer, ForeignKey('users.id'), nullable=False),
+    Column('name', String(50), nullable=False),
+    Column('usage_count', Integer, nullable=False, server_default='0'),
+    UniqueConstraint('user_id', 'name', name='uq_tags_user_id_name'),
+)
+
+schedule_tags = Table(
+    'schedule_tags', metadata,
+    Column('schedule_id', Integer, ForeignKey('schedules.id'), primary_key=True),
+    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True),
+)
+
+
+def upgrade(connection):
+    metadata.create_all(connection, tables=[tags, schedule_tags])
+    create_index(connection, 'ix_schedule_tags_tag_id_schedule_id', 'schedule_tags', 'tag_id, schedule_id')
+    connection.commit()
+
+    # 일정 id 순으로 나눠 읽으며 연결 추가 (이미 있는 태그/연결은 건너뛰므로 다시 실행해도 안전)
+    select_rows = (
+        select(schedules.c.id, schedules.c.user_id, schedules.c.tags)
+        .where(schedules.c.tags.isnot(None), schedules.c.tags != '')
+        .order_by(schedules.c.id)
+        .limit(BACKFILL_BATCH)
+    )
+    last_id = 0
+    while True:
+        rows = connection.execute(select_rows.where(schedules.c.id > last_id)).fetchall()
+        if not rows:
+            break
+        linked = set(connection.execute(
+            select(schedule_tags.c.schedule_id, schedule_tags.c.tag_id)
+            .where(schedule_tags.c.schedule_id.in_([row[0] for row in rows]))
+        ).all())
+        for schedule_id, user_id, value in rows:
+            for name in Tag.parse_names(value):
+                tag_id = _tag_id(connection, user_id, name)
+                if (schedule_id, tag_id) not in linked:
+                    connection.execute(schedule_tags.insert().values(schedule_id=schedule_id, tag_id=tag_id))
+                    linked.add((schedule_id, tag_id))
+        last_id = rows[-1][0]
+        connection.commit()
+
+    connection.execute(tags.update().values(
+        usage_count=select(func.count()).where(schedule_tags.c.tag_id == tags.c.id).scalar_subquery()
+    ))
+
+
+def _tag_id(connection, user_id, name):
+    """사용자 태그 ID (없으면 생성)"""
+    tag_id = connection.execute(
+        select(tags.c.id).where(tags.c.user_id == user_id, tags.c.name == name)
+    ).scalar()
+    if tag_id is None:
+        tag_id = connection.execute(
+            tags.insert().values(user_id=user_id, name=name, usage_count=0)
+        ).inserted_primary_key[0]
+    return tag_id
@@ -0,0 +1,7 @@
+"""users: 회사 멤버 목록용 (company_id, username) 색인"""
+
+from migrations import create_index
+
+
+def upgrade(connection):
+    create_index(connection, 'ix_users_company_id_username', 'users', 'company_id, username')
@@ -0,0 +1,16 @@
+"""모델에만 있던 테이블(calendar_feeds, upcoming_digests 등)과 색인 생성
+
+이전에는 앱 시작 때마다 db.create_all()이 만들던 것들입니다.
+"""
+
+from models import db, load_models
+
+
+def upgrade(connection):
+    load_models()
+    # 없는 테이블만 생성 (있는 테이블은 건드리지 않음)
+    db.metadata.create_all(connection)
+    # 이미 있던 테이블에 나중에 모델에 추가된 색인
+    for table in db.metadata.tables.values():
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
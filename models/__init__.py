@@ -4,23 +4,56 @@
 # ============================================
 
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session
+from sqlalchemy.sql import Select
+
+# 읽기 복제본 bind 이름 (SQLALCHEMY_BINDS, DATABASE_REPLICA_URL 설정 시)
+REPLICA_BIND = 'replica'
+
+# session.info 키 - True면 이 세션의 SELECT를 복제본으로 보냄 (services.db_routing.read_replica)
+READ_REPLICA_KEY = 'read_replica'
+
+
+class RoutingSession(Session):
+    """읽기 전용 요청에서는 SELECT만 복제본 엔진으로 보내는 세션 (flush/INSERT/UPDATE/DELETE는 항상 주 DB)"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and self.info.get(READ_REPLICA_KEY) and not self._flushing and isinstance(clause, Select):
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
 
 # SQLAlchemy 인스턴스 생성
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+
+def load_models():
+    """모든 모델 import (db.metadata에 테이블 등록)"""
+    from models.user import User
+    from models.company import Company
+    from models.team import Team
+    from models.document import Document
+    from models.schedule import Schedule
+    from models.schedule_exception import ScheduleException
+    from models.schedule_tombstone import ScheduleTombstone
+    from models.tag import Tag
+    from models.calendar_feed import CalendarFeed
+    from models.upcoming_digest import UpcomingDigest
 
 
 def init_db(app):
-    """데이터베이스 초기화 함수"""
+    """
+    데이터베이스 초기화 함수
+    
+    스키마는 migrations/의 버전별 스크립트로 관리하며, 시작 시에는 schema_version만 확인합니다.
+    (새 DB 생성과 스크립트 적용은 python migrate_db.py, AUTO_MIGRATE가 켜져 있으면 시작 시 직접 적용)
+    """
+    from migrations import check
+    
     db.init_app(app)
+    load_models()
     
     with app.app_context():
-        # 모든 모델 import (테이블 생성을 위해)
-        from models.user import User
-        from models.company import Company
-        from models.team import Team
-        from models.document import Document
-        from models.schedule import Schedule
-        
-        # 모든 테이블 생성
-        db.create_all()
-        print("✅ 데이터베이스 테이블이 생성되었습니다.")
+        check(db.engine, auto_upgrade=app.config.get('AUTO_MIGRATE', False))
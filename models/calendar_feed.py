@@ -0,0 +1,53 @@
+# ============================================
+# 업무 일정 관리 시스템 - 캘린더 구독(ICS) 피드 모델
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\models\calendar_feed.py
+# ============================================
+
+import secrets
+from datetime import datetime
+from models import db
+
+
+class CalendarFeed(db.Model):
+    """
+    사용자/팀별 ICS 구독 피드
+
+    body에 미리 생성한 ICS를 저장해 두고, 일정이 바뀌면 body를 NULL로 비워
+    다음 조회 때만 다시 생성합니다. (FeedService 참고)
+    """
+
+    __tablename__ = 'calendar_feeds'
+    __table_args__ = (
+        db.UniqueConstraint('owner_type', 'owner_id', name='uq_calendar_feed_owner'),
+    )
+
+    # 소유자 유형 상수
+    OWNER_USER = 'user'
+    OWNER_TEAM = 'team'
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    owner_type = db.Column(db.String(10), nullable=False)  # user / team
+    owner_id = db.Column(db.Integer, nullable=False)  # 사용자 ID 또는 팀 ID
+    token = db.Column(db.String(64), unique=True, nullable=False, index=True)  # 구독 URL 토큰
+    body = db.deferred(db.Column(db.Text, nullable=True))  # 미리 생성된 ICS (NULL이면 재생성 필요)
+    etag = db.Column(db.String(64), nullable=True)
+    last_modified = db.Column(db.DateTime, nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    def __init__(self, owner_type: str, owner_id: int):
+        self.owner_type = owner_type
+        self.owner_id = owner_id
+        self.token = self.generate_token()
+
+    @staticmethod
+    def generate_token() -> str:
+        """추측 불가능한 구독 토큰 생성"""
+        return secrets.token_urlsafe(24)
+
+    @property
+    def is_stale(self) -> bool:
+        """재생성 필요 여부"""
+        return self.etag is None
+
+    def __repr__(self) -> str:
+        return f'<CalendarFeed {self.owner_type}:{self.owner_id}>'
@@ -33,13 +33,14 @@ class Company(db.Model):
     
     @staticmethod
     def generate_code(length: int = 8) -> str:
-        """랜덤 회사 코드 생성"""
+        """
+        랜덤 회사 코드 생성
+
+        중복 여부는 조회하지 않고 code 유니크 인덱스에 맡깁니다.
+        저장 시 충돌하면 새 코드로 다시 넣습니다. (company_service.insert_with_unique_code)
+        """
         characters = string.ascii_uppercase + string.digits
-        while True:
-            code = ''.join(secrets.choice(characters) for _ in range(length))
-            # 중복 체크
-            if not Company.query.filter_by(code=code).first():
-                return code
+        return ''.join(secrets.choice(characters) for _ in range(length))
     
     def get_member_count(self) -> int:
         """회사 멤버 수"""
@@ -49,14 +50,15 @@ class Company(db.Model):
         """팀 수"""
         return self.teams.count()
     
-    def to_dict(self) -> dict:
+    def to_dict(self, member_count: int = None, team_count: int = None) -> dict:
+        """딕셔너리 변환 (목록에서는 CompanyService로 한 번에 센 값을 넘겨 COUNT 쿼리 생략)"""
         return {
             'id': self.id,
             'name': self.name,
             'code': self.code,
             'description': self.description,
-            'member_count': self.get_member_count(),
-            'team_count': self.get_team_count(),
+            'member_count': self.get_member_count() if member_count is None else member_count,
+            'team_count': self.get_team_count() if team_count is None else team_count,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
     
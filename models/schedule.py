@@ -3,7 +3,9 @@
 # 위치: C:\Users\user\Desktop\인공지능산업협회AI\models\schedule.py
 # ============================================
 
-from datetime import datetime, date, time
+from datetime import datetime, date, time, timedelta
+from typing import Dict
+from sqlalchemy import case
 from models import db
 
 
@@ -11,6 +13,10 @@ class Schedule(db.Model):
     """일정 모델"""
     
     __tablename__ = 'schedules'
+    __table_args__ = (
+        # 증분 동기화 (/api/schedules/changes) 키셋 조회용
+        db.Index('ix_schedules_user_id_updated_at', 'user_id', 'updated_at', 'id'),
+    )
     
     # 일정 유형 상수
     TYPE_DEADLINE = 'deadline'      # 마감일
@@ -19,6 +25,32 @@ class Schedule(db.Model):
     TYPE_SUBMIT = 'submit'          # 제출
     TYPE_OTHER = 'other'            # 기타
     
+    # 일정 유형 표시 이름
+    TYPE_LABELS = {
+        TYPE_DEADLINE: '마감',
+        TYPE_SUBMIT: '제출',
+        TYPE_TRIP: '출장',
+        TYPE_MEETING: '회의',
+        TYPE_OTHER: '기타'
+    }
+    
+    # 긴급도별 색상
+    URGENCY_COLORS = {
+        'completed': '#6c757d',  # 회색
+        'overdue': '#dc3545',    # 빨강
+        'urgent': '#dc3545',     # 빨강
+        'soon': '#fd7e14',       # 주황
+        'warning': '#ffc107',    # 노랑
+        'normal': '#28a745',     # 초록
+        'relaxed': '#adb5bd'     # 연회색
+    }
+    
+    # 긴급도 구간 (남은 일수 상한, 레벨) - urgency_for와 SQL 식이 같은 기준 사용
+    URGENCY_BUCKETS = [(2, 'urgent'), (5, 'soon'), (7, 'warning'), (14, 'normal')]
+    
+    # 급한 순 정렬 순서
+    URGENCY_ORDER = ['overdue', 'urgent', 'soon', 'warning', 'normal', 'relaxed', 'completed']
+    
     # 컬럼 정의
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
@@ -42,9 +74,19 @@ class Schedule(db.Model):
     is_completed = db.Column(db.Boolean, default=False)  # 완료 여부
     is_ai_generated = db.Column(db.Boolean, default=False)  # AI 생성 여부
     
+    # 반복 일정 (RRULE 일부 지원, 예: FREQ=WEEKLY;BYDAY=MO,WE;UNTIL=20261231)
+    recurrence_rule = db.Column(db.String(200), nullable=True)
+    recurrence_until = db.Column(db.Date, nullable=True, index=True)  # 마지막 발생일 (무기한이면 NULL)
+    
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # 반복 일정의 다음 회차 마감일 (DB 컬럼 아님 - 목록 조회 시 채우며, 있으면 남은 일수/긴급도 기준)
+    next_due_date = None
+    
+    # 관계 설정
+    exceptions = db.relationship('ScheduleException', backref='schedule', lazy='dynamic', cascade='all, delete-orphan')
+    
     def __init__(
         self,
         user_id: int,
@@ -60,7 +102,9 @@ class Schedule(db.Model):
         schedule_type: str = None,
         tags: str = None,
         memo: str = None,
-        is_ai_generated: bool = False
+        is_ai_generated: bool = False,
+        recurrence_rule: str = None,
+        recurrence_until: date = None
     ):
         self.user_id = user_id
         self.title = title
@@ -76,48 +120,83 @@ class Schedule(db.Model):
         self.tags = tags
         self.memo = memo
         self.is_ai_generated = is_ai_generated
+        self.recurrence_rule = recurrence_rule
+        self.recurrence_until = recurrence_until
+    
+    @property
+    def is_recurring(self) -> bool:
+        """반복 일정 여부"""
+        return bool(self.recurrence_rule)
     
     @property
     def days_left(self) -> int:
         """남은 일수 계산 (D-day)"""
-        if self.due_date is None:
+        return self.days_left_on(date.today())
+    
+    def days_left_on(self, today: date) -> int:
+        """기준일 대비 남은 일수 (여러 건 직렬화 시 today를 한 번만 계산해 전달)"""
+        due_date = self.next_due_date or self.due_date
+        if due_date is None:
             return 999
-        today = date.today()
-        delta = self.due_date - today
-        return delta.days
+        return (due_date - today).days
+    
+    @classmethod
+    def urgency_for(cls, days_left: int, is_completed: bool) -> str:
+        """남은 일수와 완료 여부로 긴급도 레벨 계산"""
+        if is_completed:
+            return 'completed'
+        if days_left < 0:
+            return 'overdue'  # 지연
+        for limit, level in cls.URGENCY_BUCKETS:
+            if days_left <= limit:
+                return level  # 긴급(빨강) / 임박(주황) / 주의(노랑) / 여유(초록)
+        return 'relaxed'  # 먼 일정 (회색)
+    
+    @classmethod
+    def effective_due_expr(cls, next_due: Dict[int, date] = None):
+        """
+        긴급도/정렬 기준 마감일 SQL 식
+
+        반복 일정은 첫 회차 마감일(due_date)이 아니라 next_due({일정 ID: 다음 회차 마감일})의 값을 사용
+        """
+        if not next_due:
+            return cls.due_date
+        return case(next_due, value=cls.id, else_=cls.due_date)
+    
+    @classmethod
+    def urgency_level_expr(cls, today: date, next_due: Dict[int, date] = None):
+        """긴급도 레벨 SQL 식 (기준일 경계 날짜와 비교하므로 DB별 날짜 연산 불필요)"""
+        due_date = cls.effective_due_expr(next_due)
+        return case(
+            (cls.is_completed == True, 'completed'),
+            (due_date < today, 'overdue'),
+            *[(due_date <= today + timedelta(days=limit), level) for limit, level in cls.URGENCY_BUCKETS],
+            else_='relaxed'
+        )
+    
+    @classmethod
+    def urgency_rank_expr(cls, today: date, next_due: Dict[int, date] = None):
+        """급한 순 정렬용 SQL 식 (URGENCY_ORDER 인덱스)"""
+        due_date = cls.effective_due_expr(next_due)
+        return case(
+            (cls.is_completed == True, cls.URGENCY_ORDER.index('completed')),
+            (due_date < today, cls.URGENCY_ORDER.index('overdue')),
+            *[
+                (due_date <= today + timedelta(days=limit), cls.URGENCY_ORDER.index(level))
+                for limit, level in cls.URGENCY_BUCKETS
+            ],
+            else_=cls.URGENCY_ORDER.index('relaxed')
+        )
     
     @property
     def urgency_level(self) -> str:
         """긴급도 레벨 반환"""
-        days = self.days_left
-        if self.is_completed:
-            return 'completed'
-        elif days < 0:
-            return 'overdue'  # 지연
-        elif days <= 2:
-            return 'urgent'   # 긴급 (빨강)
-        elif days <= 5:
-            return 'soon'     # 임박 (주황)
-        elif days <= 7:
-            return 'warning'  # 주의 (노랑)
-        elif days <= 14:
-            return 'normal'   # 여유 (초록)
-        else:
-            return 'relaxed'  # 먼 일정 (회색)
+        return self.urgency_for(self.days_left, self.is_completed)
     
     @property
     def urgency_color(self) -> str:
         """긴급도에 따른 색상 반환"""
-        color_map = {
-            'completed': '#6c757d',  # 회색
-            'overdue': '#dc3545',    # 빨강
-            'urgent': '#dc3545',     # 빨강
-            'soon': '#fd7e14',       # 주황
-            'warning': '#ffc107',    # 노랑
-            'normal': '#28a745',     # 초록
-            'relaxed': '#adb5bd'     # 연회색
-        }
-        return color_map.get(self.urgency_level, '#6c757d')
+        return self.URGENCY_COLORS.get(self.urgency_level, '#6c757d')
     
     def get_display_time(self) -> str:
         """시간 표시용 문자열"""
@@ -129,8 +208,15 @@ class Schedule(db.Model):
             return self.start_time.strftime('%H:%M')
         return ""
     
-    def to_dict(self) -> dict:
-        """딕셔너리 변환"""
+    def to_dict(self, today: date = None) -> dict:
+        """
+        딕셔너리 변환
+        
+        Args:
+            today: 남은 일수 기준일 (여러 건 변환 시 한 번 계산해 전달, 기본: 오늘)
+        """
+        days_left = self.days_left_on(today or date.today())
+        urgency_level = self.urgency_for(days_left, self.is_completed)
         return {
             'id': self.id,
             'user_id': self.user_id,
@@ -149,15 +235,20 @@ class Schedule(db.Model):
             'memo': self.memo,
             'is_completed': self.is_completed,
             'is_ai_generated': self.is_ai_generated,
-            'days_left': self.days_left,
-            'urgency_level': self.urgency_level,
-            'urgency_color': self.urgency_color,
+            'recurrence_rule': self.recurrence_rule,
+            'recurrence_until': self.recurrence_until.isoformat() if self.recurrence_until else None,
+            'days_left': days_left,
+            'urgency_level': urgency_level,
+            'urgency_color': self.URGENCY_COLORS[urgency_level],
             'created_at': self.created_at.isoformat() if self.created_at else None,
+            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
             'document_filename': self.document.filename if self.document else None
         }
     
-    def to_calendar_event(self) -> dict:
-        """캘린더 이벤트 형식으로 변환 (FullCalendar 호환)"""
+    def to_calendar_event(self, today: date = None) -> dict:
+        """캘린더 이벤트 형식으로 변환 (FullCalendar 호환, today는 to_dict와 동일)"""
+        days_left = self.days_left_on(today or date.today())
+        
         # 시작 시간 결합
         if self.start_date and self.start_time and not self.is_all_day:
             start = datetime.combine(self.start_date, self.start_time).isoformat()
@@ -181,13 +272,13 @@ class Schedule(db.Model):
             'start': start,
             'end': end,
             'allDay': self.is_all_day,
-            'color': self.urgency_color,
+            'color': self.URGENCY_COLORS[self.urgency_for(days_left, self.is_completed)],
             'extendedProps': {
                 'task_description': self.task_description,
                 'schedule_type': self.schedule_type,
                 'is_completed': self.is_completed,
                 'document_filename': self.document.filename if self.document else None,
-                'days_left': self.days_left,
+                'days_left': days_left,
                 'start_time': self.start_time.strftime('%H:%M') if self.start_time else None,
                 'end_time': self.end_time.strftime('%H:%M') if self.end_time else None
             }
@@ -0,0 +1,68 @@
+# ============================================
+# 업무 일정 관리 시스템 - 반복 일정 예외 모델
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\models\schedule_exception.py
+# ============================================
+
+from datetime import datetime, date, time
+from models import db
+
+
+class ScheduleException(db.Model):
+    """반복 일정의 특정 회차 예외 (취소 또는 변경)"""
+    
+    __tablename__ = 'schedule_exceptions'
+    __table_args__ = (
+        db.UniqueConstraint('schedule_id', 'occurrence_date', name='uq_schedule_exception_occurrence'),
+    )
+    
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    schedule_id = db.Column(db.Integer, db.ForeignKey('schedules.id'), nullable=False, index=True)
+    occurrence_date = db.Column(db.Date, nullable=False)  # 원래 회차 시작일
+    
+    is_cancelled = db.Column(db.Boolean, default=False)  # 해당 회차 취소
+    
+    # 변경 내용 (NULL이면 반복 일정 값 사용)
+    override_date = db.Column(db.Date, nullable=True)  # 옮긴 시작일
+    title = db.Column(db.String(200), nullable=True)
+    start_time = db.Column(db.Time, nullable=True)
+    end_time = db.Column(db.Time, nullable=True)
+    is_completed = db.Column(db.Boolean, nullable=True)
+    
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    
+    def __init__(
+        self,
+        schedule_id: int,
+        occurrence_date: date,
+        is_cancelled: bool = False,
+        override_date: date = None,
+        title: str = None,
+        start_time: time = None,
+        end_time: time = None,
+        is_completed: bool = None
+    ):
+        self.schedule_id = schedule_id
+        self.occurrence_date = occurrence_date
+        self.is_cancelled = is_cancelled
+        self.override_date = override_date
+        self.title = title
+        self.start_time = start_time
+        self.end_time = end_time
+        self.is_completed = is_completed
+    
+    def to_dict(self) -> dict:
+        """딕셔너리 변환"""
+        return {
+            'id': self.id,
+            'schedule_id': self.schedule_id,
+            'occurrence_date': self.occurrence_date.isoformat(),
+            'is_cancelled': self.is_cancelled,
+            'override_date': self.override_date.isoformat() if self.override_date else None,
+            'title': self.title,
+            'start_time': self.start_time.strftime('%H:%M') if self.start_time else None,
+            'end_time': self.end_time.strftime('%H:%M') if self.end_time else None,
+            'is_completed': self.is_completed
+        }
+    
+    def __repr__(self) -> str:
+        return f'<ScheduleException {self.schedule_id} ({self.occurrence_date})>'
@@ -0,0 +1,36 @@
+# ============================================
+# 업무 일정 관리 시스템 - 삭제된 일정 기록 모델
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\models\schedule_tombstone.py
+# ============================================
+
+from datetime import datetime
+from models import db
+
+
+class ScheduleTombstone(db.Model):
+    """
+    삭제된 일정 기록 (증분 동기화용)
+
+    일정은 바로 삭제되므로 /api/schedules/changes가 삭제 사실을 알려줄 수 있도록
+    삭제 시점에 ID만 남겨 둡니다. 보관 기간이 지나면 정리합니다. (SyncService 참고)
+    """
+
+    __tablename__ = 'schedule_tombstones'
+    __table_args__ = (
+        db.Index('ix_schedule_tombstones_user_id_id', 'user_id', 'id'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    schedule_id = db.Column(db.Integer, nullable=False)  # 삭제된 일정 ID (FK 아님)
+    user_id = db.Column(db.Integer, nullable=False)
+    deleted_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
+    def to_dict(self) -> dict:
+        """딕셔너리 변환"""
+        return {
+            'id': self.schedule_id,
+            'deleted_at': self.deleted_at.isoformat() if self.deleted_at else None
+        }
+
+    def __repr__(self) -> str:
+        return f'<ScheduleTombstone {self.schedule_id}>'
@@ -0,0 +1,62 @@
+# ============================================
+# 업무 일정 관리 시스템 - 태그 모델
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\models\tag.py
+# ============================================
+
+from models import db
+
+
+# 일정-태그 연결 (기본키 (schedule_id, tag_id), 태그 → 일정 조회용 역방향 인덱스)
+schedule_tags = db.Table(
+    'schedule_tags',
+    db.Column('schedule_id', db.Integer, db.ForeignKey('schedules.id'), primary_key=True),
+    db.Column('tag_id', db.Integer, db.ForeignKey('tags.id'), primary_key=True),
+    db.Index('ix_schedule_tags_tag_id_schedule_id', 'tag_id', 'schedule_id'),
+)
+
+
+class Tag(db.Model):
+    """
+    사용자별 태그
+
+    Schedule.tags(쉼표 구분 문자열)는 표시/내보내기용으로 그대로 두고,
+    태그 필터와 자동완성은 이 테이블과 schedule_tags 연결로 처리합니다.
+    usage_count는 일정 저장 시 증감합니다. (TagService 참고)
+    """
+
+    __tablename__ = 'tags'
+    __table_args__ = (
+        db.UniqueConstraint('user_id', 'name', name='uq_tags_user_id_name'),
+    )
+
+    id = db.Column(db.Integer, primary_key=True, autoincrement=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    name = db.Column(db.String(50), nullable=False)
+    usage_count = db.Column(db.Integer, nullable=False, default=0)  # 이 태그가 붙은 일정 수
+
+    # 태그 이름 최대 길이
+    MAX_LENGTH = 50
+
+    @classmethod
+    def parse_names(cls, value: str) -> list:
+        """
+        쉼표 구분 태그 문자열 → 태그 이름 목록 (순서 유지, 중복 제거)
+
+        앞의 '#'과 앞뒤 공백은 떼고, 가운데 공백은 하나로 합칩니다. ('#업무' == '업무')
+        """
+        names = []
+        for raw in (value or '').split(','):
+            name = ' '.join(raw.strip().lstrip('#').split())[:cls.MAX_LENGTH]
+            if name and name not in names:
+                names.append(name)
+        return names
+
+    def to_dict(self) -> dict:
+        """딕셔너리 변환"""
+        return {
+            'name': self.name,
+            'count': self.usage_count
+        }
+
+    def __repr__(self) -> str:
+        return f'<Tag {self.name} ({self.usage_count})>'
@@ -34,19 +34,21 @@ class Team(db.Model):
     
     @staticmethod
     def generate_code(length: int = 6) -> str:
-        """랜덤 팀 코드 생성"""
+        """
+        랜덤 팀 코드 생성
+
+        중복 여부는 조회하지 않고 code 유니크 인덱스에 맡깁니다.
+        저장 시 충돌하면 새 코드로 다시 넣습니다. (company_service.insert_with_unique_code)
+        """
         characters = string.ascii_uppercase + string.digits
-        while True:
-            code = ''.join(secrets.choice(characters) for _ in range(length))
-            # 중복 체크
-            if not Team.query.filter_by(code=code).first():
-                return code
+        return ''.join(secrets.choice(characters) for _ in range(length))
     
     def get_member_count(self) -> int:
         """팀 멤버 수"""
         return self.members.count()
     
-    def to_dict(self) -> dict:
+    def to_dict(self, member_count: int = None) -> dict:
+        """딕셔너리 변환 (목록에서는 CompanyService.team_member_counts 값을 넘겨 COUNT 쿼리 생략)"""
         return {
             'id': self.id,
             'company_id': self.company_id,
@@ -55,7 +57,7 @@ class Team(db.Model):
             'code': self.code,
             'description': self.description,
             'leader_id': self.leader_id,
-            'member_count': self.get_member_count(),
+            'member_count': self.get_member_count() if member_count is None else member_count,
             'created_at': self.created_at.isoformat() if self.created_at else None
         }
     
@@ -0,0 +1,32 @@
+# ============================================
+# 업무 일정 관리 시스템 - 다가오는 일정 요약 모델
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\models\upcoming_digest.py
+# ============================================
+
+import json
+from datetime import datetime, date
+from models import db
+
+
+class UpcomingDigest(db.Model):
+    """
+    사용자별 다가오는 미완료 일정 요약 (팀원 일정 패널용)
+
+    items에 가까운 일정 몇 건을 JSON으로 저장해 두고, 일정이 바뀌면 커밋 때 다시 계산합니다.
+    digest_date가 오늘이 아니면 마감일 기준이 달라졌으므로 조회 때 다시 계산하고 쓰기 큐에서 저장합니다. (DigestService 참고)
+    """
+
+    __tablename__ = 'upcoming_digests'
+
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    items = db.Column(db.Text, nullable=True)  # [{'title', 'due_date'}] JSON (NULL이면 재계산 필요)
+    digest_date = db.Column(db.Date, nullable=True)  # 계산 기준일
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __init__(self, user_id: int, items: list = None, digest_date: date = None):
+        self.user_id = user_id
+        self.digest_date = digest_date
+        self.items = json.dumps(items, ensure_ascii=False) if items is not None else None
+
+    def __repr__(self) -> str:
+        return f'<UpcomingDigest {self.user_id} ({self.digest_date})>'
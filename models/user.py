@@ -5,14 +5,18 @@
 
 from datetime import datetime
 from flask_login import UserMixin
-from flask_bcrypt import generate_password_hash, check_password_hash
 from models import db
+from services.password_hasher import password_hasher
 
 
 class User(UserMixin, db.Model):
     """사용자 모델"""
     
     __tablename__ = 'users'
+    __table_args__ = (
+        # 회사 멤버 목록 (이름 순 키셋 페이지) 조회용
+        db.Index('ix_users_company_id_username', 'company_id', 'username'),
+    )
     
     # 권한 상수
     ROLE_MEMBER = 'member'          # 일반 직원
@@ -54,16 +58,20 @@ class User(UserMixin, db.Model):
         self.department = department
     
     def set_password(self, password: str) -> None:
-        """비밀번호 해시화 저장"""
+        """비밀번호 해시화 저장 (해시 작업 풀에서 설정된 비용으로 계산)"""
         if password is None or len(password) < 4:
             raise ValueError("비밀번호는 4자 이상이어야 합니다.")
-        self.password_hash = generate_password_hash(password).decode('utf-8')
+        self.password_hash = password_hasher.hash(password)
     
     def check_password(self, password: str) -> bool:
         """비밀번호 검증"""
         if password is None or self.password_hash is None:
             return False
-        return check_password_hash(self.password_hash, password)
+        return password_hasher.verify(self.password_hash, password)
+    
+    def password_needs_rehash(self) -> bool:
+        """저장된 해시의 비용이 현재 설정(BCRYPT_LOG_ROUNDS)과 다른지"""
+        return password_hasher.needs_rehash(self.password_hash)
     
     def is_admin(self) -> bool:
         """회사 관리자인지 확인"""
@@ -11,20 +11,147 @@ from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional, Any
 from dateutil import parser as date_parser
 
+from services.metrics import traced
+
+
+# ============================================
+# AI 응답 스키마 검증
+# ============================================
+
+# ISO 날짜 (YYYY-MM-DD) 빠른 경로 - dateutil 호출 없이 date.fromisoformat 사용
+_ISO_DATE_RE = re.compile(r'^\s*(\d{4})-(\d{2})-(\d{2})')
+
+# 마크다운 코드 블록 (```json ... ```)
+_CODE_FENCE_RE = re.compile(r'^```(?:json)?\s*|\s*```$', re.IGNORECASE)
+
+# 유형 정규화 매핑
+_TYPE_MAPPING = {
+    '마감': 'deadline', '기한': 'deadline', 'deadline': 'deadline',
+    '회의': 'meeting', '미팅': 'meeting', 'meeting': 'meeting',
+    '출장': 'trip', '방문': 'trip', 'trip': 'trip',
+    '제출': 'submit', '보고': 'submit', 'submit': 'submit',
+}
+
+# JSON 모드 응답 스키마 (프롬프트에 그대로 포함)
+_RESPONSE_SCHEMA = (
+    '{"schedules": [{"title": string, "date": "YYYY-MM-DD", '
+    '"type": "deadline|meeting|trip|submit|other", "description": string}]}'
+)
+
+
+# JSON 모드 요청 횟수 (모델이 JSON을 잘못 생성했을 때 재시도 포함)
+JSON_MODE_ATTEMPTS = 2
+
+
+def _error_status(error: Exception) -> Optional[int]:
+    return getattr(error, 'status_code', None)
+
+
+def _is_json_generation_failure(error: Exception) -> bool:
+    """모델이 JSON 모드에서 유효하지 않은 JSON을 생성함 (Groq json_validate_failed)"""
+    return 'json_validate_failed' in str(error)
+
+
+def _is_response_format_unsupported(error: Exception) -> bool:
+    """백엔드가 response_format 파라미터 자체를 지원하지 않음 (400 + 파라미터명 언급)"""
+    return (
+        _error_status(error) == 400
+        and 'response_format' in str(error)
+        and not _is_json_generation_failure(error)
+    )
+
+
+class ScheduleItemValidator:
+    """
+    AI 응답 아이템 검증기
+    
+    필드 별칭을 한 번만 컴파일해 두고 아이템마다 재사용합니다.
+    """
+    
+    FIELD_ALIASES = {
+        'date': ('date', '날짜', 'due_date'),
+        'title': ('title', '제목', 'task'),
+        'description': ('description', '설명', 'task_description'),
+        'type': ('type', '유형', 'schedule_type'),
+    }
+    
+    def __init__(self):
+        self._aliases = tuple(self.FIELD_ALIASES.items())
+    
+    def normalize(self, item: Any) -> Optional[Dict[str, Any]]:
+        """
+        아이템을 표준 필드(date/title/description/type)로 정규화
+        
+        Returns:
+            정규화된 dict (날짜가 없거나 형식이 잘못되면 None)
+        """
+        if not isinstance(item, dict):
+            return None
+        
+        fields = {}
+        for field, aliases in self._aliases:
+            value = None
+            for alias in aliases:
+                value = item.get(alias)
+                if value:
+                    break
+            fields[field] = value
+        
+        parsed_date = self.parse_date(fields['date'])
+        if parsed_date is None:
+            return None
+        fields['date'] = parsed_date
+        
+        for field in ('title', 'description'):
+            if fields[field] is not None and not isinstance(fields[field], str):
+                fields[field] = str(fields[field])
+        
+        schedule_type = fields['type']
+        fields['type'] = _TYPE_MAPPING.get(str(schedule_type).lower(), 'other') if schedule_type else 'other'
+        
+        return fields
+    
+    @staticmethod
+    def parse_date(value: Any) -> Optional[date]:
+        """날짜 파싱 (ISO 형식은 빠른 경로, 그 외에만 dateutil 사용)"""
+        if not isinstance(value, str) or not value.strip():
+            return None
+        
+        match = _ISO_DATE_RE.match(value)
+        if match:
+            try:
+                return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+            except ValueError:
+                return None
+        
+        try:
+            return date_parser.parse(value).date()
+        except (ValueError, OverflowError):
+            return None
+
 
 class AIScheduleExtractor:
     """AI를 활용한 일정 추출 서비스 (Groq API)"""
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, reference_date: Optional[date] = None):
         """
         AI 추출기 초기화
         
         Args:
             api_key: Groq API 키 (기본: 환경변수 GROQ_API_KEY)
+            reference_date: '오늘'로 사용할 날짜 (기본: 실제 오늘, 녹화 응답 재생 시 녹화일로 고정)
         """
         self.api_key = api_key or os.environ.get("GROQ_API_KEY")
+        self.reference_date = reference_date
         self.client = None
         self._api_ready = False
+        # JSON 모드 지원 여부 (백엔드가 거부하면 False로 전환)
+        self._json_mode = True
+        self._validator = ScheduleItemValidator()
+    
+    def today(self) -> date:
+        """기준 날짜 (프롬프트의 오늘 날짜, 과거 일정 제외, 연도 없는 날짜 보정에 사용)"""
+        return self.reference_date or date.today()
     
     def load_model(self) -> bool:
         """Groq API 연결 확인"""
@@ -91,6 +218,7 @@ class AIScheduleExtractor:
         
         return schedules
     
+    @traced('extract_ai')
     def _extract_by_ai(self, text: str) -> List[Dict[str, Any]]:
         """Groq API를 사용한 AI 기반 일정 추출"""
         if not self._api_ready or self.client is None:
@@ -101,7 +229,7 @@ class AIScheduleExtractor:
         if len(text) > max_length:
             text = text[:max_length] + "\n...(이하 생략)"
         
-        today = date.today().strftime("%Y-%m-%d")
+        today = self.today().strftime("%Y-%m-%d")
         
         prompt = f"""당신은 문서에서 일정 정보를 추출하는 전문가입니다.
 오늘 날짜: {today}
@@ -114,127 +242,166 @@ class AIScheduleExtractor:
 3. 과거 날짜는 제외
 4. 각 일정마다 title, date, type(deadline/meeting/trip/submit/other), description 포함
 
+출력 형식 (JSON 객체):
+{_RESPONSE_SCHEMA}
+
 문서 내용:
 ---
 {text}
 ---
 
-JSON 배열만 출력하세요 (다른 설명 없이):"""
+JSON 객체만 출력하세요 (다른 설명 없이):"""
 
         try:
-            completion = self.client.chat.completions.create(
-                model="qwen/qwen3-32b",
-                messages=[
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_completion_tokens=2048,
-                top_p=0.95,
-                stream=False
-            )
-            
-            response_text = completion.choices[0].message.content
+            response_text = self._request_completion(prompt)
             return self._parse_ai_response(response_text)
             
         except Exception as e:
             print(f"⚠️ Groq API 호출 오류: {str(e)}")
             return []
     
+    def _request_completion(self, prompt: str) -> str:
+        """
+        Groq API 호출
+        
+        JSON 모드(response_format)를 우선 요청합니다.
+        - 백엔드가 response_format 자체를 거부(400)하면 이후 호출부터 일반 모드를 사용
+        - 모델이 JSON을 잘못 생성한 경우(json_validate_failed)는 일시적 실패이므로
+          JSON 모드로 다시 시도하고, 그래도 실패하면 이번 호출만 일반 모드로 요청
+        """
+        params = dict(
+            model="qwen/qwen3-32b",
+            messages=[
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3,
+            max_completion_tokens=2048,
+            top_p=0.95,
+            stream=False
+        )
+        
+        if self._json_mode:
+            for attempt in range(1, JSON_MODE_ATTEMPTS + 1):
+                try:
+                    completion = self.client.chat.completions.create(
+                        response_format={"type": "json_object"},
+                        **params
+                    )
+                    return completion.choices[0].message.content
+                except Exception as e:
+                    if _is_response_format_unsupported(e):
+                        print(f"⚠️ JSON 모드 미지원, 일반 모드로 전환: {str(e)}")
+                        self._json_mode = False
+                        break
+                    if not _is_json_generation_failure(e):
+                        raise
+                    print(f"⚠️ JSON 생성 실패 ({attempt}/{JSON_MODE_ATTEMPTS}): {str(e)}")
+        
+        completion = self.client.chat.completions.create(**params)
+        return completion.choices[0].message.content
+    
     def _parse_ai_response(self, response: str) -> List[Dict[str, Any]]:
         """AI 응답 파싱"""
-        schedules = []
-        
         if not response:
             return []
         
-        # JSON 배열 찾기
-        # 마크다운 코드 블록 제거
-        response = re.sub(r'```json\s*', '', response)
-        response = re.sub(r'```\s*', '', response)
+        data = self._load_json(response)
+        if data is None:
+            return []
+        
+        if isinstance(data, list):
+            items = data
+        elif isinstance(data, dict) and 'schedules' in data:
+            items = data['schedules']
+        elif isinstance(data, dict):
+            items = [data]
+        else:
+            return []
+        
+        if not isinstance(items, list):
+            return []
+        
+        schedules = []
+        for item in items:
+            schedule = self._convert_ai_item(item)
+            if schedule:
+                schedules.append(schedule)
+        
+        return schedules
+    
+    @staticmethod
+    def _load_json(response: str) -> Any:
+        """
+        응답 문자열에서 JSON 값 추출
+        
+        JSON 모드 응답은 바로 json.loads로 처리되고, 일반 모드 응답
+        (코드 블록, 앞뒤 설명문 포함)은 첫 '[' 또는 '{' 위치부터 raw_decode로 디코딩합니다.
+        """
         response = response.strip()
         
         try:
-            # JSON 배열 파싱
-            data = json.loads(response)
-            
-            if isinstance(data, list):
-                items = data
-            elif isinstance(data, dict) and 'schedules' in data:
-                items = data['schedules']
-            elif isinstance(data, dict):
-                items = [data]
-            else:
-                return []
-            
-            for item in items:
-                schedule = self._convert_ai_item(item)
-                if schedule:
-                    schedules.append(schedule)
-                    
+            return json.loads(response)
         except json.JSONDecodeError:
-            # JSON 파싱 실패시 개별 객체 찾기
-            json_matches = re.findall(r'\{[^{}]+\}', response)
-            for match in json_matches:
-                try:
-                    item = json.loads(match)
-                    schedule = self._convert_ai_item(item)
-                    if schedule:
-                        schedules.append(schedule)
-                except:
-                    continue
+            pass
         
-        return schedules
+        # 마크다운 코드 블록 제거
+        if response.startswith('```'):
+            response = _CODE_FENCE_RE.sub('', response)
+        
+        decoder = json.JSONDecoder()
+        starts = [i for i in (response.find('['), response.find('{')) if i != -1]
+        if not starts:
+            return None
+        
+        start = min(starts)
+        try:
+            data, _ = decoder.raw_decode(response, start)
+            return data
+        except json.JSONDecodeError:
+            pass
+        
+        # 잘린 배열 등: 완전한 객체들만 순서대로 수집
+        items = []
+        start = response.find('{')
+        while start != -1:
+            try:
+                item, end = decoder.raw_decode(response, start)
+                items.append(item)
+                start = response.find('{', end)
+            except json.JSONDecodeError:
+                start = response.find('{', start + 1)
+        
+        return items or None
     
     def _convert_ai_item(self, item: dict) -> Optional[Dict[str, Any]]:
         """AI 응답 아이템을 일정 형식으로 변환"""
-        try:
-            # 날짜 추출
-            date_str = item.get('date') or item.get('날짜') or item.get('due_date')
-            if not date_str:
-                return None
-            
-            # 날짜 파싱
-            try:
-                if isinstance(date_str, str):
-                    parsed_date = date_parser.parse(date_str).date()
-                else:
-                    return None
-            except:
-                return None
-            
-            # 과거 날짜 제외
-            if parsed_date < date.today():
-                return None
-            
-            # 제목/설명 추출
-            title = item.get('title') or item.get('제목') or item.get('task') or ""
-            description = item.get('description') or item.get('설명') or item.get('task_description') or title
-            schedule_type = item.get('type') or item.get('유형') or item.get('schedule_type') or 'other'
-            
-            # 유형 정규화
-            type_mapping = {
-                '마감': 'deadline', '기한': 'deadline', 'deadline': 'deadline',
-                '회의': 'meeting', '미팅': 'meeting', 'meeting': 'meeting',
-                '출장': 'trip', '방문': 'trip', 'trip': 'trip',
-                '제출': 'submit', '보고': 'submit', 'submit': 'submit',
-            }
-            schedule_type = type_mapping.get(str(schedule_type).lower(), 'other') if schedule_type else 'other'
-            
-            if not title:
-                title = description[:50] if description else "일정"
-            
-            return {
-                'title': self._generate_title(title, schedule_type),
-                'task_description': description,
-                'due_date': parsed_date,
-                'schedule_type': schedule_type,
-                'is_ai_generated': True
-            }
-            
-        except Exception as e:
-            print(f"⚠️ 아이템 변환 오류: {str(e)}")
+        fields = self._validator.normalize(item)
+        if fields is None:
             return None
+        
+        parsed_date = fields['date']
+        
+        # 과거 날짜 제외
+        if parsed_date < self.today():
+            return None
+        
+        # 제목/설명 추출
+        title = fields['title'] or ""
+        description = fields['description'] or title
+        schedule_type = fields['type']
+        
+        if not title:
+            title = description[:50] if description else "일정"
+        
+        return {
+            'title': self._generate_title(title, schedule_type),
+            'task_description': description,
+            'due_date': parsed_date,
+            'schedule_type': schedule_type,
+            'is_ai_generated': True
+        }
     
+    @traced('extract_rules')
     def _extract_by_rules(self, text: str) -> List[Dict[str, Any]]:
         """규칙 기반 일정 추출"""
         schedules = []
@@ -274,7 +441,8 @@ JSON 배열만 출력하세요 (다른 설명 없이):"""
         # 텍스트를 문장 단위로 분리
         sentences = re.split(r'[.\n]', text)
         
-        current_year = datetime.now().year
+        today = self.today()
+        current_year = today.year
         
         for sentence in sentences:
             sentence = sentence.strip()
@@ -307,7 +475,7 @@ JSON 배열만 출력하세요 (다른 설명 없이):"""
                         if 1 <= month <= 12 and 1 <= day <= 31:
                             found_date = date(year, month, day)
                             # 과거 날짜면 다음 해로
-                            if found_date < date.today():
+                            if found_date < today:
                                 found_date = date(year + 1, month, day)
                             break
                     except ValueError:
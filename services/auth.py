@@ -6,6 +6,8 @@
 from typing import Optional, Tuple
 from models import db
 from models.user import User
+from services.password_hasher import PasswordHasherBusy, password_hasher
+from services.rate_limit import login_ip_limiter, login_user_limiter
 
 
 class AuthService:
@@ -67,17 +69,38 @@ class AuthService:
             return False, f"회원가입 중 오류가 발생했습니다: {str(e)}", None
     
     @staticmethod
-    def authenticate_user(username_or_email: str, password: str) -> Tuple[bool, str, Optional[User]]:
+    def authenticate_user(username_or_email: str, password: str,
+                          client_ip: str = None) -> Tuple[bool, str, Optional[User]]:
         """
         사용자 로그인 인증
         
+        IP별, 사용자명별 실패 횟수를 제한하고, 제한에 걸리면 해시 계산 없이 거절합니다.
+        동시 요청이 모두 확인을 통과하지 않도록 해시 검증 전에 시도를 먼저 기록(try_acquire)하고,
+        실패가 아닌 결과(로그인 성공, 해시 작업 대기 초과)면 되돌립니다.
+        (IP 제한도 실패만 세므로 같은 IP(NAT, 프록시) 뒤의 여러 사용자가 정상 로그인으로 막히지 않음)
+        저장된 해시의 비용이 현재 설정과 다르면 로그인 성공 시 새 비용으로 다시 저장합니다.
+        
+        Args:
+            client_ip: 요청 IP (프록시 뒤라면 PROXY_FIX_HOPS 설정 필요, 없으면 IP 제한 생략)
+        
         Returns:
             Tuple[성공여부, 메시지, User객체]
         """
         if not username_or_email or not password:
             return False, "사용자명/이메일과 비밀번호를 입력해주세요.", None
         
-        # 사용자 조회 (사용자명 또는 이메일로)
+        user_key = username_or_email.lower()
+        acquired = []
+        for limiter, key in ((login_ip_limiter, client_ip), (login_user_limiter, user_key)):
+            if key is None:
+                continue
+            allowed, retry_after = limiter.try_acquire(key)
+            if not allowed:
+                AuthService._release(acquired)
+                return False, f"로그인 시도가 너무 많습니다. {retry_after}초 후 다시 시도해주세요.", None
+            acquired.append((limiter, key))
+        
+        # 사용자 조회 (사용자명 또는 이메일로) - 없거나 비밀번호가 틀리면 기록한 시도가 실패로 남음
         user = User.query.filter(
             (User.username == username_or_email) | (User.email == username_or_email)
         ).first()
@@ -85,11 +108,33 @@ class AuthService:
         if user is None:
             return False, "등록되지 않은 사용자입니다.", None
         
-        if not user.check_password(password):
-            return False, "비밀번호가 일치하지 않습니다.", None
+        try:
+            if not user.check_password(password):
+                return False, "비밀번호가 일치하지 않습니다.", None
+        except PasswordHasherBusy as e:
+            AuthService._release(acquired)
+            return False, str(e), None
+        
+        if client_ip is not None:
+            login_ip_limiter.release(client_ip)
+        login_user_limiter.reset(user_key)
+        
+        if user.password_needs_rehash():
+            # 비용 설정이 바뀐 뒤 첫 로그인 - 실패해도 로그인은 진행 (다음 로그인 때 다시 시도)
+            try:
+                user.password_hash = password_hasher.hash(password)
+                db.session.commit()
+            except (PasswordHasherBusy, ValueError):
+                db.session.rollback()
         
         return True, "로그인 성공", user
     
+    @staticmethod
+    def _release(acquired) -> None:
+        """실패로 세지 않을 시도 기록 취소"""
+        for limiter, key in acquired:
+            limiter.release(key)
+    
     @staticmethod
     def get_user_by_id(user_id: int) -> Optional[User]:
         """ID로 사용자 조회"""
@@ -0,0 +1,252 @@
+# ============================================
+# 업무 일정 관리 시스템 - 팀 일정 충돌/빈 시간 서비스
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\availability.py
+# ============================================
+#
+# 팀원 전체 일정을 기간 단위로 한 번에 읽어 시간 구간(Interval)으로 바꾼 뒤,
+# 시작 시각 순으로 정렬한 구간 트리(IntervalIndex)에서 겹침/빈 시간을 계산합니다.
+# 팀원 수 × 일정 수만큼 쿼리하지 않고, 구간 n개에 대해 정렬 O(n log n) + 질의 O(log n + k)
+
+from datetime import date, datetime, time, timedelta
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import or_
+
+from models.schedule import Schedule
+from services import recurrence
+from services.schedule_service import ScheduleService
+
+# 종료 시간이 없는 시간 지정 일정의 기본 길이
+DEFAULT_DURATION = timedelta(hours=1)
+
+
+class Interval(NamedTuple):
+    """일정(또는 반복 회차) 1건의 시간 구간 [start, end)"""
+    start: datetime
+    end: datetime
+    schedule_id: int
+    user_id: int
+    title: str
+    is_all_day: bool
+    occurrence_date: Optional[date] = None
+
+    def to_dict(self) -> dict:
+        return {
+            'schedule_id': self.schedule_id,
+            'user_id': self.user_id,
+            'title': self.title,
+            'start': self.start.isoformat(),
+            'end': self.end.isoformat(),
+            'is_all_day': self.is_all_day,
+            'occurrence_date': self.occurrence_date.isoformat() if self.occurrence_date else None,
+        }
+
+
+def _interval(schedule, start_date: date, end_date: date, start_time: Optional[time],
+              end_time: Optional[time], title: str, occurrence_date: date = None) -> Interval:
+    """날짜/시간 → 구간 (종일 일정은 시작일 0시 ~ 종료일 다음 날 0시)"""
+    if schedule.is_all_day or start_time is None:
+        start = datetime.combine(start_date, time())
+        end = datetime.combine(end_date + timedelta(days=1), time())
+        all_day = True
+    else:
+        start = datetime.combine(start_date, start_time)
+        end = datetime.combine(end_date, end_time) if end_time else start + DEFAULT_DURATION
+        if end <= start:
+            end = start + DEFAULT_DURATION
+        all_day = False
+    return Interval(start, end, schedule.id, schedule.user_id, title, all_day, occurrence_date)
+
+
+def schedule_intervals(schedule, window_start: date, window_end: date,
+                       exceptions: Iterable = ()) -> List[Interval]:
+    """일정 1건 → 기간 안의 구간 목록 (반복 일정은 회차별로 펼침)"""
+    if not schedule.is_recurring:
+        start_date = schedule.start_date or schedule.due_date
+        return [_interval(schedule, start_date, max(schedule.due_date, start_date),
+                          schedule.start_time, schedule.end_time, schedule.title)]
+
+    try:
+        occurrences = list(recurrence.iter_occurrences(schedule, window_start, window_end, exceptions))
+    except recurrence.RecurrenceError:
+        return []
+    return [
+        _interval(schedule, occ.start_date, occ.end_date, occ.start_time, occ.end_time,
+                  occ.title, occ.occurrence_date)
+        for occ in occurrences if not occ.is_completed
+    ]
+
+
+def load_intervals(user_ids: List[int], window_start: date, window_end: date,
+                   include_completed: bool = False) -> List[Interval]:
+    """
+    사용자들의 기간 내 일정을 구간 목록으로 로딩
+
+    일정은 쿼리 1회 (반복 일정이 있으면 회차 예외 쿼리 1회 추가)
+    """
+    if not user_ids:
+        return []
+
+    single, recurring = ScheduleService.window_conditions(window_start, window_end)
+    query = Schedule.query.filter(Schedule.user_id.in_(user_ids), or_(single, recurring))
+    if not include_completed:
+        query = query.filter(Schedule.is_completed == False)
+    schedules = query.all()
+
+    exceptions = ScheduleService.exceptions_for(schedules)
+    intervals = []
+    for schedule in schedules:
+        intervals.extend(schedule_intervals(schedule, window_start, window_end, exceptions.get(schedule.id, ())))
+    return intervals
+
+
+class IntervalIndex:
+    """
+    정적 구간 트리
+
+    구간을 시작 시각 순으로 정렬한 배열을 암묵적 균형 이진 트리(가운데 원소가 루트)로 보고,
+    각 노드에 서브트리의 최대 종료 시각을 저장합니다. 겹침 질의는 O(log n + k)
+    """
+
+    def __init__(self, intervals: Iterable[Interval]):
+        self._items: List[Interval] = sorted(intervals, key=lambda item: (item.start, item.end))
+        self._max_end: List[Optional[datetime]] = [None] * len(self._items)
+        self._build(0, len(self._items))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _build(self, lo: int, hi: int) -> Optional[datetime]:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        max_end = self._items[mid].end
+        for child in (self._build(lo, mid), self._build(mid + 1, hi)):
+            if child is not None and child > max_end:
+                max_end = child
+        self._max_end[mid] = max_end
+        return max_end
+
+    def overlapping(self, start: datetime, end: datetime) -> List[Interval]:
+        """[start, end)와 겹치는 구간 목록 (시작 시각 순)"""
+        result: List[Interval] = []
+        self._search(0, len(self._items), start, end, result)
+        return result
+
+    def _search(self, lo: int, hi: int, start: datetime, end: datetime, result: List[Interval]) -> None:
+        if lo >= hi:
+            return
+        mid = (lo + hi) // 2
+        if self._max_end[mid] <= start:
+            return  # 서브트리 전체가 질의 시작 전에 끝남
+        self._search(lo, mid, start, end, result)
+        item = self._items[mid]
+        if item.start >= end:
+            return  # 오른쪽 서브트리는 모두 질의 종료 이후에 시작
+        if item.end > start:
+            result.append(item)
+        self._search(mid + 1, hi, start, end, result)
+
+    def merged(self) -> List[Tuple[datetime, datetime]]:
+        """겹치거나 맞닿은 구간을 합친 바쁜 시간 목록 (정렬된 배열 1회 순회)"""
+        busy: List[List[datetime]] = []
+        for item in self._items:
+            if busy and item.start <= busy[-1][1]:
+                if item.end > busy[-1][1]:
+                    busy[-1][1] = item.end
+            else:
+                busy.append([item.start, item.end])
+        return [(start, end) for start, end in busy]
+
+
+class AvailabilityService:
+    """팀 일정 충돌/공통 빈 시간 서비스"""
+
+    @staticmethod
+    def free_slots(user_ids: List[int], window_start: date, window_end: date,
+                   duration: timedelta = timedelta(hours=1),
+                   day_start: time = time(9, 0), day_end: time = time(18, 0),
+                   include_weekends: bool = False, include_all_day: bool = False,
+                   limit: int = 50) -> List[dict]:
+        """
+        모든 사용자가 비어 있는 시간대 목록
+
+        Args:
+            user_ids: 대상 사용자 ID
+            window_start, window_end: 조회 기간 (양 끝 포함)
+            duration: 최소 길이
+            day_start, day_end: 하루 중 찾을 시간대 (근무 시간)
+            include_weekends: 주말 포함 여부
+            include_all_day: 종일 일정(마감일 등)도 바쁜 시간으로 볼지 여부
+            limit: 최대 반환 수
+
+        Returns:
+            [{'start', 'end', 'minutes'}] (시간 순)
+        """
+        intervals = load_intervals(user_ids, window_start, window_end)
+        if not include_all_day:
+            intervals = [item for item in intervals if not item.is_all_day]
+        busy = IntervalIndex(intervals).merged()
+
+        slots = []
+        cursor = 0  # busy는 정렬되어 있으므로 날짜가 지나도 앞으로만 이동
+        day = window_start
+        while day <= window_end and len(slots) < limit:
+            if include_weekends or day.weekday() < 5:
+                free_from = datetime.combine(day, day_start)
+                day_close = datetime.combine(day, day_end)
+
+                while cursor < len(busy) and busy[cursor][1] <= free_from:
+                    cursor += 1
+
+                index = cursor
+                while free_from < day_close and len(slots) < limit:
+                    next_busy = busy[index] if index < len(busy) else None
+                    free_until = min(next_busy[0], day_close) if next_busy else day_close
+                    if free_until - free_from >= duration:
+                        slots.append({
+                            'start': free_from.isoformat(),
+                            'end': free_until.isoformat(),
+                            'minutes': int((free_until - free_from).total_seconds() // 60),
+                        })
+                    if next_busy is None or next_busy[0] >= day_close:
+                        break
+                    free_from = max(free_from, next_busy[1])
+                    index += 1
+            day += timedelta(days=1)
+
+        return slots
+
+    @staticmethod
+    def conflicts(schedule: Schedule, user_ids: List[int], window_start: date, window_end: date,
+                  include_all_day: bool = False) -> List[dict]:
+        """
+        일정(반복이면 기간 안의 각 회차)과 겹치는 다른 일정 목록
+
+        Args:
+            schedule: 기준 일정
+            user_ids: 비교할 사용자 ID (본인 포함 가능)
+            include_all_day: 종일 일정과의 겹침도 포함할지 여부 (기준 일정이 종일이면 항상 비교)
+
+        Returns:
+            [{'occurrence': 기준 구간, 'conflicts': [겹치는 구간, ...]}]
+        """
+        exceptions = ScheduleService.exceptions_for([schedule]).get(schedule.id, ())
+        targets = schedule_intervals(schedule, window_start, window_end, exceptions)
+
+        compare_all_day = include_all_day or schedule.is_all_day
+        others = [
+            item for item in load_intervals(user_ids, window_start, window_end)
+            if item.schedule_id != schedule.id and (compare_all_day or not item.is_all_day)
+        ]
+        index = IntervalIndex(others)
+
+        result = []
+        for target in targets:
+            overlaps = index.overlapping(target.start, target.end)
+            if overlaps:
+                result.append({
+                    'occurrence': target.to_dict(),
+                    'conflicts': [item.to_dict() for item in overlaps],
+                })
+        return result
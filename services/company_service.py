@@ -3,11 +3,43 @@
 # 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\company_service.py
 # ============================================
 
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
+
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
+
 from models import db
 from models.company import Company
 from models.team import Team
 from models.user import User
+from services.user_cache import user_cache
+
+
+# 코드 충돌 시 재시도 횟수 (8자리/6자리 영숫자라 실제 충돌은 드묾)
+CODE_ATTEMPTS = 5
+
+
+def insert_with_unique_code(obj) -> None:
+    """
+    코드가 있는 객체(Company, Team) INSERT
+    
+    코드 중복을 미리 조회하지 않고 SAVEPOINT 안에서 바로 넣은 뒤,
+    code 유니크 인덱스에 걸리면 그 SAVEPOINT만 되돌리고 새 코드로 다시 넣습니다.
+    동시에 같은 코드를 만든 경우도 DB가 한쪽만 받아 주므로 안전합니다.
+    
+    Raises:
+        IntegrityError: 코드 외의 제약 위반, 또는 CODE_ATTEMPTS번 모두 충돌
+    """
+    for attempt in range(CODE_ATTEMPTS):
+        try:
+            with db.session.begin_nested():
+                db.session.add(obj)
+            return
+        except IntegrityError as e:
+            if attempt == CODE_ATTEMPTS - 1 or 'code' not in str(e.orig).lower():
+                raise
+            obj.code = obj.generate_code()
 
 
 class CompanyService:
@@ -41,14 +73,14 @@ class CompanyService:
                 description=description,
                 admin_id=admin_user.id
             )
-            db.session.add(company)
-            db.session.flush()  # ID 생성
+            insert_with_unique_code(company)  # ID 생성
             
             # 사용자를 관리자로 설정
             admin_user.company_id = company.id
             admin_user.role = User.ROLE_ADMIN
             
             db.session.commit()
+            user_cache.invalidate(admin_user.id)
             
             return True, f"회사가 생성되었습니다. 회사코드: {company.code}", company
             
@@ -83,6 +115,7 @@ class CompanyService:
             user.company_id = company.id
             user.role = User.ROLE_MEMBER
             db.session.commit()
+            user_cache.invalidate(user.id)
             
             return True, f"{company.name}에 가입되었습니다.", company
             
@@ -102,10 +135,58 @@ class CompanyService:
         """회사 멤버 목록"""
         return User.query.filter_by(company_id=company_id).order_by(User.username).all()
     
+    @staticmethod
+    def get_company_members_page(company_id: int, after: str = None, limit: int = 50,
+                                 team_id: int = None) -> Tuple[List[User], bool]:
+        """
+        회사 멤버 1페이지 (사용자명 순, 소속 팀 함께 로딩 - 쿼리 1회)
+        
+        Args:
+            company_id: 회사 ID
+            after: 이전 페이지 마지막 사용자명 (없으면 첫 페이지)
+            limit: 페이지 크기
+            team_id: 이 팀 멤버만
+            
+        Returns:
+            Tuple[멤버 목록, 다음 페이지 여부]
+        """
+        query = (
+            User.query
+            .options(joinedload(User.team))
+            .filter(User.company_id == company_id)
+        )
+        if team_id is not None:
+            query = query.filter(User.team_id == team_id)
+        if after:
+            query = query.filter(User.username > after)
+        members = query.order_by(User.username).limit(limit + 1).all()
+        return members[:limit], len(members) > limit
+    
     @staticmethod
     def get_company_teams(company_id: int) -> List[Team]:
-        """회사 팀 목록"""
-        return Team.query.filter_by(company_id=company_id).order_by(Team.name).all()
+        """회사 팀 목록 (회사 함께 로딩)"""
+        return (
+            Team.query
+            .options(joinedload(Team.company))
+            .filter_by(company_id=company_id)
+            .order_by(Team.name)
+            .all()
+        )
+    
+    @staticmethod
+    def team_member_counts(company_id: int) -> Dict[Optional[int], int]:
+        """
+        회사의 팀별 멤버 수 (GROUP BY team_id 쿼리 1회)
+        
+        Returns:
+            {team_id: 멤버 수} - 팀 미배정 멤버는 None 키, 합계가 전체 멤버 수
+        """
+        rows = (
+            db.session.query(User.team_id, func.count(User.id))
+            .filter(User.company_id == company_id)
+            .group_by(User.team_id)
+        )
+        return {team_id: count for team_id, count in rows}
 
 
 class TeamService:
@@ -141,8 +222,7 @@ class TeamService:
                 description=description,
                 leader_id=leader_user.id if leader_user else None
             )
-            db.session.add(team)
-            db.session.flush()
+            insert_with_unique_code(team)
             
             # 팀장 설정
             if leader_user:
@@ -150,6 +230,8 @@ class TeamService:
                 leader_user.role = User.ROLE_TEAM_LEADER
             
             db.session.commit()
+            if leader_user:
+                user_cache.invalidate(leader_user.id)
             
             return True, f"팀이 생성되었습니다. 팀코드: {team.code}", team
             
@@ -190,6 +272,7 @@ class TeamService:
             if user.role == User.ROLE_MEMBER:
                 user.role = User.ROLE_MEMBER
             db.session.commit()
+            user_cache.invalidate(user.id)
             
             return True, f"{team.name}팀에 가입되었습니다.", team
             
@@ -221,6 +304,7 @@ class TeamService:
             if user.role == User.ROLE_TEAM_LEADER:
                 user.role = User.ROLE_MEMBER
             db.session.commit()
+            user_cache.invalidate(user.id)
             
             return True, f"{team_name}에서 탈퇴했습니다."
             
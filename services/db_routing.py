@@ -0,0 +1,108 @@
+# ============================================
+# 업무 일정 관리 시스템 - DB 연결 풀 설정 / 읽기 복제본 라우팅
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\db_routing.py
+# ============================================
+#
+# DATABASE_URL(주 DB)과 DATABASE_REPLICA_URL(읽기 복제본, 선택)의 엔진 옵션을 설정값으로 만듭니다.
+# - 연결 풀: pool_size / max_overflow / pool_timeout / pool_recycle / pool_pre_ping (워커 프로세스마다 따로 생성)
+# - PostgreSQL: statement_timeout을 연결 옵션으로 지정
+# - SQLite 메모리 DB는 Flask-SQLAlchemy가 StaticPool을 쓰므로 풀 크기 옵션을 넣지 않음
+#
+# @read_replica를 붙인 읽기 전용 화면/API는 SELECT를 복제본으로 보냅니다. (models.RoutingSession)
+# 복제 지연으로 방금 저장한 내용이 안 보이지 않도록, 쓰기가 있었던 사용자는
+# DATABASE_REPLICA_STICKY_SECONDS 동안 주 DB에서 읽습니다. (Flask 세션에 기한 저장)
+# 복제본을 설정하지 않으면 모든 쿼리가 주 DB로 갑니다.
+
+import time
+from functools import wraps
+from typing import Any, Dict
+
+from flask import Flask, g, has_request_context, session
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
+
+from models import db, READ_REPLICA_KEY, REPLICA_BIND
+
+# Flask 세션 키 - 이 시각(epoch 초)까지는 주 DB에서 읽음
+PRIMARY_UNTIL_KEY = '_db_primary_until'
+
+_sticky_seconds = 5.0
+_replica_enabled = False
+
+
+def engine_options(uri: str, config: Dict[str, Any]) -> Dict[str, Any]:
+    """URI 종류에 맞는 엔진 옵션 (설정값 기준)"""
+    url = make_url(uri)
+    backend = url.get_backend_name()
+    options: Dict[str, Any] = {'pool_pre_ping': config['DB_POOL_PRE_PING']}
+
+    if not (backend == 'sqlite' and url.database in (None, '', ':memory:')):
+        options.update(
+            pool_size=config['DB_POOL_SIZE'],
+            max_overflow=config['DB_MAX_OVERFLOW'],
+            pool_timeout=config['DB_POOL_TIMEOUT'],
+            pool_recycle=config['DB_POOL_RECYCLE'],
+        )
+
+    if backend == 'postgresql' and config['DB_STATEMENT_TIMEOUT_MS'] > 0:
+        options['connect_args'] = {'options': f"-c statement_timeout={config['DB_STATEMENT_TIMEOUT_MS']}"}
+
+    return options
+
+
+def init_db_routing(app: Flask) -> None:
+    """
+    엔진 옵션/복제본 bind 설정과 요청 훅 등록 (create_app에서 init_db보다 먼저 호출)
+
+    이미 SQLALCHEMY_ENGINE_OPTIONS / SQLALCHEMY_BINDS를 직접 지정했다면 그 값을 우선합니다.
+    """
+    global _sticky_seconds, _replica_enabled
+
+    app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', {})
+    if not app.config['SQLALCHEMY_ENGINE_OPTIONS']:
+        app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(app.config['SQLALCHEMY_DATABASE_URI'], app.config)
+
+    replica_url = app.config.get('DATABASE_REPLICA_URL')
+    binds = dict(app.config.get('SQLALCHEMY_BINDS') or {})
+    if replica_url and REPLICA_BIND not in binds:
+        binds[REPLICA_BIND] = {'url': replica_url, **engine_options(replica_url, app.config)}
+    app.config['SQLALCHEMY_BINDS'] = binds
+
+    _replica_enabled = REPLICA_BIND in binds
+    _sticky_seconds = app.config['DATABASE_REPLICA_STICKY_SECONDS']
+
+    if _replica_enabled:
+        if not event.contains(db.session, 'after_flush', _after_flush):
+            event.listen(db.session, 'after_flush', _after_flush)
+            event.listen(db.session, 'do_orm_execute', _do_orm_execute)
+        app.after_request(_remember_write)
+
+
+def read_replica(view):
+    """읽기 전용 라우트 데코레이터 - 이 요청의 SELECT를 복제본으로 (최근에 쓴 사용자는 주 DB)"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if _replica_enabled and session.get(PRIMARY_UNTIL_KEY, 0) <= time.time():
+            db.session.info[READ_REPLICA_KEY] = True
+        return view(*args, **kwargs)
+    return wrapper
+
+
+def _mark_write() -> None:
+    if has_request_context():
+        g.db_wrote = True
+
+
+def _after_flush(session_, flush_context) -> None:
+    _mark_write()
+
+
+def _do_orm_execute(orm_execute_state) -> None:
+    if not orm_execute_state.is_select:
+        _mark_write()
+
+
+def _remember_write(response):
+    if g.get('db_wrote') and _sticky_seconds > 0:
+        session[PRIMARY_UNTIL_KEY] = time.time() + _sticky_seconds
+    return response
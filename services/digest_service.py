@@ -0,0 +1,251 @@
+# ============================================
+# 업무 일정 관리 시스템 - 팀원 다가오는 일정 요약 서비스
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\digest_service.py
+# ============================================
+#
+# 팀원 일정 패널은 주기적으로 조회되므로 팀원마다 일정을 조회하지 않고
+# upcoming_digests에 사용자별 요약을 저장해 둡니다.
+# - 조회: 팀원 + 요약을 JOIN 쿼리 1회로 읽음 (읽기 전용 - 복제본에서도 동작)
+# - 일정 추가/수정/완료/삭제: 커밋 직전에 같은 트랜잭션에서 해당 사용자 요약만 다시 계산
+# - 날짜가 바뀌어(digest_date != 오늘) 오래된 요약은 조회 때 계산해 돌려주고,
+#   저장은 쓰기 큐 스레드에 맡김 (사용자별로 하루 한 번만 다시 계산 - 조회 요청은 쓰지 않음)
+#   `flask refresh-digests`는 자정 직후 전체를 미리 갱신하고 싶을 때 사용
+
+import json
+import threading
+from concurrent.futures import Future
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import event, func, or_, select
+from sqlalchemy.exc import IntegrityError
+
+from models import db
+from models.schedule import Schedule
+from models.schedule_exception import ScheduleException
+from models.upcoming_digest import UpcomingDigest
+from models.user import User
+from services import recurrence
+from services.feed_service import collect_schedule_changes
+from services.write_queue import write_queue
+
+# 사용자별 요약에 담을 일정 수
+DIGEST_SIZE = 5
+
+# 반복 일정의 다음 회차를 찾을 범위 (일)
+RECURRING_LOOKAHEAD_DAYS = 366
+
+# 쓰기 큐에 저장을 맡겨 둔 사용자 (같은 사용자를 여러 조회가 중복 예약하지 않도록)
+_refresh_lock = threading.Lock()
+_refresh_pending: set = set()
+
+
+class DigestService:
+    """팀원 다가오는 일정 요약 서비스"""
+
+    @staticmethod
+    def team_upcoming(scope_filter, exclude_user_id: int = None, today: date = None) -> Dict[str, List[dict]]:
+        """
+        범위(팀/회사/부서) 사용자들의 다가오는 미완료 일정
+
+        Args:
+            scope_filter: User 조건 (예: User.team_id == 3)
+            exclude_user_id: 제외할 사용자 (본인)
+            today: 기준일 (기본: 오늘)
+
+        Returns:
+            {username: [{'title', 'due_date'}, ...]} (일정이 있는 사용자만, 이름 순)
+        """
+        today = today or date.today()
+        query = (
+            db.session.query(User.id, User.username, UpcomingDigest.items, UpcomingDigest.digest_date)
+            .outerjoin(UpcomingDigest, UpcomingDigest.user_id == User.id)
+            .filter(scope_filter)
+            .order_by(User.username)
+        )
+        if exclude_user_id is not None:
+            query = query.filter(User.id != exclude_user_id)
+        rows = query.all()
+
+        stale_ids = [row.id for row in rows if row.items is None or row.digest_date != today]
+        refreshed = DigestService.compute(stale_ids, today) if stale_ids else {}
+        if stale_ids:
+            DigestService.schedule_refresh(stale_ids, today)
+
+        result = {}
+        for row in rows:
+            items = refreshed[row.id] if row.id in refreshed else json.loads(row.items)
+            if items:
+                result[row.username] = items
+        return result
+
+    @staticmethod
+    def compute(user_ids: Iterable[int], today: date = None) -> Dict[int, List[dict]]:
+        """
+        사용자들의 요약 계산 (저장하지 않음)
+
+        단일 일정은 사용자별 상위 N건을 윈도 함수 쿼리 1회로,
+        반복 일정은 후보를 한 번에 읽어 다음 회차를 계산합니다.
+
+        Returns:
+            {user_id: [{'title', 'due_date'}, ...]}
+        """
+        today = today or date.today()
+        upcoming: Dict[int, List[tuple]] = {user_id: [] for user_id in user_ids}
+
+        ranked = (
+            select(
+                Schedule.user_id, Schedule.id, Schedule.title, Schedule.due_date,
+                func.row_number().over(
+                    partition_by=Schedule.user_id,
+                    order_by=(Schedule.due_date.asc(), Schedule.id.asc())
+                ).label('rank')
+            )
+            .where(
+                Schedule.user_id.in_(user_ids),
+                Schedule.is_completed == False,
+                Schedule.due_date >= today,
+                Schedule.recurrence_rule.is_(None)
+            )
+            .subquery()
+        )
+        for row in db.session.execute(select(ranked).where(ranked.c.rank <= DIGEST_SIZE)):
+            upcoming[row.user_id].append((row.due_date, row.id, row.title))
+
+        recurring = Schedule.query.filter(
+            Schedule.user_id.in_(user_ids),
+            Schedule.is_completed == False,
+            Schedule.recurrence_rule.isnot(None),
+            or_(Schedule.recurrence_until.is_(None), Schedule.recurrence_until >= today - timedelta(days=RECURRING_LOOKAHEAD_DAYS))
+        ).all()
+        if recurring:
+            exceptions: Dict[int, list] = {}
+            for exc in ScheduleException.query.filter(
+                ScheduleException.schedule_id.in_([schedule.id for schedule in recurring])
+            ):
+                exceptions.setdefault(exc.schedule_id, []).append(exc)
+
+            window_end = today + timedelta(days=RECURRING_LOOKAHEAD_DAYS)
+            for schedule in recurring:
+                try:
+                    occurrences = recurrence.iter_occurrences(
+                        schedule, today, window_end, exceptions.get(schedule.id, ())
+                    )
+                    count = 0
+                    for occ in occurrences:
+                        if occ.is_completed or occ.end_date < today:
+                            continue
+                        upcoming[schedule.user_id].append((occ.end_date, schedule.id, occ.title))
+                        count += 1
+                        if count >= DIGEST_SIZE:
+                            break
+                except recurrence.RecurrenceError:
+                    continue
+
+        return {
+            user_id: [
+                {'title': title, 'due_date': due_date.isoformat()}
+                for due_date, _, title in sorted(items)[:DIGEST_SIZE]
+            ]
+            for user_id, items in upcoming.items()
+        }
+
+    @staticmethod
+    def rebuild(user_ids: Iterable[int], today: date = None) -> Dict[int, List[dict]]:
+        """
+        사용자들의 요약을 다시 계산해 현재 트랜잭션에 저장 (커밋은 호출자가)
+
+        Returns:
+            {user_id: [{'title', 'due_date'}, ...]}
+        """
+        today = today or date.today()
+        user_ids = sorted({uid for uid in user_ids if uid is not None})
+        if not user_ids:
+            return {}
+        digests = DigestService.compute(user_ids, today)
+
+        existing = {
+            digest.user_id: digest
+            for digest in UpcomingDigest.query.filter(UpcomingDigest.user_id.in_(user_ids))
+        }
+        for user_id, items in digests.items():
+            digest = existing.get(user_id)
+            if digest is not None:
+                digest.items = json.dumps(items, ensure_ascii=False)
+                digest.digest_date = today
+                continue
+            try:
+                with db.session.begin_nested():
+                    db.session.add(UpcomingDigest(user_id=user_id, items=items, digest_date=today))
+            except IntegrityError:
+                # 동시에 다른 트랜잭션이 같은 사용자 요약을 만든 경우 - 그쪽 결과를 사용
+                continue
+        return digests
+
+    @staticmethod
+    def schedule_refresh(user_ids: Iterable[int], today: date = None) -> Optional[Future]:
+        """
+        오래된 요약 저장을 쓰기 큐 스레드에 예약 (이미 예약된 사용자는 제외)
+
+        Returns:
+            예약한 작업 (예약할 사용자가 없거나 큐가 차 있으면 None)
+        """
+        with _refresh_lock:
+            user_ids = sorted(set(user_ids) - _refresh_pending)
+            _refresh_pending.update(user_ids)
+        if not user_ids:
+            return None
+        future = write_queue.submit(_refresh_job, user_ids, today or date.today())
+        if future is None:
+            _release_refresh(user_ids)
+        return future
+
+    @staticmethod
+    def mark_changed(session, user_ids: Iterable[int]) -> None:
+        """flush 이벤트를 거치지 않는 변경(일괄 INSERT 등)의 사용자를 커밋 때 다시 계산하도록 등록"""
+        session.info.setdefault('digest_refresh', set()).update(user_ids)
+
+
+def _refresh_job(user_ids: List[int], today: date) -> None:
+    """쓰기 큐 작업: 요약 다시 계산 후 커밋"""
+    try:
+        DigestService.rebuild(user_ids, today)
+        db.session.commit()
+    finally:
+        _release_refresh(user_ids)
+
+
+def _release_refresh(user_ids: Iterable[int]) -> None:
+    with _refresh_lock:
+        _refresh_pending.difference_update(user_ids)
+
+
+def init_digest_refresh() -> None:
+    """세션 이벤트 등록 (create_app에서 한 번 호출)"""
+    if event.contains(db.session, 'before_flush', _before_flush):
+        return
+    event.listen(db.session, 'before_flush', _before_flush)
+    event.listen(db.session, 'before_commit', _before_commit)
+    event.listen(db.session, 'after_soft_rollback', _after_soft_rollback)
+
+
+def _before_flush(session, flush_context, instances) -> None:
+    user_ids, _ = collect_schedule_changes(session)
+    if user_ids:
+        DigestService.mark_changed(session, user_ids)
+
+
+def _before_commit(session) -> None:
+    # SAVEPOINT 커밋은 건너뛰고 바깥 트랜잭션 커밋 때 한 번만 계산
+    if session.in_nested_transaction():
+        return
+    session.flush()
+    user_ids = session.info.pop('digest_refresh', None)
+    if user_ids:
+        DigestService.rebuild(user_ids)
+
+
+def _after_soft_rollback(session, previous_transaction) -> None:
+    # SAVEPOINT나 그 안의 flush 롤백은 바깥 트랜잭션의 변경을 되돌리지 않음
+    if previous_transaction.parent is None:
+        session.info.pop('digest_refresh', None)
@@ -6,6 +6,8 @@
 import os
 from typing import Optional, Tuple
 
+from services.metrics import span
+
 
 class DocumentParser:
     """문서 파싱 서비스 - HWP, DOCX, PDF, Excel 지원"""
@@ -33,19 +35,20 @@ class DocumentParser:
             return False, f"지원하지 않는 파일 형식입니다: {ext}", None
         
         try:
-            # 확장자별 파싱
-            if ext in ('hwp', 'hwpx'):
-                return cls._parse_hwp(filepath)
-            elif ext in ('docx', 'doc'):
-                return cls._parse_docx(filepath)
-            elif ext == 'pdf':
-                return cls._parse_pdf(filepath)
-            elif ext in ('xlsx', 'xls'):
-                return cls._parse_excel(filepath)
-            elif ext == 'csv':
-                return cls._parse_csv(filepath)
-            else:
-                return False, "알 수 없는 파일 형식입니다.", None
+            # 확장자별 파싱 (형식별 소요 시간 기록)
+            with span('parse', format=ext):
+                if ext in ('hwp', 'hwpx'):
+                    return cls._parse_hwp(filepath)
+                elif ext in ('docx', 'doc'):
+                    return cls._parse_docx(filepath)
+                elif ext == 'pdf':
+                    return cls._parse_pdf(filepath)
+                elif ext in ('xlsx', 'xls'):
+                    return cls._parse_excel(filepath)
+                elif ext == 'csv':
+                    return cls._parse_csv(filepath)
+                else:
+                    return False, "알 수 없는 파일 형식입니다.", None
                 
         except Exception as e:
             return False, f"파일 파싱 중 오류 발생: {str(e)}", None
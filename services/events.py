@@ -0,0 +1,238 @@
+# ============================================
+# 업무 일정 관리 시스템 - 일정 변경 실시간 알림 (Server-Sent Events)
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\events.py
+# ============================================
+#
+# 대시보드가 /api/schedules, /api/team-schedules를 다시 받아오지 않도록
+# 일정이 바뀌면 변경분(delta)만 소유자와 같은 팀 구독자에게 보냅니다.
+# - 채널: user:<id>, team:<id>, company:<id>, dept:<부서명>
+# - 일정 변경은 flush 시점에 수집하고 커밋된 뒤에만 발행 (롤백되면 버림)
+# - 브로커는 프로세스 메모리에 있으므로 워커 프로세스 1개(스레드 여러 개) 구성을 전제로 합니다.
+
+import json
+import queue
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+
+from models import db
+from models.schedule import Schedule
+from models.user import User
+
+# 구독자별 대기 메시지 상한 (넘치면 해당 구독자에게 resync를 보내고 쌓인 메시지는 버림)
+MAX_PENDING_MESSAGES = 200
+
+
+class Subscription:
+    """SSE 연결 1개의 메시지 큐"""
+
+    def __init__(self, channels: Iterable[str]):
+        self.channels: Set[str] = set(channels)
+        self._queue: 'queue.Queue[Tuple[str, Dict[str, Any]]]' = queue.Queue(maxsize=MAX_PENDING_MESSAGES)
+        self._overflowed = False
+
+    def put(self, name: str, data: Dict[str, Any]) -> None:
+        try:
+            self._queue.put_nowait((name, data))
+        except queue.Full:
+            self._overflowed = True
+
+    def get(self, timeout: float) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """다음 메시지 (timeout 동안 없으면 None)"""
+        if self._overflowed:
+            self._overflowed = False
+            with self._queue.mutex:
+                self._queue.queue.clear()
+            return 'resync', {}
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class EventBroker:
+    """채널별 구독자 목록을 관리하는 프로세스 내 발행/구독 브로커"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._channels: Dict[str, Set[Subscription]] = {}
+
+    def subscribe(self, channels: Iterable[str]) -> Subscription:
+        subscription = Subscription(channels)
+        with self._lock:
+            for channel in subscription.channels:
+                self._channels.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            for channel in subscription.channels:
+                subscribers = self._channels.get(channel)
+                if subscribers is None:
+                    continue
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._channels[channel]
+
+    def publish(self, channel: str, name: str, data: Dict[str, Any]) -> int:
+        """
+        채널 구독자에게 메시지 전달
+
+        Returns:
+            전달한 구독자 수
+        """
+        with self._lock:
+            subscribers = list(self._channels.get(channel, ()))
+        for subscription in subscribers:
+            subscription.put(name, data)
+        return len(subscribers)
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len({sub for subs in self._channels.values() for sub in subs})
+
+
+# 전역 브로커
+broker = EventBroker()
+
+
+def user_channels(user) -> List[str]:
+    """사용자가 구독할 채널 목록 (본인 + 일정 공유 범위)"""
+    channels = [f'user:{user.id}']
+    scope = scope_channel(user)
+    if scope:
+        channels.append(scope)
+    return channels
+
+
+def scope_channel(user) -> Optional[str]:
+    """팀원 일정 패널과 같은 범위 (팀 > 회사 > 부서)"""
+    if user.team_id:
+        return f'team:{user.team_id}'
+    if user.company_id:
+        return f'company:{user.company_id}'
+    if user.department:
+        return f'dept:{user.department}'
+    return None
+
+
+def format_sse(name: str, data: Dict[str, Any]) -> str:
+    """SSE 프레임 문자열"""
+    return f"event: {name}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+def iter_stream(subscription: Subscription, heartbeat: float) -> Iterator[str]:
+    """
+    SSE 응답 본문 제너레이터
+
+    heartbeat초마다 주석 줄을 보내 프록시 연결 끊김을 막고, 끊긴 클라이언트를 감지합니다.
+    """
+    try:
+        yield 'retry: 5000\n' + format_sse('ready', {'channels': sorted(subscription.channels)})
+        while True:
+            message = subscription.get(timeout=heartbeat)
+            if message is None:
+                yield ': ping\n\n'
+                continue
+            yield format_sse(*message)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+# ============================================
+# 커밋 후 발행
+# ============================================
+
+def publish_after_commit(session, channel: str, name: str, data: Dict[str, Any]) -> None:
+    """현재 트랜잭션이 커밋되면 발행 (롤백되면 버림)"""
+    session.info.setdefault('pending_events', []).append((channel, name, data))
+
+
+def publish_bulk_created(session, user_id: int, ids: List[int]) -> None:
+    """일괄 INSERT(업로드, 가져오기)는 flush 이벤트를 거치지 않으므로 직접 예약"""
+    if not ids:
+        return
+    publish_after_commit(session, f'user:{user_id}', 'schedule', {'action': 'bulk_created', 'ids': ids})
+    scope, username = _scope_for(session, user_id)
+    if scope:
+        publish_after_commit(session, scope, 'team', {'usernames': [username]})
+
+
+def _schedule_delta(schedule: Schedule, action: str) -> Dict[str, Any]:
+    """캘린더에 바로 반영할 수 있는 변경분"""
+    data = {'action': action, 'id': schedule.id}
+    if schedule.is_recurring:
+        # 반복 일정은 회차 전개가 필요하므로 클라이언트가 보이는 기간만 다시 조회 (삭제도 모든 회차를 지워야 함)
+        data['recurring'] = True
+        return data
+    if action == 'deleted':
+        return data
+    data['event'] = schedule.to_calendar_event()
+    return data
+
+
+def _scope_for(session, user_id: int) -> Tuple[Optional[str], Optional[str]]:
+    """사용자 범위 채널과 이름 (대부분 요청 중 이미 로딩된 current_user라 쿼리 없음)"""
+    user = session.get(User, user_id)
+    if user is None:
+        return None, None
+    return scope_channel(user), user.username
+
+
+def _collect(session) -> None:
+    changes = []
+    for obj in session.new:
+        if isinstance(obj, Schedule):
+            changes.append((obj, 'created'))
+    for obj in session.dirty:
+        if isinstance(obj, Schedule) and session.is_modified(obj):
+            changes.append((obj, 'updated'))
+    for obj in session.deleted:
+        if isinstance(obj, Schedule):
+            changes.append((obj, 'deleted'))
+    if changes:
+        session.info.setdefault('flushed_schedules', []).extend(changes)
+
+
+def _before_flush(session, flush_context, instances) -> None:
+    _collect(session)
+
+
+def _after_flush(session, flush_context) -> None:
+    # flush 후 ID가 정해졌으므로 변경분 생성 (커밋 후에는 속성이 만료되어 쿼리가 필요)
+    changes = session.info.pop('flushed_schedules', None)
+    if not changes:
+        return
+    team_updates: Dict[str, Set[str]] = {}
+    for schedule, action in changes:
+        publish_after_commit(session, f'user:{schedule.user_id}', 'schedule', _schedule_delta(schedule, action))
+        scope, username = _scope_for(session, schedule.user_id)
+        if scope:
+            team_updates.setdefault(scope, set()).add(username)
+    for scope, usernames in team_updates.items():
+        publish_after_commit(session, scope, 'team', {'usernames': sorted(usernames)})
+
+
+def _after_commit(session) -> None:
+    pending = session.info.pop('pending_events', None)
+    for channel, name, data in pending or ():
+        broker.publish(channel, name, data)
+
+
+def _after_soft_rollback(session, previous_transaction) -> None:
+    # SAVEPOINT(고유 코드 재시도 등)나 그 안의 flush 롤백은 바깥 트랜잭션의 변경을 되돌리지 않음
+    if previous_transaction.parent is not None:
+        return
+    session.info.pop('pending_events', None)
+    session.info.pop('flushed_schedules', None)
+
+
+def init_event_publishing() -> None:
+    """세션 이벤트 등록 (create_app에서 한 번 호출)"""
+    if event.contains(db.session, 'before_flush', _before_flush):
+        return
+    event.listen(db.session, 'before_flush', _before_flush)
+    event.listen(db.session, 'after_flush', _after_flush)
+    event.listen(db.session, 'after_commit', _after_commit)
+    event.listen(db.session, 'after_soft_rollback', _after_soft_rollback)
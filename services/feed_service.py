@@ -0,0 +1,199 @@
+# ============================================
+# 업무 일정 관리 시스템 - 캘린더 구독(ICS) 피드 서비스
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\feed_service.py
+# ============================================
+#
+# 외부 캘린더(Outlook, Google)는 피드 URL을 몇 분마다 조회합니다.
+# 조회마다 전체 일정을 직렬화하지 않도록 ICS를 calendar_feeds.body에 저장해 두고,
+# 일정/팀 소속이 바뀔 때만 같은 트랜잭션에서 해당 피드를 무효화(body, etag = NULL)합니다.
+
+import hashlib
+from datetime import datetime
+from typing import Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect, or_, select, update
+from sqlalchemy.orm.attributes import set_committed_value
+
+from models import db
+from models.calendar_feed import CalendarFeed
+from models.schedule import Schedule
+from models.schedule_exception import ScheduleException
+from models.user import User
+from services import schedule_io
+from services.org_cache import org_cache
+
+
+class FeedService:
+    """ICS 구독 피드 서비스"""
+
+    @staticmethod
+    def get_or_create_feed(owner_type: str, owner_id: int) -> CalendarFeed:
+        """소유자의 피드 조회 (없으면 생성)"""
+        feed = CalendarFeed.query.filter_by(owner_type=owner_type, owner_id=owner_id).first()
+        if feed is None:
+            feed = CalendarFeed(owner_type=owner_type, owner_id=owner_id)
+            db.session.add(feed)
+            db.session.commit()
+        return feed
+
+    @staticmethod
+    def get_feed_by_token(token: str) -> Optional[CalendarFeed]:
+        """토큰으로 피드 조회 (body는 지연 로딩)"""
+        if not token:
+            return None
+        return CalendarFeed.query.filter_by(token=token).first()
+
+    @staticmethod
+    def rotate_token(feed: CalendarFeed) -> CalendarFeed:
+        """구독 토큰 재발급 (기존 URL은 더 이상 동작하지 않음)"""
+        feed.token = CalendarFeed.generate_token()
+        db.session.commit()
+        return feed
+
+    @staticmethod
+    def ensure_rendered(feed: CalendarFeed, uid_domain: str) -> CalendarFeed:
+        """
+        무효화된 피드만 다시 생성
+
+        Returns:
+            최신 etag/last_modified가 채워진 피드
+        """
+        # schedule_service가 이 모듈을 import하므로 함수 안에서 import
+        from services.schedule_service import ScheduleService
+
+        if not feed.is_stale:
+            return feed
+
+        user_ids, calendar_name = FeedService._feed_scope(feed)
+        schedules = (
+            Schedule.query
+            .filter(Schedule.user_id.in_(user_ids))
+            .order_by(Schedule.due_date.asc(), Schedule.id.asc())
+            .yield_per(500)
+        ) if user_ids else []
+
+        body = ''.join(schedule_io.iter_ics(
+            schedules, uid_domain, calendar_name, exceptions_for=ScheduleService.exceptions_for
+        ))
+
+        values = {
+            'body': body,
+            'etag': hashlib.sha1(body.encode('utf-8')).hexdigest(),
+            'last_modified': datetime.utcnow().replace(microsecond=0),
+        }
+        # 같은 피드를 동시에 생성한 다른 요청이 먼저 저장했으면 덮어쓰지 않음 (etag가 아직 NULL일 때만 저장)
+        result = db.session.execute(
+            update(CalendarFeed.__table__)
+            .where(CalendarFeed.__table__.c.id == feed.id)
+            .where(CalendarFeed.__table__.c.etag.is_(None))
+            .values(**values)
+        )
+        db.session.commit()
+        if result.rowcount:
+            for key, value in values.items():
+                set_committed_value(feed, key, value)
+            return feed
+
+        db.session.refresh(feed, ['body', 'etag', 'last_modified'])
+        if feed.is_stale:
+            # 저장 직후 다시 무효화됨 - 이번 응답은 방금 생성한 본문으로 (저장하지 않음)
+            for key, value in values.items():
+                set_committed_value(feed, key, value)
+        return feed
+
+    @staticmethod
+    def _feed_scope(feed: CalendarFeed) -> Tuple[List[int], str]:
+        """피드에 포함할 사용자 ID 목록과 캘린더 이름"""
+        if feed.owner_type == CalendarFeed.OWNER_TEAM:
+            org = org_cache.get()
+            team = org.team(feed.owner_id)
+            return list(org.team_member_ids(feed.owner_id)), f'{team.name} 팀 일정' if team else '팀 일정'
+
+        user = db.session.get(User, feed.owner_id)
+        return ([user.id], f'{user.username} 일정') if user else ([], '일정')
+
+    @staticmethod
+    def invalidate_for_users(user_ids: Iterable[int], team_ids: Iterable[int] = (), connection=None) -> None:
+        """
+        사용자 피드와 그 사용자들이 속한 팀 피드 무효화 (UPDATE 1회)
+
+        Args:
+            user_ids: 일정이 바뀐 사용자 ID
+            team_ids: 추가로 무효화할 팀 ID (팀 이동 시 이전 팀 등)
+            connection: flush 중 호출 시 사용할 연결 (기본: db.session)
+        """
+        user_ids = {uid for uid in user_ids if uid is not None}
+        team_ids = {tid for tid in team_ids if tid is not None}
+        if not user_ids and not team_ids:
+            return
+
+        conditions = []
+        if user_ids:
+            conditions.append((CalendarFeed.owner_type == CalendarFeed.OWNER_USER) & CalendarFeed.owner_id.in_(user_ids))
+            conditions.append(
+                (CalendarFeed.owner_type == CalendarFeed.OWNER_TEAM)
+                & CalendarFeed.owner_id.in_(select(User.team_id).where(User.id.in_(user_ids)))
+            )
+        if team_ids:
+            conditions.append((CalendarFeed.owner_type == CalendarFeed.OWNER_TEAM) & CalendarFeed.owner_id.in_(team_ids))
+
+        statement = (
+            update(CalendarFeed.__table__)
+            .where(or_(*conditions))
+            .where(CalendarFeed.__table__.c.etag.isnot(None))
+            .values(body=None, etag=None)
+        )
+        (connection or db.session).execute(statement)
+
+
+def collect_schedule_changes(session) -> Tuple[Set[int], Set[int]]:
+    """flush 대상에서 피드에 영향을 주는 사용자/팀 ID 수집 (회차 예외는 그 반복 일정의 소유자)"""
+    user_ids, team_ids = set(), set()
+
+    for obj in list(session.new) + list(session.deleted):
+        if isinstance(obj, Schedule):
+            user_ids.add(obj.user_id)
+        elif isinstance(obj, ScheduleException):
+            user_ids.add(_exception_owner(session, obj))
+
+    for obj in session.dirty:
+        if isinstance(obj, Schedule) and session.is_modified(obj):
+            user_ids.add(obj.user_id)
+        elif isinstance(obj, ScheduleException) and session.is_modified(obj):
+            user_ids.add(_exception_owner(session, obj))
+        elif isinstance(obj, User):
+            history = inspect(obj).attrs.team_id.history
+            if history.has_changes():
+                team_ids.update(history.added)
+                team_ids.update(history.deleted)
+
+    user_ids.discard(None)
+    return user_ids, team_ids
+
+
+def _exception_owner(session, exc: ScheduleException) -> Optional[int]:
+    """회차 예외가 속한 반복 일정의 소유자 ID (대개 세션에 이미 있는 일정이라 쿼리 없음)"""
+    schedule = session.get(Schedule, exc.schedule_id) if exc.schedule_id else None
+    return schedule.user_id if schedule else None
+
+
+def init_feed_invalidation() -> None:
+    """세션 flush 이벤트 등록 (create_app에서 한 번 호출)"""
+    if event.contains(db.session, 'before_flush', _before_flush):
+        return
+    event.listen(db.session, 'before_flush', _before_flush)
+    event.listen(db.session, 'after_flush', _after_flush)
+
+
+def _before_flush(session, flush_context, instances) -> None:
+    # flush 후에는 히스토리가 초기화되므로 flush 전에 수집
+    user_ids, team_ids = collect_schedule_changes(session)
+    pending = session.info.setdefault('feed_invalidation', (set(), set()))
+    pending[0].update(user_ids)
+    pending[1].update(team_ids)
+
+
+def _after_flush(session, flush_context) -> None:
+    pending = session.info.pop('feed_invalidation', None)
+    if pending and (pending[0] or pending[1]):
+        FeedService.invalidate_for_users(pending[0], pending[1], connection=session.connection())
@@ -0,0 +1,174 @@
+# ============================================
+# 업무 일정 관리 시스템 - 단계별 시간 측정(트레이싱) 서비스
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\metrics.py
+# ============================================
+#
+# 업로드 파이프라인 각 단계를 span으로 감싸 소요 시간을 히스토그램에 누적하고,
+# /metrics 엔드포인트에서 Prometheus 텍스트 형식으로 내보냅니다.
+# 설정(TRACE_LOG_ENABLED)에 따라 span마다 JSON 한 줄 로그도 남깁니다.
+
+import json
+import logging
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 기본 버킷 (초) - 파일 저장(ms 단위)부터 LLM 호출(수십 초)까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 현재 요청(트레이스) 정보: (trace_id, 상위 span 이름)
+_current_trace: ContextVar[Optional[Tuple[str, str]]] = ContextVar('current_trace', default=None)
+
+
+class Histogram:
+    """레이블별 누적 히스토그램 (Prometheus histogram 형식)"""
+
+    def __init__(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        # 레이블 튜플 → [버킷별 개수..., 합계, 전체 개수]
+        self._series: Dict[Tuple[Tuple[str, str], ...], List[float]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        """값 기록"""
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def snapshot(self) -> Dict[Tuple[Tuple[str, str], ...], Dict[str, float]]:
+        """레이블별 개수/합계 (집계 API용)"""
+        with self._lock:
+            return {key: {'count': s[-1], 'sum': s[-2]} for key, s in self._series.items()}
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 형식 출력"""
+        lines = [f'# HELP {self.name} {self.help_text}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            items = [(key, list(series)) for key, series in self._series.items()]
+
+        for key, series in sorted(items):
+            label_text = ','.join(f'{k}="{_escape(v)}"' for k, v in key)
+            prefix = label_text + ',' if label_text else ''
+            for index, bound in enumerate(self.buckets):
+                lines.append(f'{self.name}_bucket{{{prefix}le="{bound}"}} {series[index]}')
+            lines.append(f'{self.name}_bucket{{{prefix}le="+Inf"}} {series[-1]}')
+            suffix = f'{{{label_text}}}' if label_text else ''
+            lines.append(f'{self.name}_sum{suffix} {series[-2]}')
+            lines.append(f'{self.name}_count{suffix} {series[-1]}')
+        return lines
+
+
+class MetricsRegistry:
+    """히스토그램 모음"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+
+    def histogram(self, name: str, help_text: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """히스토그램 조회 (없으면 생성)"""
+        with self._lock:
+            if name not in self._histograms:
+                self._histograms[name] = Histogram(name, help_text, buckets)
+            return self._histograms[name]
+
+    def render(self) -> str:
+        """등록된 모든 지표를 Prometheus 텍스트로 출력"""
+        with self._lock:
+            histograms = list(self._histograms.values())
+        lines = []
+        for histogram in histograms:
+            lines.extend(histogram.render())
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+# 전역 레지스트리
+registry = MetricsRegistry()
+
+STAGE_DURATION = registry.histogram(
+    'pipeline_stage_duration_seconds',
+    '업로드 파이프라인 단계별 소요 시간 (초)'
+)
+
+# span 로그 출력 여부 (configure()로 설정)
+_log_spans = False
+
+
+def configure(log_spans: bool = False) -> None:
+    """트레이싱 설정 (앱 시작 시 호출)"""
+    global _log_spans
+    _log_spans = log_spans
+    if log_spans and not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+
+
+@contextmanager
+def span(stage: str, **labels):
+    """
+    단계 시간 측정
+
+    사용 예:
+        with span('parse', format='pdf'):
+            ...
+
+    가장 바깥 span에서 trace_id를 만들고, 안쪽 span 로그에는 같은 trace_id와 상위 단계가 함께 기록됩니다.
+    """
+    parent = _current_trace.get()
+    trace_id = parent[0] if parent else uuid.uuid4().hex[:16]
+    token = _current_trace.set((trace_id, stage))
+
+    status = 'ok'
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException:
+        status = 'error'
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        _current_trace.reset(token)
+        STAGE_DURATION.observe(elapsed, stage=stage, status=status, **labels)
+
+        if _log_spans:
+            logger.info(json.dumps({
+                'event': 'span',
+                'trace_id': trace_id,
+                'stage': stage,
+                'parent': parent[1] if parent else None,
+                'status': status,
+                'duration_ms': round(elapsed * 1000, 3),
+                **labels
+            }, ensure_ascii=False))
+
+
+def traced(stage: str, **labels):
+    """함수 전체를 span으로 감싸는 데코레이터"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(stage, **labels):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
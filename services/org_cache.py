@@ -0,0 +1,196 @@
+# ============================================
+# 업무 일정 관리 시스템 - 조직도 캐시 (회사/팀/부서 → 멤버)
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\org_cache.py
+# ============================================
+#
+# 팀원 일정, 빈 시간/충돌 조회, 팀 내보내기, 팀 ICS 피드가 요청마다 같은 팀/회사/부서의
+# 사용자 목록을 다시 조회하지 않도록 조직 구성을 프로세스 메모리에 한 번 읽어 둡니다.
+# - 스냅숏은 쿼리 2회(사용자 컬럼, 팀)로 만들고, 이후 소속/범위 조회는 dict 조회 한 번
+# - 사용자/팀/회사의 소속·권한 관련 컬럼이 바뀐 트랜잭션이 커밋되면 세션 이벤트에서 통째로 무효화
+#   (CompanyService / TeamService의 생성·가입·탈퇴, 회원가입 등 ORM 변경 모두 해당)
+# - ORM flush를 거치지 않는 일괄 INSERT(조직 일괄 등록)는 직접 invalidate() 호출
+# - 다른 프로세스에서 바뀐 내용은 TTL이 지나면 반영됩니다.
+
+import threading
+import time
+from typing import Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import event, inspect
+
+from models import db
+from models.company import Company
+from models.team import Team
+from models.user import User
+
+# 기본 보관 시간 (초)
+DEFAULT_TTL = 60
+
+# 바뀌면 조직도가 달라지는 컬럼
+WATCHED_COLUMNS = {
+    User: ('username', 'company_id', 'team_id', 'department', 'role'),
+    Team: ('company_id', 'name', 'leader_id'),
+    Company: ('name', 'admin_id'),
+}
+
+
+class Member(NamedTuple):
+    """조직도의 사용자 (User 대신 id/username/소속/권한만 필요한 곳에서 사용)"""
+    id: int
+    username: str
+    company_id: Optional[int]
+    team_id: Optional[int]
+    department: Optional[str]
+    role: str
+
+
+class TeamNode(NamedTuple):
+    id: int
+    company_id: int
+    name: str
+    leader_id: Optional[int]
+
+
+class OrgSnapshot:
+    """한 시점의 조직도 (읽기 전용, 멤버 목록은 사용자명 순)"""
+
+    def __init__(self, members: List[Member], teams: List[TeamNode]):
+        self.members: Dict[int, Member] = {member.id: member for member in members}
+        self.teams: Dict[int, TeamNode] = {team.id: team for team in teams}
+
+        by_team: Dict[int, List[int]] = {}
+        by_company: Dict[int, List[int]] = {}
+        by_department: Dict[str, List[int]] = {}
+        for member in members:
+            if member.team_id is not None:
+                by_team.setdefault(member.team_id, []).append(member.id)
+            if member.company_id is not None:
+                by_company.setdefault(member.company_id, []).append(member.id)
+            if member.department:
+                by_department.setdefault(member.department, []).append(member.id)
+        self._team_members = {key: tuple(ids) for key, ids in by_team.items()}
+        self._company_members = {key: tuple(ids) for key, ids in by_company.items()}
+        self._department_members = {key: tuple(ids) for key, ids in by_department.items()}
+        self._team_sets: Dict[int, FrozenSet[int]] = {key: frozenset(ids) for key, ids in by_team.items()}
+
+    def member(self, user_id: int) -> Optional[Member]:
+        return self.members.get(user_id)
+
+    def team(self, team_id: int) -> Optional[TeamNode]:
+        return self.teams.get(team_id)
+
+    def team_member_ids(self, team_id: int) -> Tuple[int, ...]:
+        return self._team_members.get(team_id, ())
+
+    def company_member_ids(self, company_id: int) -> Tuple[int, ...]:
+        return self._company_members.get(company_id, ())
+
+    def department_member_ids(self, department: str) -> Tuple[int, ...]:
+        return self._department_members.get(department, ())
+
+    def is_team_member(self, team_id: int, user_id: int) -> bool:
+        return user_id in self._team_sets.get(team_id, ())
+
+    def scope_member_ids(self, user) -> Tuple[int, ...]:
+        """일정 공유 범위의 사용자 ID (팀 > 회사 > 부서 순, 본인 포함)"""
+        if user.team_id:
+            ids = self.team_member_ids(user.team_id)
+        elif user.company_id:
+            ids = self.company_member_ids(user.company_id)
+        elif user.department:
+            ids = self.department_member_ids(user.department)
+        else:
+            ids = ()
+        return ids if user.id in ids else ids + (user.id,)
+
+    def scope_members(self, user) -> List[Member]:
+        """일정 공유 범위의 사용자 (사용자명 순, 본인 포함)"""
+        members = [self.members[uid] for uid in self.scope_member_ids(user) if uid in self.members]
+        if user.id not in self.members:
+            members.append(Member(user.id, user.username, user.company_id, user.team_id, user.department, user.role))
+        return members
+
+
+class OrgCache:
+    """조직도 스냅숏 캐시 (스레드 안전)"""
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._snapshot: Optional[OrgSnapshot] = None
+        self._expires_at = 0.0
+        self._generation = 0
+
+    def configure(self, ttl: float) -> None:
+        """보관 시간 설정 (0이면 요청마다 새로 읽음)"""
+        self.ttl = ttl
+        self.invalidate()
+
+    def get(self) -> OrgSnapshot:
+        """현재 조직도 (없거나 만료되면 쿼리 2회로 다시 만듦)"""
+        with self._lock:
+            if self._snapshot is not None and self._expires_at > time.monotonic():
+                return self._snapshot
+            generation = self._generation
+
+        snapshot = self._load()
+        with self._lock:
+            # 읽는 동안 무효화됐으면 이번 요청에만 쓰고 저장하지 않음
+            if self.ttl > 0 and generation == self._generation:
+                self._snapshot = snapshot
+                self._expires_at = time.monotonic() + self.ttl
+        return snapshot
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._snapshot = None
+            self._generation += 1
+
+    @staticmethod
+    def _load() -> OrgSnapshot:
+        members = [
+            Member(*row) for row in db.session.query(
+                User.id, User.username, User.company_id, User.team_id, User.department, User.role
+            ).order_by(User.username)
+        ]
+        teams = [TeamNode(*row) for row in db.session.query(Team.id, Team.company_id, Team.name, Team.leader_id)]
+        return OrgSnapshot(members, teams)
+
+
+# 전역 캐시
+org_cache = OrgCache()
+
+
+def init_org_invalidation() -> None:
+    """세션 이벤트 등록 (create_app에서 한 번 호출)"""
+    if event.contains(db.session, 'before_flush', _before_flush):
+        return
+    event.listen(db.session, 'before_flush', _before_flush)
+    event.listen(db.session, 'after_commit', _after_commit)
+    event.listen(db.session, 'after_soft_rollback', _after_soft_rollback)
+
+
+def _org_changed(obj) -> bool:
+    columns = WATCHED_COLUMNS.get(type(obj))
+    if columns is None:
+        return False
+    attrs = inspect(obj).attrs
+    return any(attrs[key].history.has_changes() for key in columns)
+
+
+def _before_flush(session, flush_context, instances) -> None:
+    if session.info.get('org_changed'):
+        return
+    if any(type(obj) in WATCHED_COLUMNS for obj in list(session.new) + list(session.deleted)) \
+            or any(_org_changed(obj) for obj in session.dirty):
+        session.info['org_changed'] = True
+
+
+def _after_commit(session) -> None:
+    if session.info.pop('org_changed', False):
+        org_cache.invalidate()
+
+
+def _after_soft_rollback(session, previous_transaction) -> None:
+    # SAVEPOINT(고유 코드 재시도 등)나 그 안의 flush 롤백은 바깥 트랜잭션의 변경을 되돌리지 않음
+    if previous_transaction.parent is None:
+        session.info.pop('org_changed', None)
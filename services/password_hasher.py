@@ -0,0 +1,90 @@
+# ============================================
+# 업무 일정 관리 시스템 - 비밀번호 해시 작업 풀
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\password_hasher.py
+# ============================================
+#
+# bcrypt는 한 번에 수십~수백 ms CPU를 쓰므로 로그인이 몰리면 요청 스레드 전체가 해시 계산에 묶입니다.
+# - 해시 계산은 크기가 정해진 스레드 풀에서만 실행 (bcrypt는 계산 중 GIL을 풀어 풀 크기만큼 병렬)
+# - 풀과 대기열이 모두 차면 기다리지 않고 PasswordHasherBusy (로그인 화면에서 잠시 후 재시도 안내)
+# - 작업 비용(log rounds)은 설정값을 사용하고, 저장된 해시의 비용이 다르면 로그인 때 다시 해시
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from flask_bcrypt import Bcrypt
+
+# 기본 설정 (create_app에서 configure로 덮어씀)
+DEFAULT_ROUNDS = 12
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_PENDING = 32
+
+# 풀이 가득 찼을 때 자리가 날 때까지 기다리는 시간 (초)
+ACQUIRE_TIMEOUT = 2.0
+
+
+class PasswordHasherBusy(RuntimeError):
+    """해시 작업 풀과 대기열이 모두 찬 상태"""
+
+
+def hash_rounds(pw_hash: str) -> Optional[int]:
+    """'$2b$12$...' → 12 (bcrypt 해시가 아니면 None)"""
+    parts = (pw_hash or '').split('$')
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None
+    return int(parts[2])
+
+
+class PasswordHasher:
+    """bcrypt 해시/검증을 정해진 수의 작업 스레드에서 실행"""
+
+    def __init__(self, rounds: int = DEFAULT_ROUNDS, workers: int = DEFAULT_WORKERS,
+                 max_pending: int = DEFAULT_MAX_PENDING):
+        self._bcrypt = Bcrypt()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self.configure(rounds, workers, max_pending)
+
+    def configure(self, rounds: int, workers: int, max_pending: int) -> None:
+        """작업 비용과 풀 크기 설정 (앱 시작 시 호출)"""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+            self.rounds = rounds
+            self.workers = max(1, workers)
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='bcrypt')
+            # 실행 중 + 대기 중 작업 수 상한
+            self._slots = threading.BoundedSemaphore(self.workers + max(0, max_pending))
+
+    def hash(self, password: str) -> str:
+        """설정된 비용으로 해시 (bcrypt 문자열)"""
+        return self._run(self._bcrypt.generate_password_hash, password, self.rounds).decode('utf-8')
+
+    def verify(self, pw_hash: str, password: str) -> bool:
+        """비밀번호 검증"""
+        if not pw_hash or not password:
+            return False
+        try:
+            return self._run(self._bcrypt.check_password_hash, pw_hash, password)
+        except ValueError:
+            # 해시 형식 오류, bcrypt 길이 제한(72바이트) 초과 등
+            return False
+
+    def needs_rehash(self, pw_hash: str) -> bool:
+        """저장된 해시의 비용이 현재 설정과 다른지"""
+        return hash_rounds(pw_hash) != self.rounds
+
+    def _run(self, func, *args):
+        if not self._slots.acquire(timeout=ACQUIRE_TIMEOUT):
+            raise PasswordHasherBusy('로그인 요청이 많습니다. 잠시 후 다시 시도해주세요.')
+        try:
+            future = self._executor.submit(func, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future.result()
+
+
+# 전역 해시 풀
+password_hasher = PasswordHasher()
@@ -0,0 +1,323 @@
+# ============================================
+# 업무 일정 관리 시스템 - 조직 일괄 등록 (회사/팀/사용자)
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\provisioning.py
+# ============================================
+#
+# 새 고객사의 조직도(CSV/JSON)를 받아 회사, 팀, 사용자를 한 번에 만듭니다.
+# 회원가입/팀 생성/팀 가입 화면을 사람 수만큼 거치지 않도록
+# - 회사/팀: 이름으로 기존 것을 한 번에 조회하고 없는 것만 생성 (다시 실행해도 중복 생성 없음)
+# - 사용자: USER_BATCH_SIZE명씩 중복 확인 1회 + INSERT 1회 + 커밋 (배치 단위 트랜잭션)
+# - 비밀번호 해시: bcrypt는 CPU 작업이라 프로세스 풀에서 묶음 단위로 병렬 계산
+
+import csv
+import json
+import secrets
+import string
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+import bcrypt
+from sqlalchemy import insert, or_
+
+from models import db
+from models.company import Company
+from models.team import Team
+from models.user import User
+from services.company_service import insert_with_unique_code
+from services.org_cache import org_cache
+
+FORMATS = ('csv', 'json')
+
+# 조직도 컬럼 (company, username, email 필수)
+FIELDS = ['company', 'team', 'username', 'email', 'password', 'role', 'department']
+
+ROLES = (User.ROLE_MEMBER, User.ROLE_TEAM_LEADER, User.ROLE_ADMIN)
+
+# 한 트랜잭션에 넣을 사용자 수
+USER_BATCH_SIZE = 500
+
+# 프로세스 하나에 한 번에 넘길 비밀번호 수 (프로세스 간 전달 비용과 부하 분산의 절충)
+HASH_CHUNK_SIZE = 32
+
+# 비밀번호를 비워 둔 사용자에게 발급할 임시 비밀번호 길이
+TEMP_PASSWORD_LENGTH = 12
+
+
+class ProvisionError(ValueError):
+    """조직도 전체를 처리할 수 없는 오류 (형식 등)"""
+
+
+def read_org_chart(fmt: str, stream: TextIO) -> Iterator[Dict[str, Any]]:
+    """
+    조직도 → 행(dict) 제너레이터
+
+    CSV: 헤더가 FIELDS 중 일부인 표
+    JSON: 행 객체 배열, 또는 {"users": [...]}
+    """
+    if fmt == 'csv':
+        reader = csv.DictReader(stream)
+        if not reader.fieldnames or not {'company', 'username', 'email'} <= set(reader.fieldnames):
+            raise ProvisionError('CSV 헤더에 company, username, email이 필요합니다.')
+        yield from reader
+        return
+
+    if fmt == 'json':
+        try:
+            data = json.load(stream)
+        except json.JSONDecodeError as e:
+            raise ProvisionError(f'JSON 형식 오류: {e}')
+        if isinstance(data, dict):
+            data = data.get('users')
+        if not isinstance(data, list):
+            raise ProvisionError('JSON은 사용자 배열 또는 {"users": [...]} 형식이어야 합니다.')
+        for row in data:
+            yield row if isinstance(row, dict) else {}
+        return
+
+    raise ProvisionError('지원하지 않는 형식입니다. (csv, json)')
+
+
+def normalize_row(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    행 검증/정리
+
+    Raises:
+        ValueError: 행 오류 (해당 행만 건너뜀)
+    """
+    row = {field: str(raw.get(field) or '').strip() for field in FIELDS}
+    if len(row['company']) < 2:
+        raise ValueError('회사명은 2자 이상이어야 합니다.')
+    if len(row['username']) < 2:
+        raise ValueError('사용자명은 2자 이상이어야 합니다.')
+    if '@' not in row['email']:
+        raise ValueError('올바른 이메일 형식이 아닙니다.')
+
+    row['role'] = row['role'].lower() or User.ROLE_MEMBER
+    if row['role'] not in ROLES:
+        raise ValueError(f"권한은 {', '.join(ROLES)} 중 하나여야 합니다.")
+    if row['role'] == User.ROLE_TEAM_LEADER and not row['team']:
+        raise ValueError('팀장은 팀이 있어야 합니다.')
+
+    # 비밀번호 앞뒤 공백은 그대로 유지
+    row['password'] = str(raw.get('password') or '')
+    if row['password'] and len(row['password']) < 4:
+        raise ValueError('비밀번호는 4자 이상이어야 합니다.')
+    if len(row['password'].encode('utf-8')) > 72:
+        raise ValueError('비밀번호는 72바이트 이하여야 합니다.')
+
+    row['company'] = row['company'][:100]
+    row['team'] = row['team'][:50] or None
+    row['department'] = row['department'][:50] or None
+    return row
+
+
+def temp_password() -> str:
+    characters = string.ascii_letters + string.digits
+    return ''.join(secrets.choice(characters) for _ in range(TEMP_PASSWORD_LENGTH))
+
+
+def _hash_chunk(passwords: List[str], rounds: int) -> List[str]:
+    """비밀번호 묶음 해시 (작업 프로세스에서 실행 - flask_bcrypt와 같은 $2b$ 형식)"""
+    return [
+        bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(rounds)).decode('utf-8')
+        for password in passwords
+    ]
+
+
+def hash_passwords(passwords: List[str], rounds: int, executor: Optional[Executor] = None) -> List[str]:
+    """비밀번호 목록 해시 (executor가 있으면 HASH_CHUNK_SIZE개씩 나눠 병렬, 순서 유지)"""
+    chunks = [passwords[i:i + HASH_CHUNK_SIZE] for i in range(0, len(passwords), HASH_CHUNK_SIZE)]
+    if executor is None or len(chunks) <= 1:
+        results: Iterable[List[str]] = (_hash_chunk(chunk, rounds) for chunk in chunks)
+    else:
+        results = executor.map(_hash_chunk, chunks, [rounds] * len(chunks))
+    return [pw_hash for chunk in results for pw_hash in chunk]
+
+
+class ProvisioningService:
+    """조직 일괄 등록 서비스"""
+
+    @staticmethod
+    def provision(rows: Iterable[Dict[str, Any]], rounds: int, processes: int = 1,
+                  batch_size: int = USER_BATCH_SIZE, issue_passwords: bool = False) -> Dict[str, Any]:
+        """
+        조직도 행으로 회사/팀/사용자 생성
+
+        이미 있는 회사/팀(이름 기준)은 재사용하고, 사용자명이나 이메일이 이미 있는 사용자는 건너뜁니다.
+        팀장(team_leader) 행은 팀장이 없는 팀의 팀장으로, 관리자(admin) 행은 관리자가 없는 회사의 관리자로 지정합니다.
+        팀장/관리자 자리가 이미 찬 행(기존 팀장/관리자, 또는 파일의 앞 행)은 등록하지 않고 errors에 남깁니다.
+
+        Args:
+            rows: read_org_chart 결과
+            rounds: bcrypt 비용 (설정과 다르면 첫 로그인 때 설정값으로 다시 해시됨)
+            processes: 해시 계산 프로세스 수 (1이면 현재 프로세스에서 계산)
+            batch_size: 트랜잭션당 사용자 수
+            issue_passwords: 비밀번호가 빈 행에 임시 비밀번호 발급 (False면 그 행은 오류로 건너뜀)
+
+        Returns:
+            {'companies': {'created', 'existing'}, 'teams': {'created', 'existing'},
+             'users': {'created', 'skipped'}, 'errors': [{'row', 'message'}],
+             'temporary_passwords': [{'username', 'password'}]}  (issue_passwords일 때만 채워짐)
+        """
+        summary: Dict[str, Any] = {
+            'companies': {'created': 0, 'existing': 0},
+            'teams': {'created': 0, 'existing': 0},
+            'users': {'created': 0, 'skipped': 0},
+            'errors': [],
+            'temporary_passwords': [],
+        }
+
+        valid: List[Tuple[int, Dict[str, Any]]] = []
+        seen_usernames, seen_emails = set(), set()
+        for line, raw in enumerate(rows, start=1):
+            try:
+                row = normalize_row(raw)
+            except ValueError as e:
+                summary['errors'].append({'row': line, 'message': str(e)})
+                continue
+            if row['username'] in seen_usernames or row['email'] in seen_emails:
+                summary['errors'].append({'row': line, 'message': '파일 안에서 사용자명/이메일이 중복됩니다.'})
+                continue
+            if not row['password'] and not issue_passwords:
+                summary['errors'].append({'row': line, 'message': '비밀번호가 없습니다. (임시 비밀번호는 CLI --show-passwords로만 발급)'})
+                continue
+            seen_usernames.add(row['username'])
+            seen_emails.add(row['email'])
+            valid.append((line, row))
+
+        if not valid:
+            return summary
+
+        companies = ProvisioningService._ensure_companies({row['company'] for _, row in valid}, summary)
+        teams = ProvisioningService._ensure_teams(
+            {(companies[row['company']].id, row['team']) for _, row in valid if row['team']}, summary
+        )
+        db.session.commit()
+
+        executor = ProcessPoolExecutor(max_workers=processes) if processes > 1 else None
+        try:
+            for start in range(0, len(valid), batch_size):
+                ProvisioningService._create_users(
+                    valid[start:start + batch_size], companies, teams, rounds, executor, summary
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return summary
+
+    @staticmethod
+    def _ensure_companies(names: set, summary: Dict[str, Any]) -> Dict[str, Company]:
+        """회사명 → Company (없는 회사만 생성, 조회 1회)"""
+        companies = {company.name: company for company in Company.query.filter(Company.name.in_(names))}
+        summary['companies']['existing'] += len(companies)
+        for name in sorted(names - companies.keys()):
+            company = Company(name=name)
+            insert_with_unique_code(company)
+            companies[name] = company
+            summary['companies']['created'] += 1
+        return companies
+
+    @staticmethod
+    def _ensure_teams(keys: set, summary: Dict[str, Any]) -> Dict[Tuple[int, str], Team]:
+        """(회사 ID, 팀명) → Team (없는 팀만 생성, 조회 1회)"""
+        company_ids = {company_id for company_id, _ in keys}
+        teams = {
+            (team.company_id, team.name): team
+            for team in Team.query.filter(Team.company_id.in_(company_ids))
+            if (team.company_id, team.name) in keys
+        }
+        summary['teams']['existing'] += len(teams)
+        for company_id, name in sorted(keys - teams.keys()):
+            team = Team(company_id=company_id, name=name)
+            insert_with_unique_code(team)
+            teams[(company_id, name)] = team
+            summary['teams']['created'] += 1
+        return teams
+
+    @staticmethod
+    def _create_users(batch: List[Tuple[int, Dict[str, Any]]], companies: Dict[str, Company],
+                      teams: Dict[Tuple[int, str], Team], rounds: int,
+                      executor: Optional[Executor], summary: Dict[str, Any]) -> None:
+        """사용자 한 배치: 중복 확인 1회 → 팀장/관리자 자리 확인 → 해시 → INSERT 1회 → 팀장/관리자 지정 → 커밋"""
+        usernames = [row['username'] for _, row in batch]
+        emails = [row['email'] for _, row in batch]
+        taken = db.session.query(User.username, User.email).filter(
+            or_(User.username.in_(usernames), User.email.in_(emails))
+        ).all()
+        taken_usernames = {username for username, _ in taken}
+        taken_emails = {email for _, email in taken}
+
+        new_rows = []
+        claimed = set()  # 이 배치에서 자리를 차지한 회사 관리자 / 팀장
+        for line, row in batch:
+            if row['username'] in taken_usernames or row['email'] in taken_emails:
+                summary['users']['skipped'] += 1
+                summary['errors'].append({'row': line, 'message': '이미 등록된 사용자명 또는 이메일입니다.'})
+                continue
+            conflict = ProvisioningService._role_conflict(row, companies, teams, claimed)
+            if conflict:
+                summary['users']['skipped'] += 1
+                summary['errors'].append({'row': line, 'message': conflict})
+                continue
+            if not row['password']:
+                row['password'] = temp_password()
+                summary['temporary_passwords'].append({'username': row['username'], 'password': row['password']})
+            new_rows.append(row)
+        if not new_rows:
+            return
+
+        hashes = hash_passwords([row['password'] for row in new_rows], rounds, executor)
+        now = datetime.utcnow()
+        values = []
+        for row, pw_hash in zip(new_rows, hashes):
+            company = companies[row['company']]
+            team = teams.get((company.id, row['team'])) if row['team'] else None
+            values.append({
+                'username': row['username'],
+                'email': row['email'],
+                'password_hash': pw_hash,
+                'company_id': company.id,
+                'team_id': team.id if team else None,
+                'role': row['role'],
+                'department': row['department'],
+                'created_at': now,
+            })
+
+        table = User.__table__
+        result = db.session.execute(insert(table).returning(table.c.id, table.c.username), values)
+        user_ids = {username: user_id for user_id, username in result}
+
+        for row in new_rows:
+            company = companies[row['company']]
+            if row['role'] == User.ROLE_ADMIN and company.admin_id is None:
+                company.admin_id = user_ids[row['username']]
+            elif row['role'] == User.ROLE_TEAM_LEADER:
+                team = teams[(company.id, row['team'])]
+                if team.leader_id is None:
+                    team.leader_id = user_ids[row['username']]
+
+        db.session.commit()
+        # Core INSERT는 세션 이벤트를 거치지 않으므로 조직도 캐시를 직접 무효화
+        org_cache.invalidate()
+        summary['users']['created'] += len(values)
+
+    @staticmethod
+    def _role_conflict(row: Dict[str, Any], companies: Dict[str, Company],
+                       teams: Dict[Tuple[int, str], Team], claimed: set) -> Optional[str]:
+        """팀장/관리자 자리가 이미 찼으면 오류 메시지 (비어 있으면 자리를 claimed에 기록하고 None)"""
+        company = companies[row['company']]
+        if row['role'] == User.ROLE_ADMIN:
+            slot, occupied = ('company', company.id), company.admin_id is not None
+            message = f"회사 '{company.name}'에 이미 관리자가 있습니다."
+        elif row['role'] == User.ROLE_TEAM_LEADER:
+            team = teams[(company.id, row['team'])]
+            slot, occupied = ('team', team.id), team.leader_id is not None
+            message = f"팀 '{team.name}'에 이미 팀장이 있습니다."
+        else:
+            return None
+        if occupied or slot in claimed:
+            return message
+        claimed.add(slot)
+        return None
@@ -0,0 +1,151 @@
+# ============================================
+# 업무 일정 관리 시스템 - 요청별 SQL 쿼리 통계 서비스
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\query_stats.py
+# ============================================
+#
+# SQLAlchemy 엔진 이벤트로 요청마다 쿼리 수와 DB 시간을 집계합니다.
+# - 기준(SQL_SLOW_REQUEST_QUERIES / SQL_SLOW_REQUEST_MS)을 넘는 요청은 경고 로그
+# - 기준(SQL_SLOW_STATEMENT_MS)을 넘는 개별 쿼리도 경고 로그
+# - 엔드포인트별 집계는 /metrics 히스토그램과 /metrics/sql JSON으로 제공
+# - 집계는 요청 컨텍스트가 끝날 때(teardown_request) 기록하므로 예외로 끝난 요청도 포함되고,
+#   스트리밍 응답(내보내기 등)은 응답이 닫힐 때 기록해 본문을 만드는 동안 실행된 쿼리까지 포함합니다.
+
+import heapq
+import time
+from functools import partial
+from typing import Dict, List
+
+from flask import Flask, current_app, g, has_request_context, request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from services.metrics import registry
+
+# 쿼리 수 버킷 (N+1이면 수십~수백)
+QUERY_COUNT_BUCKETS = (1, 2, 3, 5, 10, 20, 50, 100, 200, 500)
+
+REQUEST_QUERIES = registry.histogram(
+    'http_request_db_queries',
+    '요청당 SQL 쿼리 수',
+    QUERY_COUNT_BUCKETS
+)
+REQUEST_DB_SECONDS = registry.histogram(
+    'http_request_db_seconds',
+    '요청당 SQL 실행 시간 합계 (초)'
+)
+
+# 느린 요청 로그에 포함할 쿼리 문장 수 (요청마다 가장 느린 이만큼만 보관)
+_LOGGED_STATEMENTS = 5
+
+_listening = False
+
+
+def init_query_stats(app: Flask) -> None:
+    """엔진 이벤트와 요청 훅 등록 (create_app에서 호출)"""
+    global _listening
+    if not _listening:
+        # 엔진 클래스에 등록해 읽기 전용 복제본 등 추가 엔진도 함께 집계
+        event.listen(Engine, 'before_cursor_execute', _before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', _after_cursor_execute)
+        _listening = True
+
+    app.before_request(_start_request)
+    app.after_request(_defer_streamed)
+    app.teardown_request(_finish_request)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get('query_start_time')
+    if not starts:
+        return
+    elapsed = time.perf_counter() - starts.pop()
+
+    if not has_request_context() or 'sql_query_count' not in g:
+        return
+
+    g.sql_query_count += 1
+    g.sql_db_time += elapsed
+    # 내보내기처럼 쿼리가 많은 요청에서도 메모리가 늘지 않도록 가장 느린 N개만 유지 (최소 힙)
+    if len(g.sql_statements) < _LOGGED_STATEMENTS:
+        heapq.heappush(g.sql_statements, (elapsed, statement))
+    elif elapsed > g.sql_statements[0][0]:
+        heapq.heapreplace(g.sql_statements, (elapsed, statement))
+
+    if elapsed * 1000 >= current_app.config['SQL_SLOW_STATEMENT_MS']:
+        current_app.logger.warning(
+            '느린 쿼리 %.1fms [%s] %s', elapsed * 1000, request.endpoint, _shorten(statement)
+        )
+
+
+def _start_request() -> None:
+    g.sql_query_count = 0
+    g.sql_db_time = 0.0
+    g.sql_statements = []
+
+
+def _defer_streamed(response):
+    """스트리밍 응답은 본문을 다 보낸 뒤(응답 close) 기록"""
+    if response.is_streamed and 'sql_query_count' in g:
+        g.sql_stats_deferred = True
+        response.call_on_close(partial(
+            _record, current_app._get_current_object(), g._get_current_object(), request.method, request.endpoint
+        ))
+    return response
+
+
+def _finish_request(exc=None) -> None:
+    if 'sql_query_count' not in g or g.get('sql_stats_deferred'):
+        return
+    _record(current_app, g, request.method, request.endpoint)
+
+
+def _record(app: Flask, stats, method: str, endpoint: str) -> None:
+    """요청 1건 집계 기록 (한 번만 - 이후 쿼리는 집계하지 않음)"""
+    count = stats.pop('sql_query_count', None)
+    if count is None:
+        return
+
+    endpoint = endpoint or 'unknown'
+    db_time = stats.sql_db_time
+
+    REQUEST_QUERIES.observe(count, endpoint=endpoint)
+    REQUEST_DB_SECONDS.observe(db_time, endpoint=endpoint)
+
+    config = app.config
+    if count > config['SQL_SLOW_REQUEST_QUERIES'] or db_time * 1000 > config['SQL_SLOW_REQUEST_MS']:
+        slowest = sorted(stats.sql_statements, key=lambda item: item[0], reverse=True)
+        app.logger.warning(
+            '쿼리 과다 요청 %s %s: %d개 쿼리, DB %.1fms\n%s',
+            method, endpoint, count, db_time * 1000,
+            '\n'.join(f'  {elapsed * 1000:.1f}ms {_shorten(statement)}' for elapsed, statement in slowest)
+        )
+
+
+def _shorten(statement: str, limit: int = 200) -> str:
+    statement = ' '.join(statement.split())
+    return statement if len(statement) <= limit else statement[:limit] + '...'
+
+
+def endpoint_summary() -> List[Dict]:
+    """엔드포인트별 요청 수, 평균 쿼리 수, 평균 DB 시간"""
+    queries = REQUEST_QUERIES.snapshot()
+    seconds = REQUEST_DB_SECONDS.snapshot()
+
+    summary = []
+    for key, stats in queries.items():
+        labels = dict(key)
+        requests = stats['count']
+        db_seconds = seconds.get(key, {}).get('sum', 0.0)
+        summary.append({
+            'endpoint': labels.get('endpoint'),
+            'requests': requests,
+            'avg_queries': round(stats['sum'] / requests, 2) if requests else 0,
+            'avg_db_ms': round(db_seconds * 1000 / requests, 3) if requests else 0,
+        })
+
+    summary.sort(key=lambda item: item['avg_queries'], reverse=True)
+    return summary
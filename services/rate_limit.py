@@ -0,0 +1,115 @@
+# ============================================
+# 업무 일정 관리 시스템 - 요청 횟수 제한 (슬라이딩 윈도)
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\rate_limit.py
+# ============================================
+#
+# 키(IP, 사용자명)별로 최근 window초 동안의 시도 시각을 보관하고, limit회를 넘으면 거절합니다.
+# 고정 구간(1분 단위 초기화)과 달리 구간 경계에서 두 배가 몰리는 문제가 없습니다.
+# 프로세스 메모리에 있으므로 워커 프로세스마다 따로 셉니다.
+
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Tuple
+
+# 보관할 최대 키 수 (넘으면 만료된 키부터 정리, 그래도 많으면 가장 오래된 키 제거)
+MAX_KEYS = 10000
+
+
+class SlidingWindowLimiter:
+    """키별 슬라이딩 윈도 횟수 제한 (스레드 안전)"""
+
+    def __init__(self, limit: int, window: float, max_keys: int = MAX_KEYS):
+        self.limit = limit
+        self.window = window
+        self.max_keys = max_keys
+        self._lock = threading.Lock()
+        self._hits: Dict[str, Deque[float]] = {}
+
+    def configure(self, limit: int, window: float) -> None:
+        """횟수/기간 설정 (앱 시작 시 호출)"""
+        with self._lock:
+            self.limit = limit
+            self.window = window
+            self._hits.clear()
+
+    def check(self, key: str) -> Tuple[bool, int]:
+        """
+        지금 시도해도 되는지 (기록하지 않음)
+
+        Returns:
+            (허용 여부, 거절 시 다시 시도할 수 있을 때까지 남은 초)
+        """
+        now = time.monotonic()
+        with self._lock:
+            hits = self._hits.get(key)
+            if hits is None:
+                return True, 0
+            self._expire(hits, now)
+            if len(hits) < self.limit:
+                return True, 0
+            return False, max(1, int(hits[0] + self.window - now) + 1)
+
+    def hit(self, key: str) -> None:
+        """시도 1회 기록"""
+        now = time.monotonic()
+        with self._lock:
+            self._record(key, now)
+
+    def try_acquire(self, key: str) -> Tuple[bool, int]:
+        """
+        확인과 기록을 한 번에 (동시 요청이 모두 check를 통과한 뒤 기록하는 경쟁 방지)
+
+        허용되면 시도 1회를 바로 기록합니다. 실패로 세지 않을 결과면 release()로 되돌립니다.
+
+        Returns:
+            (허용 여부, 거절 시 다시 시도할 수 있을 때까지 남은 초)
+        """
+        now = time.monotonic()
+        with self._lock:
+            hits = self._hits.get(key)
+            if hits is not None:
+                self._expire(hits, now)
+                if len(hits) >= self.limit:
+                    return False, max(1, int(hits[0] + self.window - now) + 1)
+            self._record(key, now)
+            return True, 0
+
+    def release(self, key: str) -> None:
+        """try_acquire로 기록한 시도 1회 취소 (예: 로그인 성공 시 IP 실패 횟수에서 제외)"""
+        with self._lock:
+            hits = self._hits.get(key)
+            if hits:
+                hits.pop()
+
+    def reset(self, key: str) -> None:
+        """키 기록 삭제 (예: 로그인 성공 시 사용자명 실패 횟수 초기화)"""
+        with self._lock:
+            self._hits.pop(key, None)
+
+    def _record(self, key: str, now: float) -> None:
+        hits = self._hits.get(key)
+        if hits is None:
+            if len(self._hits) >= self.max_keys:
+                self._prune(now)
+            hits = self._hits[key] = deque()
+        self._expire(hits, now)
+        hits.append(now)
+        # 거절된 뒤에도 계속 시도하는 키가 무한히 쌓지 않도록 limit건만 보관
+        while len(hits) > self.limit:
+            hits.popleft()
+
+    def _expire(self, hits: Deque[float], now: float) -> None:
+        while hits and hits[0] <= now - self.window:
+            hits.popleft()
+
+    def _prune(self, now: float) -> None:
+        for key in [key for key, hits in self._hits.items() if not hits or hits[-1] <= now - self.window]:
+            del self._hits[key]
+        while len(self._hits) >= self.max_keys:
+            del self._hits[next(iter(self._hits))]
+
+
+# 로그인 시도 제한 (create_app에서 설정값으로 configure)
+login_ip_limiter = SlidingWindowLimiter(limit=50, window=300)       # IP별 실패
+login_user_limiter = SlidingWindowLimiter(limit=10, window=300)     # 사용자명별 실패
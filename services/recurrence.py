@@ -0,0 +1,312 @@
+# ============================================
+# 업무 일정 관리 시스템 - 반복 일정 서비스
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\recurrence.py
+# ============================================
+#
+# 반복 일정은 한 행(규칙)으로만 저장하고, 조회한 캘린더 기간 안의 회차만 그때그때 펼칩니다.
+# 지원 RRULE: FREQ(DAILY/WEEKLY/MONTHLY/YEARLY), INTERVAL, BYDAY(MO..SU), BYMONTHDAY, COUNT, UNTIL
+
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+from dateutil import rrule as dateutil_rrule
+
+FREQUENCIES = {
+    'DAILY': dateutil_rrule.DAILY,
+    'WEEKLY': dateutil_rrule.WEEKLY,
+    'MONTHLY': dateutil_rrule.MONTHLY,
+    'YEARLY': dateutil_rrule.YEARLY,
+}
+
+WEEKDAYS = {
+    'MO': dateutil_rrule.MO, 'TU': dateutil_rrule.TU, 'WE': dateutil_rrule.WE,
+    'TH': dateutil_rrule.TH, 'FR': dateutil_rrule.FR, 'SA': dateutil_rrule.SA,
+    'SU': dateutil_rrule.SU,
+}
+
+# 규칙 하나가 만들 수 있는 최대 회차 수 (COUNT 상한)
+MAX_COUNT = 1000
+
+# 다음 회차를 찾을 범위 (일, 순서대로 넓힘) - 마지막 범위는 YEARLY 규칙도 한 회차 이상 들어오도록 1년 남짓
+NEXT_DUE_SEARCH_DAYS = (35, 400)
+
+
+class RecurrenceError(ValueError):
+    """지원하지 않거나 잘못된 반복 규칙"""
+
+
+def parse_rule(rule: str) -> Dict[str, object]:
+    """
+    RRULE 문자열 검증 및 분해
+
+    Returns:
+        {'FREQ': str, 'INTERVAL': int, 'BYDAY': [..], 'BYMONTHDAY': [..], 'COUNT': int, 'UNTIL': date}
+
+    Raises:
+        RecurrenceError: 지원 범위를 벗어난 규칙
+    """
+    if not rule:
+        raise RecurrenceError('반복 규칙이 비어 있습니다.')
+
+    rule = rule.strip()
+    if rule.upper().startswith('RRULE:'):
+        rule = rule[6:]
+
+    parts = {}
+    for part in rule.split(';'):
+        if not part:
+            continue
+        if '=' not in part:
+            raise RecurrenceError(f'잘못된 규칙 항목입니다: {part}')
+        key, value = part.split('=', 1)
+        parts[key.strip().upper()] = value.strip().upper()
+
+    unknown = set(parts) - {'FREQ', 'INTERVAL', 'BYDAY', 'BYMONTHDAY', 'COUNT', 'UNTIL'}
+    if unknown:
+        raise RecurrenceError(f'지원하지 않는 규칙 항목입니다: {", ".join(sorted(unknown))}')
+
+    if parts.get('FREQ') not in FREQUENCIES:
+        raise RecurrenceError('FREQ는 DAILY, WEEKLY, MONTHLY, YEARLY 중 하나여야 합니다.')
+
+    parsed = {'FREQ': parts['FREQ'], 'INTERVAL': 1}
+    try:
+        if 'INTERVAL' in parts:
+            parsed['INTERVAL'] = int(parts['INTERVAL'])
+            if not 1 <= parsed['INTERVAL'] <= 366:
+                raise RecurrenceError('INTERVAL은 1~366 사이여야 합니다.')
+        if 'COUNT' in parts:
+            parsed['COUNT'] = int(parts['COUNT'])
+            if not 1 <= parsed['COUNT'] <= MAX_COUNT:
+                raise RecurrenceError(f'COUNT는 1~{MAX_COUNT} 사이여야 합니다.')
+        if 'BYMONTHDAY' in parts:
+            parsed['BYMONTHDAY'] = [int(v) for v in parts['BYMONTHDAY'].split(',')]
+            if any(not (1 <= abs(v) <= 31) for v in parsed['BYMONTHDAY']):
+                raise RecurrenceError('BYMONTHDAY는 1~31 (또는 -1~-31) 이어야 합니다.')
+        if 'UNTIL' in parts:
+            parsed['UNTIL'] = datetime.strptime(parts['UNTIL'][:8], '%Y%m%d').date()
+    except ValueError as e:
+        if isinstance(e, RecurrenceError):
+            raise
+        raise RecurrenceError(f'규칙 값 형식이 잘못되었습니다: {e}')
+
+    if 'BYDAY' in parts:
+        days = parts['BYDAY'].split(',')
+        if any(day not in WEEKDAYS for day in days):
+            raise RecurrenceError('BYDAY는 MO,TU,WE,TH,FR,SA,SU만 지원합니다.')
+        parsed['BYDAY'] = days
+
+    if 'COUNT' in parsed and 'UNTIL' in parsed:
+        raise RecurrenceError('COUNT와 UNTIL은 함께 쓸 수 없습니다.')
+
+    return parsed
+
+
+def format_rule(parsed: Dict[str, object]) -> str:
+    """분해된 규칙 → 정규화된 RRULE 문자열"""
+    parts = [f"FREQ={parsed['FREQ']}"]
+    if parsed.get('INTERVAL', 1) != 1:
+        parts.append(f"INTERVAL={parsed['INTERVAL']}")
+    if parsed.get('BYDAY'):
+        parts.append('BYDAY=' + ','.join(parsed['BYDAY']))
+    if parsed.get('BYMONTHDAY'):
+        parts.append('BYMONTHDAY=' + ','.join(str(v) for v in parsed['BYMONTHDAY']))
+    if parsed.get('COUNT'):
+        parts.append(f"COUNT={parsed['COUNT']}")
+    if parsed.get('UNTIL'):
+        parts.append(f"UNTIL={parsed['UNTIL'].strftime('%Y%m%d')}")
+    return ';'.join(parts)
+
+
+def normalize_rule(rule: str) -> str:
+    """규칙 검증 후 정규화된 문자열 반환"""
+    return format_rule(parse_rule(rule))
+
+
+def build_rule(freq: str, until: date = None, interval: int = 1) -> str:
+    """폼 입력(반복 주기, 종료일)으로 규칙 생성"""
+    parsed = {'FREQ': (freq or '').upper(), 'INTERVAL': interval}
+    if parsed['FREQ'] not in FREQUENCIES:
+        raise RecurrenceError('반복 주기가 올바르지 않습니다.')
+    if until:
+        parsed['UNTIL'] = until
+    return format_rule(parsed)
+
+
+def _rrule(parsed: Dict[str, object], dtstart: date):
+    return dateutil_rrule.rrule(
+        FREQUENCIES[parsed['FREQ']],
+        dtstart=datetime.combine(dtstart, time()),
+        interval=parsed.get('INTERVAL', 1),
+        byweekday=[WEEKDAYS[day] for day in parsed['BYDAY']] if parsed.get('BYDAY') else None,
+        bymonthday=parsed.get('BYMONTHDAY'),
+        count=parsed.get('COUNT'),
+        until=datetime.combine(parsed['UNTIL'], time()) if parsed.get('UNTIL') else None,
+    )
+
+
+def compute_until(rule: str, dtstart: date) -> Optional[date]:
+    """
+    마지막 회차 시작일 계산 (기간 필터용 recurrence_until 값)
+
+    UNTIL이나 COUNT가 없으면 무기한이므로 None.
+    저장 요청마다 실행되므로 회차는 최대 MAX_COUNT개까지만 펼치고, 그보다 많은 UNTIL 규칙
+    (먼 미래까지의 DAILY 등)은 UNTIL 날짜를 그대로 사용합니다. (마지막 회차 이후 날짜라 기간 필터에 안전)
+    """
+    parsed = parse_rule(rule)
+    if not parsed.get('UNTIL') and not parsed.get('COUNT'):
+        return None
+
+    last = None
+    for index, occurrence in enumerate(_rrule(parsed, dtstart)):
+        if index >= MAX_COUNT:
+            return parsed['UNTIL']
+        last = occurrence
+    return last.date() if last else dtstart
+
+
+def occurrence_dates(rule: str, dtstart: date, window_start: date, window_end: date,
+                     span_days: int = 0) -> List[date]:
+    """
+    기간과 겹치는 회차 시작일 목록
+
+    Args:
+        rule: RRULE 문자열
+        dtstart: 첫 회차 시작일
+        window_start, window_end: 조회 기간 (양 끝 포함)
+        span_days: 회차 하나의 길이 - 1 (시작일 이전에 시작해 기간 안에서 끝나는 회차 포함용)
+    """
+    parsed = parse_rule(rule)
+    lower = datetime.combine(window_start - timedelta(days=span_days), time())
+    upper = datetime.combine(window_end, time())
+    return [dt.date() for dt in _rrule(parsed, dtstart).between(lower, upper, inc=True)]
+
+
+class Occurrence(NamedTuple):
+    """펼쳐진 회차 1건 (예외 적용 후 값)"""
+    occurrence_date: date  # 원래 회차 시작일 (예외 키)
+    start_date: date
+    end_date: date
+    start_time: Optional[time]
+    end_time: Optional[time]
+    title: str
+    is_completed: bool
+
+
+def iter_occurrences(schedule, window_start: date, window_end: date,
+                     exceptions: Iterable = ()) -> Iterator[Occurrence]:
+    """
+    반복 일정 1건에서 기간과 겹치는 회차를 예외(취소/변경)를 적용해 순서대로 반환
+
+    Args:
+        schedule: 반복 Schedule
+        exceptions: 이 일정의 ScheduleException 목록
+    """
+    start_date = schedule.start_date or schedule.due_date
+    span = (schedule.due_date - start_date) if schedule.due_date >= start_date else timedelta(0)
+    overrides = {exc.occurrence_date: exc for exc in exceptions}
+
+    dates = set(occurrence_dates(schedule.recurrence_rule, start_date, window_start, window_end, span.days))
+    # 기간 밖 회차를 기간 안으로 옮긴 예외도 포함
+    dates.update(
+        exc.occurrence_date for exc in overrides.values()
+        if exc.override_date and window_start - span <= exc.override_date <= window_end and not exc.is_cancelled
+    )
+
+    for occurrence in sorted(dates):
+        exc = overrides.get(occurrence)
+        if exc is None:
+            occ_start = occurrence
+            occ_end = occ_start + span
+            if occ_end < window_start or occ_start > window_end:
+                continue
+            yield Occurrence(occurrence, occ_start, occ_end, schedule.start_time, schedule.end_time,
+                             schedule.title, False)
+            continue
+
+        if exc.is_cancelled:
+            continue
+        occ_start = exc.override_date or occurrence
+        occ_end = occ_start + span
+        if occ_end < window_start or occ_start > window_end:
+            continue
+        yield Occurrence(
+            occurrence, occ_start, occ_end,
+            exc.start_time or schedule.start_time,
+            exc.end_time or schedule.end_time,
+            exc.title or schedule.title,
+            bool(exc.is_completed),
+        )
+
+
+def next_due_date(schedule, today: date, exceptions: Iterable = ()) -> date:
+    """
+    반복 일정의 긴급도 기준 마감일
+
+    오늘 이후에 끝나는 첫 회차(취소/완료된 회차 제외)의 종료일.
+    반복이 이미 끝났으면 마지막 회차 종료일(지연), 범위 안에 남은 회차가 없으면 범위 끝 이후(여유)
+
+    Raises:
+        RecurrenceError: 잘못된 규칙
+    """
+    exceptions = list(exceptions)
+    # 대부분(DAILY/WEEKLY/MONTHLY)은 가까운 범위에서 찾으므로 짧은 범위부터 펼침
+    for days in NEXT_DUE_SEARCH_DAYS:
+        ends = [
+            occ.end_date for occ in iter_occurrences(schedule, today, today + timedelta(days=days), exceptions)
+            if occ.end_date >= today and not occ.is_completed
+        ]
+        if ends:
+            return min(ends)
+
+    if schedule.recurrence_until and schedule.recurrence_until < today:
+        start_date = schedule.start_date or schedule.due_date
+        return schedule.recurrence_until + max(schedule.due_date - start_date, timedelta(0))
+    return max(schedule.due_date, today + timedelta(days=NEXT_DUE_SEARCH_DAYS[-1]))
+
+
+def expand_events(schedule, window_start: date, window_end: date,
+                  exceptions: Iterable = (), today: date = None) -> List[dict]:
+    """
+    반복 일정 1건을 기간 안의 캘린더 이벤트 목록으로 펼치기
+
+    Args:
+        schedule: 반복 Schedule
+        exceptions: 이 일정의 ScheduleException 목록
+        today: 남은 일수 계산 기준일 (기본: 오늘)
+    """
+    from models.schedule import Schedule
+
+    today = today or date.today()
+    base = schedule.to_calendar_event(today)
+    events = []
+
+    for occ in iter_occurrences(schedule, window_start, window_end, exceptions):
+        if not schedule.is_all_day and occ.start_time:
+            start = datetime.combine(occ.start_date, occ.start_time).isoformat()
+        else:
+            start = occ.start_date.isoformat()
+        if not schedule.is_all_day and occ.end_time:
+            end = datetime.combine(occ.end_date, occ.end_time).isoformat()
+        else:
+            end = occ.end_date.isoformat()
+
+        days_left = (occ.end_date - today).days
+        event = dict(base)
+        event.update({
+            'groupId': f'recurring-{schedule.id}',
+            'title': occ.title,
+            'start': start,
+            'end': end,
+            'color': Schedule.URGENCY_COLORS[Schedule.urgency_for(days_left, occ.is_completed)],
+        })
+        event['extendedProps'] = dict(base['extendedProps'], **{
+            'is_completed': occ.is_completed,
+            'days_left': days_left,
+            'is_recurring': True,
+            'occurrence_date': occ.occurrence_date.isoformat(),
+            'start_time': occ.start_time.strftime('%H:%M') if occ.start_time else None,
+            'end_time': occ.end_time.strftime('%H:%M') if occ.end_time else None,
+        })
+        events.append(event)
+
+    return events
@@ -0,0 +1,499 @@
+# ============================================
+# 업무 일정 관리 시스템 - 일정 가져오기/내보내기 (CSV, ICS, JSON Lines)
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\schedule_io.py
+# ============================================
+#
+# 모든 함수는 한 줄(한 건)씩 처리하는 제너레이터라서
+# 요청 본문이나 전체 일정 목록을 메모리에 올리지 않습니다.
+
+import csv
+import io
+import json
+from datetime import date, datetime, time, timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from services import recurrence
+from services.ai_extractor import ScheduleItemValidator
+
+FORMATS = ('csv', 'ics', 'jsonl')
+
+MIME_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'ics': 'text/calendar; charset=utf-8',
+    'jsonl': 'application/x-ndjson; charset=utf-8',
+}
+
+# CSV/JSONL 컬럼 (내보내기 → 가져오기 왕복 가능)
+FIELDS = [
+    'title', 'task_description', 'start_date', 'due_date', 'start_time', 'end_time',
+    'is_all_day', 'schedule_type', 'tags', 'memo', 'is_completed', 'recurrence_rule'
+]
+
+SCHEDULE_TYPES = {'deadline', 'trip', 'meeting', 'submit', 'other'}
+
+
+class ImportRowError(ValueError):
+    """가져오기 행 오류"""
+
+
+def detect_format(explicit: Optional[str], filename: Optional[str], content_type: Optional[str]) -> Optional[str]:
+    """형식 결정 (쿼리 파라미터 > 파일 확장자 > Content-Type)"""
+    if explicit:
+        explicit = explicit.lower()
+        return explicit if explicit in FORMATS else None
+
+    if filename and '.' in filename:
+        ext = filename.rsplit('.', 1)[1].lower()
+        if ext in ('jsonl', 'ndjson'):
+            return 'jsonl'
+        if ext in FORMATS:
+            return ext
+
+    content_type = (content_type or '').lower()
+    if 'csv' in content_type:
+        return 'csv'
+    if 'calendar' in content_type:
+        return 'ics'
+    if 'ndjson' in content_type or 'jsonl' in content_type:
+        return 'jsonl'
+    return None
+
+
+# ============================================
+# 가져오기
+# ============================================
+
+def iter_import_rows(fmt: str, stream: TextIO) -> Iterator[Dict[str, Any]]:
+    """형식별 원시 행 제너레이터"""
+    if fmt == 'csv':
+        return _iter_csv(stream)
+    if fmt == 'jsonl':
+        return _iter_jsonl(stream)
+    if fmt == 'ics':
+        return _iter_ics(stream)
+    raise ValueError(f'지원하지 않는 형식입니다: {fmt}')
+
+
+def _iter_csv(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    reader = csv.DictReader(stream)
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            # 필드 크기 초과, 닫히지 않은 따옴표 등 - 다음 행의 시작 위치를 알 수 없으므로 여기서 중단
+            yield {'_error': f'CSV 오류: {e} (이후 행은 읽지 않았습니다)'}
+            return
+        yield row
+
+
+def _iter_jsonl(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            item = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield {'_error': f'JSON 오류: {e.msg}'}
+            continue
+        yield item if isinstance(item, dict) else {'_error': 'JSON 객체가 아닙니다.'}
+
+
+def _unfold_lines(stream: TextIO) -> Iterator[str]:
+    """ICS 줄 접기(공백/탭으로 시작하는 다음 줄) 해제"""
+    current = None
+    for raw in stream:
+        line = raw.rstrip('\r\n')
+        if line[:1] in (' ', '\t') and current is not None:
+            current += line[1:]
+            continue
+        if current is not None:
+            yield current
+        current = line
+    if current is not None:
+        yield current
+
+
+def _ics_unescape(value: str) -> str:
+    return value.replace('\\n', '\n').replace('\\N', '\n').replace('\\,', ',').replace('\\;', ';').replace('\\\\', '\\')
+
+
+def _parse_ics_datetime(value: str, params: str):
+    """DTSTART/DTEND 값 → (date, time 또는 None)"""
+    value = value.strip().rstrip('Z')
+    if 'VALUE=DATE' in params.upper() and 'T' not in value:
+        return datetime.strptime(value, '%Y%m%d').date(), None
+    if 'T' in value:
+        parsed = datetime.strptime(value[:15], '%Y%m%dT%H%M%S')
+        return parsed.date(), parsed.time()
+    return datetime.strptime(value, '%Y%m%d').date(), None
+
+
+def _iter_ics(stream: TextIO) -> Iterator[Dict[str, Any]]:
+    """VEVENT를 하나씩 일정 dict로 변환"""
+    event = None
+    for line in _unfold_lines(stream):
+        if line == 'BEGIN:VEVENT':
+            event = {}
+            continue
+        if line == 'END:VEVENT':
+            if event is not None:
+                yield _ics_event_to_row(event)
+            event = None
+            continue
+        if event is None or ':' not in line:
+            continue
+
+        name_part, value = line.split(':', 1)
+        name, _, params = name_part.partition(';')
+        event[name.upper()] = (params, value)
+
+
+def _ics_event_to_row(event: Dict[str, tuple]) -> Dict[str, Any]:
+    try:
+        if 'DTSTART' not in event:
+            return {'_error': 'DTSTART가 없습니다.'}
+        start_date, start_time = _parse_ics_datetime(event['DTSTART'][1], event['DTSTART'][0])
+        end_date, end_time = start_date, None
+        if 'DTEND' in event:
+            end_date, end_time = _parse_ics_datetime(event['DTEND'][1], event['DTEND'][0])
+            if end_time is None and start_time is None and end_date > start_date:
+                end_date -= timedelta(days=1)  # 종일 일정의 DTEND는 다음 날(배타적)
+    except ValueError as e:
+        return {'_error': f'날짜 형식 오류: {e}'}
+
+    summary = _ics_unescape(event.get('SUMMARY', ('', ''))[1])
+    description = _ics_unescape(event.get('DESCRIPTION', ('', ''))[1])
+    categories = _ics_unescape(event.get('CATEGORIES', ('', ''))[1])
+    status = event.get('STATUS', ('', ''))[1].upper()
+    rrule = event.get('RRULE', ('', ''))[1]
+
+    return {
+        'title': summary,
+        'task_description': description or summary,
+        'start_date': start_date,
+        'due_date': end_date,
+        'start_time': start_time,
+        'end_time': end_time,
+        'is_all_day': start_time is None,
+        'tags': categories or None,
+        'is_completed': status == 'COMPLETED',
+        'recurrence_rule': rrule or None,
+    }
+
+
+def _to_bool(value: Any, default: bool) -> bool:
+    if value is None or value == '':
+        return default
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'y', 'on')
+
+
+def _to_date(value: Any) -> Optional[date]:
+    if value is None or value == '':
+        return None
+    if isinstance(value, date):
+        return value
+    return ScheduleItemValidator.parse_date(str(value))
+
+
+def _to_time(value: Any) -> Optional[time]:
+    if value is None or value == '':
+        return None
+    if isinstance(value, time):
+        return value
+    parts = str(value).strip().split(':')
+    return time(int(parts[0]), int(parts[1]))
+
+
+def _to_text(value: Any, field: str) -> str:
+    """문자열 필드 값 (JSONL의 숫자/불리언은 문자열로, 객체/배열은 행 오류)"""
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (bool, int, float)):
+        return str(value)
+    raise ImportRowError(f'{field} 값의 형식이 잘못되었습니다.')
+
+
+def _to_tags(value: Any) -> str:
+    """태그 (문자열 또는 JSONL 배열 ["a", "b"] → "a,b")"""
+    if isinstance(value, (list, tuple)):
+        return ','.join(_to_text(tag, 'tags') for tag in value if tag is not None)
+    return _to_text(value, 'tags')
+
+
+def normalize_row(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    원시 행 → ScheduleService.build_row 입력 형식
+
+    Raises:
+        ImportRowError: 필수 값 누락, 형식 오류
+    """
+    if raw.get('_error'):
+        raise ImportRowError(raw['_error'])
+
+    title = _to_text(raw.get('title'), 'title')
+    if not title:
+        raise ImportRowError('제목이 없습니다.')
+
+    due_date = _to_date(raw.get('due_date'))
+    if due_date is None:
+        raise ImportRowError('종료일(due_date)이 없거나 형식이 잘못되었습니다.')
+
+    try:
+        start_time = _to_time(raw.get('start_time'))
+        end_time = _to_time(raw.get('end_time'))
+    except (ValueError, IndexError):
+        raise ImportRowError('시간 형식이 잘못되었습니다. (HH:MM)')
+
+    schedule_type = (_to_text(raw.get('schedule_type'), 'schedule_type') or 'other').lower()
+    start_date = _to_date(raw.get('start_date')) or due_date
+
+    recurrence_rule = recurrence_until = None
+    rule = _to_text(raw.get('recurrence_rule'), 'recurrence_rule')
+    if rule:
+        try:
+            recurrence_rule = recurrence.normalize_rule(rule)
+            recurrence_until = recurrence.compute_until(recurrence_rule, start_date)
+        except recurrence.RecurrenceError as e:
+            raise ImportRowError(f'반복 규칙 오류: {e}')
+
+    return {
+        'title': title[:200],
+        'task_description': _to_text(raw.get('task_description'), 'task_description') or title,
+        'start_date': start_date,
+        'due_date': due_date,
+        'start_time': start_time,
+        'end_time': end_time,
+        'is_all_day': _to_bool(raw.get('is_all_day'), start_time is None),
+        'schedule_type': schedule_type if schedule_type in SCHEDULE_TYPES else 'other',
+        'tags': _to_tags(raw.get('tags'))[:200] or None,
+        'memo': _to_text(raw.get('memo'), 'memo') or None,
+        'is_completed': _to_bool(raw.get('is_completed'), False),
+        'is_ai_generated': False,
+        'recurrence_rule': recurrence_rule,
+        'recurrence_until': recurrence_until,
+    }
+
+
+def batched(rows: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """size개씩 묶기"""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+# ============================================
+# 내보내기
+# ============================================
+
+def _iso(value) -> str:
+    return value.isoformat() if value else ''
+
+
+def _hhmm(value) -> str:
+    return value.strftime('%H:%M') if value else ''
+
+
+def schedule_record(schedule) -> Dict[str, Any]:
+    """내보내기용 dict (FIELDS 순서)"""
+    return {
+        'title': schedule.title,
+        'task_description': schedule.task_description,
+        'start_date': _iso(schedule.start_date),
+        'due_date': _iso(schedule.due_date),
+        'start_time': _hhmm(schedule.start_time),
+        'end_time': _hhmm(schedule.end_time),
+        'is_all_day': bool(schedule.is_all_day),
+        'schedule_type': schedule.schedule_type,
+        'tags': schedule.tags or '',
+        'memo': schedule.memo or '',
+        'is_completed': bool(schedule.is_completed),
+        'recurrence_rule': schedule.recurrence_rule or '',
+    }
+
+
+def iter_csv(schedules: Iterable) -> Iterator[str]:
+    """CSV 한 줄씩 출력 (Excel 호환을 위해 BOM 포함)"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=['id', 'user_id'] + FIELDS)
+
+    def flush() -> str:
+        value = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+        return value
+
+    writer.writeheader()
+    yield '\ufeff' + flush()
+    for schedule in schedules:
+        writer.writerow({'id': schedule.id, 'user_id': schedule.user_id, **schedule_record(schedule)})
+        yield flush()
+
+
+def iter_jsonl(schedules: Iterable) -> Iterator[str]:
+    """JSON Lines 한 줄씩 출력"""
+    for schedule in schedules:
+        record = {'id': schedule.id, 'user_id': schedule.user_id, **schedule_record(schedule)}
+        yield json.dumps(record, ensure_ascii=False) + '\n'
+
+
+def _ics_escape(value: str) -> str:
+    return (value or '').replace('\\', '\\\\').replace(';', '\\;').replace(',', '\\,').replace('\n', '\\n')
+
+
+def _ics_fold(line: str) -> str:
+    """75 옥텟 기준 줄 접기 (RFC 5545)"""
+    encoded = line.encode('utf-8')
+    if len(encoded) <= 75:
+        return line + '\r\n'
+
+    parts = []
+    current = ''
+    limit = 75
+    for char in line:
+        if len((current + char).encode('utf-8')) > limit:
+            parts.append(current)
+            current = ''
+            limit = 74  # 이어지는 줄은 앞에 공백 1바이트
+        current += char
+    parts.append(current)
+    return '\r\n '.join(parts) + '\r\n'
+
+
+def _ics_when(name: str, day: date, at: Optional[time]) -> str:
+    """DTSTART/DTEND/RECURRENCE-ID 한 줄 (시간이 없으면 날짜 값)"""
+    if at is None:
+        return f"{name};VALUE=DATE:{day.strftime('%Y%m%d')}"
+    return f"{name}:{datetime.combine(day, at).strftime('%Y%m%dT%H%M%S')}"
+
+
+def _ics_period(start_date: date, end_date: date, start_time: Optional[time],
+                end_time: Optional[time]) -> List[str]:
+    """DTSTART/DTEND 줄 (start_time이 없으면 종일 - DTEND는 다음 날)"""
+    if start_time is None:
+        return [_ics_when('DTSTART', start_date, None), _ics_when('DTEND', end_date + timedelta(days=1), None)]
+    lines = [_ics_when('DTSTART', start_date, start_time)]
+    if end_time:
+        lines.append(_ics_when('DTEND', end_date, end_time))
+    return lines
+
+
+def ics_event(schedule, uid_domain: str, stamp: datetime = None, exceptions: Iterable = ()) -> str:
+    """
+    일정 1건 → VEVENT 문자열
+
+    반복 일정은 회차 예외(ScheduleException)를 함께 내보냅니다.
+    - 취소된 회차: 반복 VEVENT의 EXDATE
+    - 변경된 회차: 같은 UID + RECURRENCE-ID(원래 회차)의 VEVENT
+    """
+    stamp = stamp or datetime.utcnow()
+    start_date = schedule.start_date or schedule.due_date
+    end_date = schedule.end_date or schedule.due_date
+    start_time = None if schedule.is_all_day else schedule.start_time
+    uid = f'UID:schedule-{schedule.id}@{uid_domain}'
+    dtstamp = f"DTSTAMP:{(schedule.updated_at or stamp).strftime('%Y%m%dT%H%M%SZ')}"
+
+    lines = ['BEGIN:VEVENT', uid, dtstamp]
+    lines.extend(_ics_period(start_date, end_date, start_time, schedule.end_time))
+
+    overrides = []
+    if getattr(schedule, 'recurrence_rule', None):
+        lines.append(f'RRULE:{schedule.recurrence_rule}')
+        exceptions = sorted(exceptions, key=lambda exc: exc.occurrence_date)
+        cancelled = [exc.occurrence_date for exc in exceptions if exc.is_cancelled]
+        if cancelled:
+            lines.append(_ics_exdate(cancelled, start_time))
+        overrides = [exc for exc in exceptions if not exc.is_cancelled]
+
+    lines.extend(_ics_details(schedule.title, schedule))
+    if schedule.is_completed:
+        lines.append('STATUS:COMPLETED')
+    lines.append('END:VEVENT')
+
+    span = max(end_date - start_date, timedelta(0))
+    for exc in overrides:
+        occ_start = exc.override_date or exc.occurrence_date
+        occ_start_time = (exc.start_time or schedule.start_time) if start_time else None
+        lines.extend(['BEGIN:VEVENT', uid, dtstamp, _ics_when('RECURRENCE-ID', exc.occurrence_date, start_time)])
+        lines.extend(_ics_period(occ_start, occ_start + span, occ_start_time, exc.end_time or schedule.end_time))
+        lines.extend(_ics_details(exc.title or schedule.title, schedule))
+        if exc.is_completed:
+            lines.append('STATUS:COMPLETED')
+        lines.append('END:VEVENT')
+
+    return ''.join(_ics_fold(line) for line in lines)
+
+
+def _ics_exdate(days: List[date], at: Optional[time]) -> str:
+    """EXDATE 한 줄 (여러 회차는 쉼표로 구분)"""
+    if at is None:
+        return 'EXDATE;VALUE=DATE:' + ','.join(day.strftime('%Y%m%d') for day in days)
+    return 'EXDATE:' + ','.join(datetime.combine(day, at).strftime('%Y%m%dT%H%M%S') for day in days)
+
+
+def _ics_details(title: str, schedule) -> List[str]:
+    """SUMMARY/DESCRIPTION/CATEGORIES 줄"""
+    lines = [f'SUMMARY:{_ics_escape(title)}']
+    if schedule.task_description:
+        lines.append(f'DESCRIPTION:{_ics_escape(schedule.task_description)}')
+    if schedule.tags:
+        categories = ','.join(_ics_escape(tag.strip()) for tag in schedule.tags.split(',') if tag.strip())
+        lines.append(f'CATEGORIES:{categories}')
+    return lines
+
+
+ICS_HEADER = (
+    'BEGIN:VCALENDAR\r\n'
+    'VERSION:2.0\r\n'
+    'PRODID:-//Work Schedule Management System//KO\r\n'
+    'CALSCALE:GREGORIAN\r\n'
+)
+ICS_FOOTER = 'END:VCALENDAR\r\n'
+
+# 회차 예외를 한 번에 읽을 일정 수
+ICS_EXCEPTION_BATCH = 200
+
+
+def iter_ics(schedules: Iterable, uid_domain: str, calendar_name: str = None,
+             exceptions_for: Callable[[List[Any]], Dict[int, List[Any]]] = None) -> Iterator[str]:
+    """
+    iCalendar 한 이벤트씩 출력
+
+    Args:
+        exceptions_for: 일정 목록 → {일정 ID: 회차 예외 목록} (반복 일정의 취소/변경 회차 포함용,
+                        ICS_EXCEPTION_BATCH건씩 묶어 호출)
+    """
+    header = ICS_HEADER
+    if calendar_name:
+        header += _ics_fold(f'X-WR-CALNAME:{_ics_escape(calendar_name)}')
+    yield header
+    stamp = datetime.utcnow()
+    for batch in batched(schedules, ICS_EXCEPTION_BATCH):
+        exceptions = exceptions_for(batch) if exceptions_for else {}
+        for schedule in batch:
+            yield ics_event(schedule, uid_domain, stamp, exceptions.get(schedule.id, ()))
+    yield ICS_FOOTER
+
+
+def iter_export(fmt: str, schedules: Iterable, uid_domain: str = 'localhost',
+                calendar_name: str = None,
+                exceptions_for: Callable[[List[Any]], Dict[int, List[Any]]] = None) -> Iterator[str]:
+    """형식별 내보내기 제너레이터 (exceptions_for는 ICS에서만 사용)"""
+    if fmt == 'csv':
+        return iter_csv(schedules)
+    if fmt == 'jsonl':
+        return iter_jsonl(schedules)
+    if fmt == 'ics':
+        return iter_ics(schedules, uid_domain, calendar_name, exceptions_for)
+    raise ValueError(f'지원하지 않는 형식입니다: {fmt}')
@@ -0,0 +1,152 @@
+# ============================================
+# 업무 일정 관리 시스템 - 대시보드 일정 목록 (필터 + 페이지)
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\schedule_listing.py
+# ============================================
+#
+# 대시보드가 사용자의 모든 일정을 한 번에 읽지 않도록 급한 순 목록을 페이지 단위로 읽습니다.
+# - 정렬: (긴급도 순위, 마감일, id) - 긴급도는 Schedule.urgency_rank_expr로 DB에서 계산
+# - 반복 일정은 첫 회차가 아니라 다음 회차 마감일 기준 (ScheduleService.next_due_dates)
+# - 페이지: 마지막 행의 정렬 키를 담은 커서로 이어 읽기 (OFFSET 없이 키셋 조건)
+# - 커서에 기준일을 함께 담아 자정이 지나도 같은 순서로 이어서 읽음
+
+import base64
+from datetime import date
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import selectinload
+
+from models.schedule import Schedule
+from services.schedule_service import ScheduleService
+from services.tag_service import TagService
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+STATUSES = ('pending', 'completed')
+
+
+class ListCursorError(ValueError):
+    """잘못된 목록 커서"""
+
+
+class ScheduleFilters(NamedTuple):
+    """목록 필터 (비어 있으면 조건 없음)"""
+    status: Optional[str] = None          # 'pending' | 'completed'
+    types: Tuple[str, ...] = ()           # schedule_type
+    urgency: Tuple[str, ...] = ()         # Schedule.URGENCY_ORDER 값
+    tag: Optional[str] = None             # 태그 1개
+    date_from: Optional[date] = None      # 마감일 >= date_from
+    date_to: Optional[date] = None        # 마감일 <= date_to
+
+    def to_args(self) -> Dict[str, str]:
+        """다음 페이지 요청에 그대로 붙일 쿼리 인자"""
+        args = {
+            'status': self.status,
+            'type': ','.join(self.types),
+            'urgency': ','.join(self.urgency),
+            'tag': self.tag,
+            'from': self.date_from.isoformat() if self.date_from else None,
+            'to': self.date_to.isoformat() if self.date_to else None,
+        }
+        return {key: value for key, value in args.items() if value}
+
+
+def encode_cursor(today: date, rank: int, due_date: date, schedule_id: int) -> str:
+    raw = f"{today.isoformat()}|{rank}|{due_date.isoformat()}|{schedule_id}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[date, int, date, int]:
+    """커서 → (기준일, 마지막 긴급도 순위, 마지막 마감일, 마지막 일정 ID)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        today, rank, due_date, schedule_id = base64.urlsafe_b64decode(padded).decode('utf-8').split('|')
+        return date.fromisoformat(today), int(rank), date.fromisoformat(due_date), int(schedule_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ListCursorError('커서 형식이 올바르지 않습니다.')
+
+
+class ScheduleListService:
+    """대시보드 일정 목록 서비스"""
+
+    @staticmethod
+    def page(user_id: int, filters: ScheduleFilters = ScheduleFilters(), cursor: str = None,
+             limit: int = DEFAULT_PAGE_SIZE, today: date = None) -> Dict[str, Any]:
+        """
+        급한 순 일정 1페이지
+
+        Args:
+            user_id: 소유자 ID
+            filters: 목록 필터
+            cursor: 이전 페이지의 next_cursor (없으면 첫 페이지)
+            limit: 페이지 크기 (최대 MAX_PAGE_SIZE)
+            today: 첫 페이지 기준일 (기본: 오늘, 다음 페이지는 커서의 기준일 사용)
+
+        Returns:
+            {'schedules': [Schedule], 'today', 'next_cursor', 'has_more'}
+
+        Raises:
+            ListCursorError: 잘못된 커서
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        after = None
+        if cursor:
+            today, *after = decode_cursor(cursor)
+        today = today or date.today()
+
+        next_due = ScheduleService.next_due_dates(user_id, today)
+        rank = Schedule.urgency_rank_expr(today, next_due)
+        due_date = Schedule.effective_due_expr(next_due)
+        query = (
+            Schedule.query
+            .options(selectinload(Schedule.document))
+            .add_columns(rank.label('urgency_rank'))
+            .filter(Schedule.user_id == user_id, *ScheduleListService.conditions(user_id, filters, today, next_due))
+        )
+        if after:
+            last_rank, last_due, last_id = after
+            query = query.filter(or_(
+                rank > last_rank,
+                and_(rank == last_rank, due_date > last_due),
+                and_(rank == last_rank, due_date == last_due, Schedule.id > last_id)
+            ))
+        rows = query.order_by(rank, due_date.asc(), Schedule.id.asc()).limit(limit + 1).all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        for schedule, _ in rows:
+            schedule.next_due_date = next_due.get(schedule.id)
+        next_cursor = None
+        if has_more:
+            last, last_rank = rows[-1]
+            next_cursor = encode_cursor(today, last_rank, last.next_due_date or last.due_date, last.id)
+
+        return {
+            'schedules': [schedule for schedule, _ in rows],
+            'today': today,
+            'next_cursor': next_cursor,
+            'has_more': has_more,
+        }
+
+    @staticmethod
+    def conditions(user_id: int, filters: ScheduleFilters, today: date,
+                   next_due: Dict[int, date] = None) -> List:
+        """필터 → WHERE 조건 목록 (긴급도/기간은 반복 일정의 다음 회차 마감일 기준)"""
+        due_date = Schedule.effective_due_expr(next_due)
+        conditions = []
+        if filters.status == 'pending':
+            conditions.append(Schedule.is_completed == False)
+        elif filters.status == 'completed':
+            conditions.append(Schedule.is_completed == True)
+        if filters.types:
+            conditions.append(Schedule.schedule_type.in_(filters.types))
+        if filters.urgency:
+            conditions.append(Schedule.urgency_level_expr(today, next_due).in_(filters.urgency))
+        if filters.tag:
+            conditions.append(TagService.tag_condition(user_id, filters.tag))
+        if filters.date_from:
+            conditions.append(due_date >= filters.date_from)
+        if filters.date_to:
+            conditions.append(due_date <= filters.date_to)
+        return conditions
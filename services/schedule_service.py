@@ -0,0 +1,351 @@
+# ============================================
+# 업무 일정 관리 시스템 - 일정 서비스
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\schedule_service.py
+# ============================================
+
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO
+
+from sqlalchemy import and_, func, insert, or_, select
+from sqlalchemy.orm import selectinload
+
+from models import db
+from models.schedule import Schedule
+from models.schedule_exception import ScheduleException
+from services import recurrence, schedule_io
+from services.digest_service import DigestService
+from services.events import publish_bulk_created
+from services.feed_service import FeedService
+from services.tag_service import TagService
+from services.write_queue import write_queue
+
+# 가져오기 배치 크기 (배치마다 INSERT 1회 + 커밋)
+IMPORT_BATCH_SIZE = 500
+
+# 가져오기 결과에 포함할 최대 오류 수
+MAX_REPORTED_ERRORS = 20
+
+# 캘린더 기간을 지정하지 않았을 때 반복 일정을 펼칠 기본 범위 (오늘 기준)
+DEFAULT_WINDOW_PAST_DAYS = 31
+DEFAULT_WINDOW_FUTURE_DAYS = 365
+
+
+class ScheduleService:
+    """일정 관리 서비스"""
+
+    @staticmethod
+    def build_row(user_id: int, data: Dict[str, Any], document_id: int = None,
+                  is_ai_generated: bool = False) -> Dict[str, Any]:
+        """
+        일정 dict를 INSERT용 컬럼 값으로 변환
+
+        Schedule.__init__과 같은 기본값 규칙을 적용합니다.
+        (시작일 없으면 마감일, 시작 시간이 있으면 종일 아님, 유형 없으면 other)
+
+        Args:
+            user_id: 소유자 ID
+            data: 일정 정보 (title, task_description, due_date, ...)
+            document_id: 출처 문서 ID
+            is_ai_generated: AI 생성 여부 (data에 값이 있으면 그 값 사용)
+        """
+        due_date: date = data.get('due_date')
+        start_time: Optional[time] = data.get('start_time')
+        is_all_day = data.get('is_all_day', True)
+
+        return {
+            'user_id': user_id,
+            'document_id': data.get('document_id', document_id),
+            'title': data.get('title') or '새 일정',
+            'task_description': data.get('task_description') or '',
+            'start_date': data.get('start_date') or due_date,
+            'due_date': due_date,
+            'end_date': data.get('end_date'),
+            'start_time': start_time,
+            'end_time': data.get('end_time'),
+            'is_all_day': is_all_day if start_time is None else False,
+            'schedule_type': data.get('schedule_type') or Schedule.TYPE_OTHER,
+            'tags': data.get('tags'),
+            'memo': data.get('memo'),
+            'is_completed': bool(data.get('is_completed', False)),
+            'is_ai_generated': data.get('is_ai_generated', is_ai_generated),
+            'recurrence_rule': data.get('recurrence_rule'),
+            'recurrence_until': data.get('recurrence_until'),
+        }
+
+    @staticmethod
+    def bulk_create(user_id: int, items: Iterable[Dict[str, Any]], document_id: int = None,
+                    is_ai_generated: bool = False) -> List[int]:
+        """
+        일정 일괄 저장 (INSERT ... RETURNING 한 번)
+
+        ORM 객체를 만들지 않고 executemany로 한 번에 넣습니다.
+        커밋은 호출하는 쪽에서 합니다 (문서 저장 등과 같은 트랜잭션으로 묶기 위해).
+
+        Args:
+            user_id: 소유자 ID
+            items: 일정 dict 목록 (AIScheduleExtractor.extract_schedules 결과 형식)
+            document_id: 출처 문서 ID
+            is_ai_generated: AI 생성 여부 기본값
+
+        Returns:
+            생성된 일정 ID 목록 (오름차순)
+        """
+        rows = [
+            ScheduleService.build_row(user_id, item, document_id, is_ai_generated)
+            for item in items
+            if item.get('due_date') is not None
+        ]
+        if not rows:
+            return []
+
+        # sort_by_parameter_order=True는 SQLite에서 행 단위 INSERT로 바뀌므로 사용하지 않음
+        result = db.session.execute(
+            insert(Schedule).returning(Schedule.id),
+            rows
+        )
+        ids = sorted(result.scalars())
+        
+        # 일괄 INSERT는 flush 이벤트를 거치지 않으므로 태그 색인, 구독 피드/팀원 요약을 직접 갱신
+        if any(row['tags'] for row in rows):
+            tagged = db.session.execute(
+                select(Schedule.id, Schedule.user_id, Schedule.tags)
+                .where(Schedule.id.in_(ids), Schedule.tags.isnot(None))
+            ).all()
+            TagService.sync(db.session.connection(), tagged)
+        FeedService.invalidate_for_users({user_id})
+        DigestService.mark_changed(db.session, {user_id})
+        publish_bulk_created(db.session, user_id, ids)
+        return ids
+
+    @staticmethod
+    def commit_batch(user_id: int, items: List[Dict[str, Any]]) -> List[int]:
+        """bulk_create + 커밋 (쓰기 큐에서 배치 하나씩 실행, 실패하면 롤백)"""
+        try:
+            ids = ScheduleService.bulk_create(user_id, items)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        return ids
+
+    @staticmethod
+    def import_stream(user_id: int, fmt: str, stream: TextIO,
+                      batch_size: int = IMPORT_BATCH_SIZE) -> Dict[str, Any]:
+        """
+        CSV/ICS/JSONL 스트림을 한 행씩 읽어 배치 단위로 저장
+
+        배치마다 쓰기 큐에서 저장/커밋하므로 중간에 실패해도 앞선 배치는 유지됩니다.
+        잘못된 행은 건너뛰고 오류 목록에 행 번호와 함께 기록합니다.
+
+        Returns:
+            {'created': 생성 수, 'skipped': 건너뛴 수, 'errors': [{'row', 'message'}]}
+        """
+        summary = {'created': 0, 'skipped': 0, 'errors': []}
+
+        def skip(row_number: int, message: str) -> None:
+            summary['skipped'] += 1
+            if len(summary['errors']) < MAX_REPORTED_ERRORS:
+                summary['errors'].append({'row': row_number, 'message': message})
+
+        def valid_rows() -> Iterator[Dict[str, Any]]:
+            for row_number, raw in enumerate(schedule_io.iter_import_rows(fmt, stream), start=1):
+                try:
+                    yield schedule_io.normalize_row(raw)
+                except schedule_io.ImportRowError as e:
+                    skip(row_number, str(e))
+                except (TypeError, AttributeError, ValueError) as e:
+                    # 예상하지 못한 값 형식도 그 행만 건너뜀 (가져오기 전체를 중단하지 않음)
+                    skip(row_number, f'값 형식 오류: {e}')
+
+        for batch in schedule_io.batched(valid_rows(), batch_size):
+            ids = write_queue.run(ScheduleService.commit_batch, user_id, batch)
+            summary['created'] += len(ids)
+
+        return summary
+
+    @staticmethod
+    def iter_user_schedules(user_ids: List[int], chunk_size: int = 500) -> Iterator[Schedule]:
+        """사용자들의 일정을 chunk_size개씩 나눠 읽는 제너레이터 (내보내기용)"""
+        if not user_ids:
+            return iter(())
+        return iter(
+            Schedule.query
+            .filter(Schedule.user_id.in_(user_ids))
+            .order_by(Schedule.due_date.asc(), Schedule.id.asc())
+            .yield_per(chunk_size)
+        )
+
+    @staticmethod
+    def window_conditions(window_start: date, window_end: date):
+        """
+        기간 조회 조건 (단일 일정 조건, 반복 일정 후보 조건)
+
+        반복 일정은 첫 회차가 기간 끝 이전이고 마지막 회차가 끝나지 않은 것만 후보로 읽고,
+        실제 회차는 recurrence.iter_occurrences로 펼칩니다.
+        """
+        first_day = func.coalesce(Schedule.start_date, Schedule.due_date)
+        single = and_(
+            Schedule.recurrence_rule.is_(None),
+            first_day <= window_end,
+            Schedule.due_date >= window_start
+        )
+        # recurrence_until은 마지막 회차 시작일이므로, 여러 날에 걸친 회차/옮긴 회차를 위해 1년 여유를 둠
+        recurring = and_(
+            Schedule.recurrence_rule.isnot(None),
+            first_day <= window_end,
+            or_(Schedule.recurrence_until.is_(None),
+                Schedule.recurrence_until >= window_start - timedelta(days=366))
+        )
+        return single, recurring
+
+    @staticmethod
+    def next_due_dates(user_id: int, today: date) -> Dict[int, date]:
+        """
+        미완료 반복 일정의 다음 회차 마감일 {일정 ID: 날짜} (긴급도/정렬 기준)
+
+        반복 일정은 첫 회차 마감일이 지나도 다음 회차가 있으므로 지연으로 보지 않습니다.
+        반복 일정 조회 1회 + 예외 조회 1회 (반복 일정이 없으면 조회 1회)
+        """
+        recurring = Schedule.query.filter(
+            Schedule.user_id == user_id,
+            Schedule.recurrence_rule.isnot(None),
+            Schedule.is_completed == False
+        ).all()
+        if not recurring:
+            return {}
+
+        exceptions = ScheduleService.exceptions_for(recurring)
+        next_due = {}
+        for schedule in recurring:
+            try:
+                next_due[schedule.id] = recurrence.next_due_date(schedule, today, exceptions.get(schedule.id, ()))
+            except recurrence.RecurrenceError:
+                # 규칙이 깨진 일정은 첫 회차 기준
+                continue
+        return next_due
+
+    @staticmethod
+    def urgency_counts(user_id: int, today: date = None, next_due: Dict[int, date] = None) -> Dict[str, int]:
+        """
+        긴급도별 일정 수 (GROUP BY 쿼리 1회, 없는 레벨은 0)
+
+        Args:
+            next_due: 반복 일정의 다음 회차 마감일 (기본: next_due_dates로 조회)
+        """
+        today = today or date.today()
+        if next_due is None:
+            next_due = ScheduleService.next_due_dates(user_id, today)
+        level = Schedule.urgency_level_expr(today, next_due)
+        counts = dict.fromkeys(Schedule.URGENCY_ORDER, 0)
+        rows = (
+            db.session.query(level, func.count(Schedule.id))
+            .filter(Schedule.user_id == user_id)
+            .group_by(level)
+        )
+        for name, count in rows:
+            counts[name] = count
+        return counts
+
+    @staticmethod
+    def exceptions_for(schedules: Iterable[Schedule]) -> Dict[int, List[ScheduleException]]:
+        """반복 일정들의 회차 예외를 쿼리 1회로 읽어 일정 ID별로 묶기"""
+        ids = [schedule.id for schedule in schedules if schedule.is_recurring]
+        exceptions: Dict[int, List[ScheduleException]] = {}
+        if not ids:
+            return exceptions
+        for exc in ScheduleException.query.filter(ScheduleException.schedule_id.in_(ids)):
+            exceptions.setdefault(exc.schedule_id, []).append(exc)
+        return exceptions
+
+    @staticmethod
+    def calendar_events(user_id: int, window_start: date = None, window_end: date = None) -> List[dict]:
+        """
+        캘린더 이벤트 목록 (반복 일정은 기간 안의 회차만 펼침)
+
+        기간이 주어지면 단일 일정도 기간과 겹치는 것만 조회합니다.
+        기간이 없으면 단일 일정은 전체, 반복 일정은 기본 범위만 펼칩니다.
+        예외는 반복 일정 전체에 대해 쿼리 1회로 읽습니다.
+
+        Args:
+            user_id: 소유자 ID
+            window_start, window_end: 조회 기간 (양 끝 포함)
+        """
+        today = date.today()
+        single = (
+            Schedule.query
+            .options(selectinload(Schedule.document))
+            .filter(Schedule.user_id == user_id, Schedule.recurrence_rule.is_(None))
+        )
+        if window_start and window_end:
+            single = single.filter(ScheduleService.window_conditions(window_start, window_end)[0])
+        events = [schedule.to_calendar_event(today) for schedule in single]
+
+        if not (window_start and window_end):
+            window_start = today - timedelta(days=DEFAULT_WINDOW_PAST_DAYS)
+            window_end = today + timedelta(days=DEFAULT_WINDOW_FUTURE_DAYS)
+
+        recurring = Schedule.query.options(selectinload(Schedule.document)).filter(
+            Schedule.user_id == user_id,
+            ScheduleService.window_conditions(window_start, window_end)[1]
+        ).all()
+        if not recurring:
+            return events
+
+        exceptions = ScheduleService.exceptions_for(recurring)
+        for schedule in recurring:
+            try:
+                events.extend(recurrence.expand_events(
+                    schedule, window_start, window_end, exceptions.get(schedule.id, ()), today
+                ))
+            except recurrence.RecurrenceError:
+                # 규칙이 깨진 일정은 첫 회차만 표시
+                events.append(schedule.to_calendar_event(today))
+
+        return events
+
+    @staticmethod
+    def set_occurrence_exception(schedule: Schedule, occurrence_date: date,
+                                 changes: Dict[str, Any]) -> ScheduleException:
+        """
+        반복 일정의 한 회차 취소/변경 (같은 회차 예외가 있으면 덮어씀)
+
+        Args:
+            changes: is_cancelled, override_date, title, start_time, end_time, is_completed
+
+        Raises:
+            ValueError: 반복 일정이 아니거나 존재하지 않는 회차
+        """
+        if not schedule.is_recurring:
+            raise ValueError('반복 일정이 아닙니다.')
+
+        first_day = schedule.start_date or schedule.due_date
+        if occurrence_date not in recurrence.occurrence_dates(
+                schedule.recurrence_rule, first_day, occurrence_date, occurrence_date):
+            raise ValueError('해당 날짜에는 반복 회차가 없습니다.')
+
+        exc = ScheduleException.query.filter_by(
+            schedule_id=schedule.id, occurrence_date=occurrence_date
+        ).first()
+        if exc is None:
+            exc = ScheduleException(schedule_id=schedule.id, occurrence_date=occurrence_date)
+            db.session.add(exc)
+
+        for field in ('is_cancelled', 'override_date', 'title', 'start_time', 'end_time', 'is_completed'):
+            if field in changes:
+                setattr(exc, field, changes[field])
+
+        # 회차 예외도 일정 변경으로 취급 (증분 동기화, 팀원 요약 무효화, 실시간 알림)
+        schedule.updated_at = datetime.utcnow()
+        db.session.commit()
+        return exc
+
+    @staticmethod
+    def clear_occurrence_exception(schedule: Schedule, occurrence_date: date) -> bool:
+        """회차 예외 삭제 (반복 규칙대로 되돌림)"""
+        deleted = ScheduleException.query.filter_by(
+            schedule_id=schedule.id, occurrence_date=occurrence_date
+        ).delete()
+        if deleted:
+            schedule.updated_at = datetime.utcnow()
+        db.session.commit()
+        return deleted > 0
@@ -0,0 +1,76 @@
+# ============================================
+# 업무 일정 관리 시스템 - SQLite 운영 프로필 (연결별 PRAGMA)
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\sqlite_profile.py
+# ============================================
+#
+# 기본 설정(rollback journal)의 SQLite는 쓰기 중에 읽기까지 막혀, 업로드/일정 수정이 겹치면
+# "database is locked"가 납니다. 새 DBAPI 연결이 만들어질 때마다 아래 PRAGMA를 적용합니다.
+# - journal_mode=WAL: 읽기는 쓰기를 기다리지 않음 (쓰기는 여전히 한 번에 하나)
+# - synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 DB가 깨지지 않음 (전원 차단 시 마지막 커밋만 유실 가능)
+# - busy_timeout: 쓰기 잠금을 바로 실패하지 않고 이 시간까지 기다림
+# - mmap_size, cache_size, temp_store: 읽기 I/O 감소
+# 엔진 클래스에 등록하므로 sqlite3 연결에만 적용하고, 다른 DB는 그대로 둡니다.
+
+import sqlite3
+from typing import Any, List, Tuple
+
+from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 기본값 (create_app에서 설정값으로 덮어씀)
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+DEFAULT_MMAP_SIZE = 256 * 1024 * 1024
+DEFAULT_CACHE_SIZE_KB = 64 * 1024
+
+# 현재 적용할 PRAGMA 목록 (비어 있으면 적용 안 함)
+_pragmas: List[Tuple[str, Any]] = []
+_listening = False
+
+
+def build_pragmas(busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS, mmap_size: int = DEFAULT_MMAP_SIZE,
+                  cache_size_kb: int = DEFAULT_CACHE_SIZE_KB) -> List[Tuple[str, Any]]:
+    """운영 프로필 PRAGMA 목록 (적용 순서대로)"""
+    return [
+        ('journal_mode', 'WAL'),
+        ('synchronous', 'NORMAL'),
+        ('busy_timeout', int(busy_timeout_ms)),
+        ('mmap_size', int(mmap_size)),
+        ('cache_size', -int(cache_size_kb)),  # 음수는 KB 단위
+        ('temp_store', 'MEMORY'),
+    ]
+
+
+def apply_pragmas(dbapi_connection, pragmas: List[Tuple[str, Any]]) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in pragmas:
+            cursor.execute(f'PRAGMA {name} = {value}')
+    finally:
+        cursor.close()
+
+
+def init_sqlite_profile(app: Flask) -> None:
+    """
+    연결 이벤트 등록 (create_app에서 init_db보다 먼저 호출)
+
+    SQLITE_PROFILE이 꺼져 있거나 SQLite가 아니면 PRAGMA를 적용하지 않습니다.
+    """
+    global _pragmas, _listening
+    if not app.config.get('SQLITE_PROFILE') or not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        _pragmas = []
+        return
+
+    _pragmas = build_pragmas(
+        app.config['SQLITE_BUSY_TIMEOUT_MS'],
+        app.config['SQLITE_MMAP_SIZE'],
+        app.config['SQLITE_CACHE_SIZE_KB']
+    )
+    if not _listening:
+        event.listen(Engine, 'connect', _on_connect)
+        _listening = True
+
+
+def _on_connect(dbapi_connection, connection_record) -> None:
+    if _pragmas and isinstance(dbapi_connection, sqlite3.Connection):
+        apply_pragmas(dbapi_connection, _pragmas)
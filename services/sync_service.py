@@ -0,0 +1,203 @@
+# ============================================
+# 업무 일정 관리 시스템 - 일정 증분 동기화 서비스
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\sync_service.py
+# ============================================
+#
+# 클라이언트/외부 동기화 작업이 전체 일정을 다시 받지 않도록
+# 커서 이후에 생성·수정된 일정과 삭제 기록(tombstone)만 돌려줍니다.
+# - 일정: (updated_at, id) 키셋 페이지네이션 (ix_schedules_user_id_updated_at 인덱스)
+# - 삭제: 일정이 삭제되는 flush에서 schedule_tombstones에 ID 기록, tombstone id로 이어 읽기
+# - 커서: 발급 시각과 두 위치를 묶은 불투명 문자열 (base64)
+#   발급 후 보관 기간이 지나면 그 뒤의 삭제 기록이 정리됐을 수 있으므로 만료 (마지막 수정 시각과는 무관)
+# - updated_at/tombstone id는 커밋이 아니라 flush 때 정해지므로, 늦게 커밋된 트랜잭션이 이미 지나간
+#   위치 뒤에 들어올 수 있습니다. 마지막 페이지의 커서는 최근 lag_seconds 구간을 다시 읽도록 되돌려
+#   놓습니다. (같은 일정/삭제가 다시 올 수 있으므로 클라이언트는 id 기준으로 덮어쓰기)
+
+import base64
+import threading
+import time as time_module
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import and_, delete, event, func, insert, or_
+from sqlalchemy.orm import selectinload
+
+from models import db
+from models.schedule import Schedule
+from models.schedule_tombstone import ScheduleTombstone
+
+# 한 번에 돌려줄 최대 건수 (일정, 삭제 각각)
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 1000
+
+# 커밋 지연 대비 다시 읽는 구간 기본값 (초)
+DEFAULT_LAG_SECONDS = 30
+
+# 삭제 기록 정리 주기 (초, 프로세스당)
+PURGE_INTERVAL_SECONDS = 3600
+
+_purge_lock = threading.Lock()
+_last_purge = 0.0
+
+
+class SyncCursorError(ValueError):
+    """잘못되었거나 만료된 커서"""
+
+    def __init__(self, message: str, expired: bool = False):
+        super().__init__(message)
+        self.expired = expired
+
+
+def encode_cursor(issued_at: datetime, updated_at: Optional[datetime], schedule_id: int, tombstone_id: int) -> str:
+    raw = f"{issued_at.isoformat()}|{updated_at.isoformat() if updated_at else ''}|{schedule_id}|{tombstone_id}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, Optional[datetime], int, int]:
+    """커서 → (발급 시각, 마지막 updated_at, 마지막 일정 ID, 마지막 tombstone ID)"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        parts = base64.urlsafe_b64decode(padded).decode('utf-8').split('|')
+    except (ValueError, UnicodeDecodeError):
+        raise SyncCursorError('커서 형식이 올바르지 않습니다.')
+    if len(parts) == 3:
+        # 발급 시각이 없는 이전 형식 - 삭제 기록이 남아 있는지 알 수 없으므로 전체 동기화
+        raise SyncCursorError('커서가 만료되었습니다. 전체 동기화가 필요합니다.', expired=True)
+    try:
+        issued, stamp, schedule_id, tombstone_id = parts
+        return (datetime.fromisoformat(issued), (datetime.fromisoformat(stamp) if stamp else None),
+                int(schedule_id), int(tombstone_id))
+    except ValueError:
+        raise SyncCursorError('커서 형식이 올바르지 않습니다.')
+
+
+class SyncService:
+    """일정 증분 동기화 서비스"""
+
+    @staticmethod
+    def changes(user_id: int, since: str = None, limit: int = DEFAULT_PAGE_SIZE,
+                retention_days: int = 90, lag_seconds: float = DEFAULT_LAG_SECONDS) -> Dict[str, Any]:
+        """
+        커서 이후의 변경분
+
+        Args:
+            user_id: 소유자 ID
+            since: 이전 응답의 cursor (없으면 전체 동기화 - 현재 일정 전체 + 이후 삭제분부터)
+            limit: 페이지 크기
+            retention_days: 삭제 기록 보관 기간 (이보다 먼저 발급된 커서는 전체 동기화 필요)
+            lag_seconds: 마지막 페이지에서 다시 읽을 최근 구간 (늦게 커밋된 변경 대비, 0이면 안 함)
+
+        Returns:
+            {'changes': [일정 dict], 'deleted': [{'id', 'deleted_at'}], 'cursor', 'has_more'}
+
+        Raises:
+            SyncCursorError: 잘못된 커서 또는 보관 기간이 지난 커서 (expired=True)
+        """
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        now = datetime.utcnow()
+
+        if since:
+            issued_at, last_updated, last_schedule_id, last_tombstone_id = decode_cursor(since)
+            # 발급 이후의 삭제 기록은 발급 시각 + 보관 기간까지 남아 있음
+            if issued_at < now - timedelta(days=retention_days):
+                raise SyncCursorError('커서가 만료되었습니다. 전체 동기화가 필요합니다.', expired=True)
+        else:
+            # 전체 동기화: 삭제된 일정은 이미 목록에 없으므로 현재 시점 이후 삭제분부터 추적
+            last_updated, last_schedule_id = None, 0
+            last_tombstone_id = db.session.query(func.coalesce(func.max(ScheduleTombstone.id), 0)).scalar()
+
+        query = Schedule.query.options(selectinload(Schedule.document)).filter(Schedule.user_id == user_id)
+        if last_updated is not None:
+            query = query.filter(or_(
+                Schedule.updated_at > last_updated,
+                and_(Schedule.updated_at == last_updated, Schedule.id > last_schedule_id)
+            ))
+        schedules = query.order_by(Schedule.updated_at.asc(), Schedule.id.asc()).limit(limit + 1).all()
+
+        tombstones = (
+            ScheduleTombstone.query
+            .filter(ScheduleTombstone.user_id == user_id, ScheduleTombstone.id > last_tombstone_id)
+            .order_by(ScheduleTombstone.id.asc())
+            .limit(limit + 1)
+            .all()
+        )
+
+        has_more = len(schedules) > limit or len(tombstones) > limit
+        schedules = schedules[:limit]
+        tombstones = tombstones[:limit]
+
+        if schedules:
+            last_updated, last_schedule_id = schedules[-1].updated_at, schedules[-1].id
+        if tombstones:
+            last_tombstone_id = tombstones[-1].id
+
+        if not has_more and lag_seconds > 0:
+            last_updated, last_schedule_id, last_tombstone_id = SyncService._rewind(
+                user_id, now - timedelta(seconds=lag_seconds), last_updated, last_schedule_id, last_tombstone_id
+            )
+
+        today = date.today()
+        return {
+            'changes': [schedule.to_dict(today) for schedule in schedules],
+            'deleted': [tombstone.to_dict() for tombstone in tombstones],
+            'cursor': encode_cursor(now, last_updated, last_schedule_id, last_tombstone_id),
+            'has_more': has_more,
+        }
+
+    @staticmethod
+    def _rewind(user_id: int, horizon: datetime, last_updated: Optional[datetime], last_schedule_id: int,
+                last_tombstone_id: int) -> Tuple[Optional[datetime], int, int]:
+        """커서 위치를 horizon 이후 변경/삭제의 앞으로 되돌림 (그 구간은 다음 요청에서 다시 읽음)"""
+        if last_updated is not None and last_updated >= horizon:
+            last_updated, last_schedule_id = horizon, 0
+        recent = db.session.query(func.min(ScheduleTombstone.id)).filter(
+            ScheduleTombstone.user_id == user_id,
+            ScheduleTombstone.id <= last_tombstone_id,
+            ScheduleTombstone.deleted_at >= horizon
+        ).scalar()
+        if recent is not None:
+            last_tombstone_id = recent - 1
+        return last_updated, last_schedule_id, last_tombstone_id
+
+    @staticmethod
+    def purge_tombstones(retention_days: int) -> int:
+        """보관 기간이 지난 삭제 기록 정리 (프로세스당 PURGE_INTERVAL_SECONDS마다 1회)"""
+        global _last_purge
+        with _purge_lock:
+            now = time_module.monotonic()
+            if _last_purge and now - _last_purge < PURGE_INTERVAL_SECONDS:
+                return 0
+            _last_purge = now
+
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        result = db.session.execute(delete(ScheduleTombstone).where(ScheduleTombstone.deleted_at < cutoff))
+        db.session.commit()
+        return result.rowcount or 0
+
+
+def init_tombstones() -> None:
+    """세션 flush 이벤트 등록 (create_app에서 한 번 호출)"""
+    if event.contains(db.session, 'before_flush', _before_flush):
+        return
+    event.listen(db.session, 'before_flush', _before_flush)
+    event.listen(db.session, 'after_flush', _after_flush)
+
+
+def _before_flush(session, flush_context, instances) -> None:
+    deleted = [
+        {'schedule_id': obj.id, 'user_id': obj.user_id}
+        for obj in session.deleted
+        if isinstance(obj, Schedule) and obj.id is not None
+    ]
+    if deleted:
+        session.info.setdefault('schedule_tombstones', []).extend(deleted)
+
+
+def _after_flush(session, flush_context) -> None:
+    rows = session.info.pop('schedule_tombstones', None)
+    if rows:
+        now = datetime.utcnow()
+        session.connection().execute(
+            insert(ScheduleTombstone.__table__),
+            [dict(row, deleted_at=now) for row in rows]
+        )
@@ -0,0 +1,187 @@
+# ============================================
+# 업무 일정 관리 시스템 - 태그 색인 서비스
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\tag_service.py
+# ============================================
+#
+# Schedule.tags(쉼표 구분 문자열)를 tags / schedule_tags 테이블로 색인합니다.
+# - 태그 필터: (user_id, name) 유니크 인덱스로 태그를 찾고 schedule_tags로 일정 ID 조회 (LIKE 검색 없음)
+# - 자동완성: 사용자 태그를 이름 앞부분으로 찾아 usage_count 순으로 반환
+# - 색인 갱신: 일정이 추가/수정/삭제되는 flush에서 바뀐 일정의 연결만 고치고 usage_count를 증감
+#   (일괄 INSERT는 flush를 거치지 않으므로 ScheduleService.bulk_create에서 직접 호출)
+
+from collections import Counter
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy import bindparam, delete, event, insert, select, update
+from sqlalchemy.orm import attributes
+
+from models import db
+from models.schedule import Schedule
+from models.tag import Tag, schedule_tags
+
+# 자동완성 최대 반환 수
+MAX_SUGGESTIONS = 20
+
+
+class TagService:
+    """태그 색인 서비스"""
+
+    @staticmethod
+    def suggest(user_id: int, prefix: str = '', limit: int = 10) -> List[dict]:
+        """
+        태그 자동완성
+
+        Args:
+            user_id: 사용자 ID
+            prefix: 입력 중인 태그 앞부분 ('#' 무시, 비어 있으면 많이 쓴 태그)
+            limit: 최대 반환 수
+
+        Returns:
+            [{'name', 'count'}] (사용 횟수 많은 순)
+        """
+        limit = max(1, min(limit, MAX_SUGGESTIONS))
+        query = Tag.query.filter(Tag.user_id == user_id, Tag.usage_count > 0)
+        prefix = prefix.strip().lstrip('#')
+        if prefix:
+            query = query.filter(Tag.name.startswith(prefix, autoescape=True))
+        tags = query.order_by(Tag.usage_count.desc(), Tag.name.asc()).limit(limit).all()
+        return [tag.to_dict() for tag in tags]
+
+    @staticmethod
+    def tag_condition(user_id: int, name: str):
+        """태그가 붙은 일정 조건 (Schedule.id IN 태그 연결 조회)"""
+        tagged = (
+            select(schedule_tags.c.schedule_id)
+            .join(Tag, Tag.id == schedule_tags.c.tag_id)
+            .where(Tag.user_id == user_id, Tag.name == name.strip().lstrip('#'))
+        )
+        return Schedule.id.in_(tagged)
+
+    @staticmethod
+    def sync(connection, schedules: Iterable[Tuple[int, int, str]]) -> None:
+        """
+        일정들의 태그 연결을 tags 문자열에 맞추기
+
+        현재 연결을 한 번에 읽어 문자열과 비교하고, 바뀐 연결만 추가/삭제한 뒤
+        usage_count를 증감합니다. 같은 일정에 다시 실행해도 결과가 같습니다. (백필에 재사용)
+
+        Args:
+            connection: 실행할 연결 (flush 중에는 session.connection())
+            schedules: (일정 ID, 사용자 ID, tags 문자열) 목록 - 삭제된 일정은 tags를 None으로
+        """
+        wanted: Dict[int, Tuple[int, Set[str]]] = {
+            schedule_id: (user_id, set(Tag.parse_names(tags)))
+            for schedule_id, user_id, tags in schedules
+        }
+        if not wanted:
+            return
+
+        current: Dict[int, Dict[str, int]] = {schedule_id: {} for schedule_id in wanted}
+        for row in connection.execute(
+            select(schedule_tags.c.schedule_id, Tag.id, Tag.name)
+            .join(Tag, Tag.id == schedule_tags.c.tag_id)
+            .where(schedule_tags.c.schedule_id.in_(list(wanted)))
+        ):
+            current[row.schedule_id][row.name] = row.id
+
+        removed = [
+            (schedule_id, tag_id)
+            for schedule_id, (_, names) in wanted.items()
+            for name, tag_id in current[schedule_id].items()
+            if name not in names
+        ]
+        added = [
+            (schedule_id, user_id, name)
+            for schedule_id, (user_id, names) in wanted.items()
+            for name in names
+            if name not in current[schedule_id]
+        ]
+        if not removed and not added:
+            return
+
+        tag_ids = TagService._ensure_tags(connection, {(user_id, name) for _, user_id, name in added})
+        added_links = [(schedule_id, tag_ids[(user_id, name)]) for schedule_id, user_id, name in added]
+
+        if removed:
+            connection.execute(
+                delete(schedule_tags).where(
+                    schedule_tags.c.schedule_id == bindparam('sid'),
+                    schedule_tags.c.tag_id == bindparam('tid')
+                ),
+                [{'sid': schedule_id, 'tid': tag_id} for schedule_id, tag_id in removed]
+            )
+        if added_links:
+            connection.execute(
+                insert(schedule_tags),
+                [{'schedule_id': schedule_id, 'tag_id': tag_id} for schedule_id, tag_id in added_links]
+            )
+
+        deltas = Counter(tag_id for _, tag_id in added_links)
+        deltas.subtract(tag_id for _, tag_id in removed)
+        changed = [{'tid': tag_id, 'delta': delta} for tag_id, delta in deltas.items() if delta]
+        if changed:
+            table = Tag.__table__
+            connection.execute(
+                update(table)
+                .where(table.c.id == bindparam('tid'))
+                .values(usage_count=table.c.usage_count + bindparam('delta')),
+                changed
+            )
+
+    @staticmethod
+    def _ensure_tags(connection, keys: Set[Tuple[int, str]]) -> Dict[Tuple[int, str], int]:
+        """(사용자 ID, 이름) → 태그 ID (없는 태그는 usage_count 0으로 생성)"""
+        if not keys:
+            return {}
+        user_ids = {user_id for user_id, _ in keys}
+        names = {name for _, name in keys}
+        found = {
+            (row.user_id, row.name): row.id
+            for row in connection.execute(
+                select(Tag.id, Tag.user_id, Tag.name)
+                .where(Tag.user_id.in_(user_ids), Tag.name.in_(names))
+            )
+        }
+        missing = [{'user_id': user_id, 'name': name, 'usage_count': 0} for user_id, name in keys - found.keys()]
+        if missing:
+            result = connection.execute(insert(Tag.__table__).returning(Tag.id, Tag.user_id, Tag.name), missing)
+            for row in result:
+                found[(row.user_id, row.name)] = row.id
+        return found
+
+
+def init_tag_index() -> None:
+    """세션 flush 이벤트 등록 (create_app에서 한 번 호출)"""
+    if event.contains(db.session, 'before_flush', _before_flush):
+        return
+    event.listen(db.session, 'before_flush', _before_flush)
+    event.listen(db.session, 'after_flush', _after_flush)
+
+
+def _before_flush(session, flush_context, instances) -> None:
+    # 삭제되는 일정의 연결은 일정 행보다 먼저 지움 (외래키를 검사하는 DB 대비)
+    deleted = [
+        (obj.id, obj.user_id, None)
+        for obj in session.deleted
+        if isinstance(obj, Schedule) and obj.id is not None
+    ]
+    if deleted:
+        TagService.sync(session.connection(), deleted)
+
+    # 새 일정은 flush 후에야 ID가 정해지므로 객체를 모아 두었다가 after_flush에서 색인
+    changed = [obj for obj in session.new if isinstance(obj, Schedule) and obj.tags]
+    changed.extend(
+        obj for obj in session.dirty
+        if isinstance(obj, Schedule) and attributes.get_history(obj, 'tags').has_changes()
+    )
+    if changed:
+        session.info.setdefault('tagged_schedules', []).extend(changed)
+
+
+def _after_flush(session, flush_context) -> None:
+    changed = session.info.pop('tagged_schedules', None)
+    if changed:
+        TagService.sync(
+            session.connection(),
+            [(obj.id, obj.user_id, obj.tags) for obj in changed if obj.id is not None]
+        )
@@ -0,0 +1,111 @@
+# ============================================
+# 업무 일정 관리 시스템 - 로그인 사용자 캐시
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\user_cache.py
+# ============================================
+#
+# login_manager.user_loader가 요청마다 사용자를 조회하고, 화면에서 current_user.company/team을
+# 읽을 때 쿼리가 더 나가지 않도록 사용자/회사/팀 행을 프로세스 메모리에 TTL 동안 보관합니다.
+# - 캐시에는 세션과 분리된(detached) 사본을 두고, 요청마다 session.merge(load=False)로 붙임
+#   (SELECT 없이 식별 맵에 등록되고, user.company / user.team은 로딩된 상태로 채워 둠)
+# - 권한/소속 변경은 CompanyService / TeamService에서 해당 사용자를 무효화
+# - 다른 프로세스에서 바뀐 내용은 TTL이 지나면 반영됩니다.
+# - 비밀번호 해시는 캐시하지 않음 (필요할 때 해당 컬럼만 조회)
+
+import threading
+import time
+from typing import Dict, NamedTuple, Optional
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import joinedload, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from models import db
+from models.user import User
+
+# 기본 보관 시간 (초)
+DEFAULT_TTL = 60
+
+# 캐시하지 않는 사용자 컬럼
+EXCLUDED_COLUMNS = {'password_hash'}
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    user: User
+    company: Optional[object]
+    team: Optional[object]
+
+
+def _detached_copy(obj, exclude=()):
+    """ORM 객체 → 세션과 무관한 사본 (컬럼 값만 복사, 관계는 비워 둠)"""
+    if obj is None:
+        return None
+    mapper = inspect(obj).mapper
+    copy = mapper.class_manager.new_instance()
+    for attr in mapper.column_attrs:
+        if attr.key not in exclude:
+            setattr(copy, attr.key, getattr(obj, attr.key))
+    make_transient_to_detached(copy)
+    return copy
+
+
+class UserCache:
+    """사용자 ID → (사용자, 회사, 팀) 사본 TTL 캐시 (스레드 안전)"""
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[int, _Entry] = {}
+
+    def configure(self, ttl: float) -> None:
+        """보관 시간 설정 (0이면 캐시 사용 안 함)"""
+        self.ttl = ttl
+        self.clear()
+
+    def load(self, user_id: int) -> Optional[User]:
+        """
+        현재 세션에 붙은 사용자 (캐시가 유효하면 쿼리 없음)
+
+        캐시가 없거나 만료되면 사용자 + 회사 + 팀을 JOIN 쿼리 1회로 읽어 캐시합니다.
+        """
+        session = db.session
+        if self.ttl > 0:
+            with self._lock:
+                entry = self._entries.get(user_id)
+            if entry is not None and entry.expires_at > time.monotonic():
+                user = session.merge(entry.user, load=False)
+                # 관계를 '이미 로딩됨'으로 채워 두면 user.company / user.team 접근에 쿼리가 없고,
+                # 사용자가 참조를 잡고 있으므로 요청 동안 식별 맵(약한 참조)에서도 사라지지 않음
+                for key, related in (('company', entry.company), ('team', entry.team)):
+                    merged = session.merge(related, load=False) if related is not None else None
+                    set_committed_value(user, key, merged)
+                return user
+
+        user = session.get(User, user_id, options=[joinedload(User.company), joinedload(User.team)])
+        if user is not None and self.ttl > 0:
+            entry = _Entry(
+                time.monotonic() + self.ttl,
+                _detached_copy(user, EXCLUDED_COLUMNS),
+                _detached_copy(user.company),
+                _detached_copy(user.team)
+            )
+            with self._lock:
+                self._entries[user_id] = entry
+        return user
+
+    def invalidate(self, user_id: int) -> None:
+        """사용자 1명 무효화 (권한/소속 변경 후)"""
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# 전역 캐시
+user_cache = UserCache()
@@ -0,0 +1,124 @@
+# ============================================
+# 업무 일정 관리 시스템 - 단일 쓰기 큐
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\services\write_queue.py
+# ============================================
+#
+# SQLite는 쓰기를 한 번에 하나만 허용하므로, 여러 요청 스레드가 동시에 큰 INSERT를 시작하면
+# 서로 잠금을 기다리며 busy_timeout 안에서 재시도하다가 "database is locked"로 실패합니다.
+# 쓰기가 많은 경로(문서 업로드 저장, 일정 일괄 가져오기)는 이 큐의 전용 스레드 하나에서 순서대로 실행해
+# 프로세스 안의 쓰기 경쟁을 없애고, 요청 스레드는 결과만 기다립니다. (읽기는 큐를 거치지 않음)
+# - 작업마다 새 앱 컨텍스트(새 db.session)에서 실행 → 인자/반환값은 ID, dict 같은 일반 값만 사용
+# - 작업 안에서 커밋까지 마쳐야 하며, 예외가 나면 롤백 후 호출한 쪽에서 같은 예외 발생
+# - 다른 프로세스와의 경쟁은 busy_timeout(SQLite 프로필)이 처리
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+from flask import Flask
+
+from models import db
+
+# 기본 설정 (create_app에서 configure로 덮어씀)
+DEFAULT_MAX_PENDING = 64
+DEFAULT_TIMEOUT = 30.0
+
+
+class WriteQueueFull(RuntimeError):
+    """대기 중인 쓰기 작업이 너무 많음"""
+
+
+class WriteQueue:
+    """전용 스레드 하나에서 쓰기 작업을 순서대로 실행"""
+
+    def __init__(self, max_pending: int = DEFAULT_MAX_PENDING, timeout: float = DEFAULT_TIMEOUT):
+        self.enabled = False
+        self.timeout = timeout
+        self._app: Optional[Flask] = None
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def configure(self, app: Optional[Flask], enabled: bool, max_pending: int = DEFAULT_MAX_PENDING,
+                  timeout: float = DEFAULT_TIMEOUT) -> None:
+        """
+        앱과 설정 연결 (create_app에서 호출)
+
+        Args:
+            app: 작업마다 앱 컨텍스트를 열 앱 (None이면 컨텍스트 없이 실행 - 벤치마크 등)
+            enabled: False면 run()이 현재 스레드에서 바로 실행
+        """
+        with self._lock:
+            self._app = app
+            self.enabled = enabled
+            self.timeout = timeout
+            if self._thread is None:
+                self._queue = queue.Queue(maxsize=max(1, max_pending))
+
+    def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        func(*args, **kwargs)를 쓰기 스레드에서 실행하고 결과 반환
+
+        Raises:
+            WriteQueueFull: timeout 안에 큐에 넣지 못함
+            func가 던진 예외
+        """
+        if not self.enabled or threading.current_thread() is self._thread:
+            return func(*args, **kwargs)
+
+        self._ensure_worker()
+        future: Future = Future()
+        try:
+            self._queue.put((future, func, args, kwargs), timeout=self.timeout)
+        except queue.Full:
+            raise WriteQueueFull('저장 요청이 많습니다. 잠시 후 다시 시도해주세요.')
+        return future.result()
+
+    def submit(self, func: Callable[..., Any], *args, **kwargs) -> Optional[Future]:
+        """
+        func를 쓰기 스레드에 넣고 기다리지 않음 (읽기 요청에서 미루는 갱신 작업용)
+
+        enabled와 관계없이 항상 쓰기 스레드에서 실행합니다. 큐가 차 있으면 넣지 않고 None.
+        """
+        self._ensure_worker()
+        future: Future = Future()
+        try:
+            self._queue.put_nowait((future, func, args, kwargs))
+        except queue.Full:
+            return None
+        return future
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._worker, name='db-writer', daemon=True)
+                self._thread.start()
+
+    def _worker(self) -> None:
+        while True:
+            future, func, args, kwargs = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                if self._app is not None:
+                    with self._app.app_context():
+                        result = self._call(func, args, kwargs)
+                else:
+                    result = func(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _call(func, args, kwargs):
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            db.session.rollback()
+            raise
+
+
+# 전역 쓰기 큐
+write_queue = WriteQueue()
@@ -12,6 +12,9 @@ document.addEventListener('DOMContentLoaded', function() {
     // 캘린더 초기화
     initCalendar();
     
+    // 일정 변경 실시간 반영 (SSE)
+    connectScheduleEvents();
+    
     // 자동으로 알림 메시지 숨기기 (5초 후)
     setTimeout(function() {
         const flashMessages = document.querySelectorAll('.flash-message');
@@ -54,21 +57,148 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
     
-    // 일정 아이템 클릭 이벤트
-    const scheduleItems = document.querySelectorAll('.schedule-item');
-    scheduleItems.forEach(function(item) {
-        item.addEventListener('click', function(e) {
+    // 태그 자동완성
+    document.querySelectorAll('[data-tag-input]').forEach(initTagAutocomplete);
+    
+    // 일정 아이템 클릭 이벤트 ('더 보기'로 추가된 항목도 처리하도록 목록에 한 번만 등록)
+    const scheduleList = document.getElementById('schedule-list');
+    if (scheduleList) {
+        scheduleList.addEventListener('click', function(e) {
             // 버튼 클릭은 제외
             if (e.target.closest('.schedule-actions')) return;
             
-            const scheduleId = this.dataset.id;
-            if (scheduleId) {
-                viewSchedule(scheduleId);
+            const item = e.target.closest('.schedule-item');
+            if (item && item.dataset.id) {
+                viewSchedule(item.dataset.id);
             }
         });
-    });
+    }
 });
 
+// 태그 입력 자동완성 - 쉼표 구분 입력(multi)은 마지막 태그만 완성
+function initTagAutocomplete(input) {
+    const datalist = document.getElementById('tag-suggestions');
+    if (!datalist) return;
+    let timer = null;
+    
+    input.addEventListener('input', function() {
+        clearTimeout(timer);
+        timer = setTimeout(function() {
+            const parts = input.value.split(',');
+            const prefix = input.dataset.tagInput === 'multi' ? parts.pop().trim() : input.value.trim();
+            const head = input.dataset.tagInput === 'multi' && parts.length ? parts.join(',') + ', ' : '';
+            
+            fetch('/api/tags?q=' + encodeURIComponent(prefix))
+                .then(response => response.json())
+                .then(data => {
+                    if (!data.success) return;
+                    datalist.innerHTML = data.tags
+                        .map(tag => `<option value="${escapeHtml(head + tag.name)}">${tag.count}</option>`)
+                        .join('');
+                });
+        }, 200);
+    });
+}
+
+// 일정 목록 다음 페이지 (같은 필터, 커서로 이어 읽기)
+function loadMoreSchedules() {
+    const button = document.getElementById('schedule-more');
+    if (!button || button.disabled) return;
+    button.disabled = true;
+    
+    const params = new URLSearchParams(button.dataset.filters);
+    params.set('cursor', button.dataset.cursor);
+    
+    fetch('/api/dashboard/schedules?' + params.toString())
+        .then(response => response.json())
+        .then(data => {
+            if (!data.success) {
+                alert(data.message);
+                button.disabled = false;
+                return;
+            }
+            const list = document.getElementById('schedule-list');
+            list.insertAdjacentHTML('beforeend', data.schedules.map(renderScheduleItem).join(''));
+            if (data.has_more) {
+                button.dataset.cursor = data.next_cursor;
+                button.disabled = false;
+            } else {
+                button.remove();
+            }
+        })
+        .catch(() => { button.disabled = false; });
+}
+
+// 일정 목록 항목 (dashboard.html의 목록과 같은 구조)
+function renderScheduleItem(schedule) {
+    const days = schedule.days_left;
+    const badge = days < 0
+        ? '<span class="urgency-badge overdue">지연</span>'
+        : `<span class="urgency-badge ${getUrgencyClass(days)}">D-${days}</span>`;
+    const source = schedule.document_filename
+        ? `📄 ${escapeHtml(schedule.document_filename)}`
+        : '✏️ 직접 입력';
+    const completed = schedule.is_completed ? 'completed' : '';
+    return `
+        <div class="schedule-item" data-id="${schedule.id}" style="border-left-color: ${schedule.urgency_color};">
+            <div class="schedule-urgency">${badge}</div>
+            <div class="schedule-content">
+                <div class="schedule-title ${completed}">${escapeHtml(schedule.title)}</div>
+                <div class="schedule-meta">${source} | ${formatDate(schedule.due_date)}</div>
+            </div>
+        </div>`;
+}
+
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text == null ? '' : text;
+    return div.innerHTML;
+}
+
+// 일정 변경 실시간 반영 - 전체를 다시 받지 않고 바뀐 일정만 캘린더에 적용
+function connectScheduleEvents() {
+    if (!window.EventSource || !document.getElementById('calendar')) return;
+    
+    const stream = new EventSource('/api/events');
+    stream.addEventListener('schedule', function(e) {
+        applyScheduleDelta(JSON.parse(e.data));
+    });
+    stream.addEventListener('team', function() {
+        document.dispatchEvent(new CustomEvent('team-schedules-changed'));
+        if (document.getElementById('team-schedule-list')) {
+            loadTeamSchedules();
+        }
+    });
+    stream.addEventListener('resync', function() {
+        const cal = currentCalendar();
+        if (cal) cal.refetchEvents();
+    });
+}
+
+function currentCalendar() {
+    return window.calendar || calendar;
+}
+
+function applyScheduleDelta(data) {
+    const cal = currentCalendar();
+    if (!cal) return;
+    
+    // 반복 일정(삭제 포함), 일괄 추가는 보이는 기간만 다시 조회
+    if (data.recurring || (data.action !== 'deleted' && !data.event)) {
+        cal.refetchEvents();
+        return;
+    }
+    
+    // 같은 id의 이벤트를 모두 제거 (getEventById는 첫 번째만 반환)
+    cal.getEvents()
+        .filter(function(item) { return item.id === String(data.id); })
+        .forEach(function(item) { item.remove(); });
+    if (data.event) {
+        // 이벤트 소스에 넣어야 이후 refetchEvents 때 중복되지 않음
+        cal.addEvent(data.event, cal.getEventSources()[0] || true);
+    }
+}
+
 // 캘린더 초기화
 function initCalendar() {
     const calendarEl = document.getElementById('calendar');
@@ -442,6 +572,23 @@ styleSheet.textContent = `
     .time-fields {
         gap: 1rem;
     }
+    
+    .schedule-filters {
+        display: flex;
+        flex-wrap: wrap;
+        gap: 0.4rem;
+        margin-bottom: 0.8rem;
+    }
+    
+    .schedule-filters select,
+    .schedule-filters input {
+        padding: 0.3rem 0.4rem;
+        font-size: 0.8rem;
+    }
+    
+    .schedule-filters input[type="text"] {
+        width: 6rem;
+    }
 `;
 document.head.appendChild(styleSheet);
 
@@ -0,0 +1,68 @@
+# ============================================
+# 업무 일정 관리 시스템 - 테스트 공통 설정
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\conftest.py
+# ============================================
+#
+# 앱 모듈(app.py)은 import 시점에 설정을 읽어 앱을 만들므로,
+# import 전에 임시 DB 경로와 테스트용 설정을 환경변수로 지정합니다.
+# 실행: python -m pytest -q
+
+import contextlib
+import io
+import itertools
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+TMP_DIR = tempfile.mkdtemp(prefix='schedule_tests_')
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(TMP_DIR, 'db', 'app.db')
+os.environ['BCRYPT_LOG_ROUNDS'] = '4'
+os.environ['PASSWORD_HASH_WORKERS'] = '2'
+os.environ['AUTO_MIGRATE'] = 'true'  # 테스트는 프로세스 1개라 시작 시 임시 DB를 바로 생성
+os.environ.pop('GROQ_API_KEY', None)
+os.environ.pop('DATABASE_REPLICA_URL', None)
+
+PASSWORD = 'pass1234'
+
+_usernames = itertools.count(1)
+
+
+@pytest.fixture(scope='session')
+def app():
+    with contextlib.redirect_stdout(io.StringIO()):
+        import app as app_module
+    flask_app = app_module.app
+    flask_app.config.update(TESTING=True, UPLOAD_FOLDER=os.path.join(TMP_DIR, 'uploads'))
+    os.makedirs(flask_app.config['UPLOAD_FOLDER'], exist_ok=True)
+    return flask_app
+
+
+@pytest.fixture
+def db(app):
+    from models import db as database
+    with app.app_context():
+        yield database
+        database.session.remove()
+
+
+@pytest.fixture
+def login(app):
+    """새 사용자를 가입시키고 로그인한 test client 반환 (login() 또는 login(username, **가입 폼))"""
+    def _login(username=None, **form):
+        username = username or f'user{next(_usernames)}'
+        client = app.test_client()
+        client.post('/register', data=dict(
+            username=username, email=f'{username}@example.com',
+            password=PASSWORD, password_confirm=PASSWORD, **form
+        ))
+        response = client.post('/login', data={'username': username, 'password': PASSWORD})
+        assert response.status_code == 302, response.get_data(as_text=True)[:200]
+        client.username = username
+        return client
+    return _login
@@ -0,0 +1,96 @@
+# ============================================
+# 업무 일정 관리 시스템 - AI 응답 검증 / JSON 모드 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_ai_extractor.py
+# ============================================
+
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from services.ai_extractor import AIScheduleExtractor, ScheduleItemValidator
+
+
+class FakeError(Exception):
+    def __init__(self, message, status_code=400):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class FakeClient:
+    """chat.completions.create 호출을 기록하고, 준비된 결과(예외 또는 문자열)를 순서대로 반환"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def create(self, **params):
+        self.calls.append(params)
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=result))])
+
+
+def make_extractor(client):
+    extractor = AIScheduleExtractor(api_key='test')
+    extractor.client = client
+    extractor._api_ready = True
+    return extractor
+
+
+def test_validator_normalizes_aliases_and_types():
+    item = {'날짜': '2099-03-05', '제목': 123, '유형': '회의'}
+    fields = ScheduleItemValidator().normalize(item)
+    assert fields == {'date': date(2099, 3, 5), 'title': '123', 'description': None, 'type': 'meeting'}
+
+
+def test_validator_rejects_missing_or_bad_dates():
+    validator = ScheduleItemValidator()
+    assert validator.normalize({'title': 'x'}) is None
+    assert validator.normalize({'date': '2099-02-30', 'title': 'x'}) is None
+    assert validator.normalize(['not', 'a', 'dict']) is None
+
+
+def test_parse_response_skips_invalid_items():
+    future = (date.today() + timedelta(days=10)).isoformat()
+    response = '{"schedules": [{"title": "보고서", "date": "%s", "type": "submit"}, {"title": "no date"}]}' % future
+    schedules = make_extractor(FakeClient())._parse_ai_response(response)
+    assert [s['schedule_type'] for s in schedules] == ['submit']
+
+
+def test_json_validate_failed_is_retried_without_disabling_json_mode():
+    client = FakeClient(FakeError("Error code: 400 - {'code': 'json_validate_failed'}"), '{"schedules": []}')
+    extractor = make_extractor(client)
+    assert extractor._request_completion('prompt') == '{"schedules": []}'
+    assert extractor._json_mode is True
+    assert all('response_format' in call for call in client.calls)
+
+
+def test_repeated_generation_failure_falls_back_for_one_call_only():
+    failure = FakeError("Error code: 400 - {'code': 'json_validate_failed'}")
+    client = FakeClient(failure, failure, 'plain', '{"schedules": []}')
+    extractor = make_extractor(client)
+    assert extractor._request_completion('prompt') == 'plain'
+    assert 'response_format' not in client.calls[2]
+    assert extractor._json_mode is True
+    extractor._request_completion('prompt')
+    assert 'response_format' in client.calls[3]
+
+
+def test_unsupported_response_format_disables_json_mode():
+    client = FakeClient(FakeError("Error code: 400 - 'response_format' is not supported"), 'plain', 'plain')
+    extractor = make_extractor(client)
+    assert extractor._request_completion('prompt') == 'plain'
+    assert extractor._json_mode is False
+    extractor._request_completion('prompt')
+    assert 'response_format' not in client.calls[2]
+
+
+def test_other_errors_propagate():
+    client = FakeClient(FakeError('connection reset', status_code=None))
+    extractor = make_extractor(client)
+    with pytest.raises(FakeError):
+        extractor._request_completion('prompt')
+    assert extractor._json_mode is True
@@ -0,0 +1,30 @@
+# ============================================
+# 업무 일정 관리 시스템 - 일정 충돌 확인 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_availability.py
+# ============================================
+
+
+def add_schedule(client, title, **form):
+    data = {'title': title, 'task_description': title, 'due_date': '2099-05-10'}
+    data.update(form)
+    client.post('/schedule/add', data=data)
+
+
+def conflict_titles(client, title):
+    from models.schedule import Schedule
+
+    schedule = Schedule.query.filter_by(title=title).one()
+    response = client.get(f'/api/schedule/{schedule.id}/conflicts?scope=self')
+    return sorted(item['title'] for entry in response.get_json()['conflicts'] for item in entry['conflicts'])
+
+
+def test_all_day_schedule_is_compared_with_all_day_items(login, db):
+    client = login()
+    add_schedule(client, '충돌 워크숍', is_all_day='on')
+    add_schedule(client, '충돌 출장', is_all_day='on')
+    add_schedule(client, '충돌 회의', start_time='10:00', end_time='11:00')
+
+    # 기준 일정이 종일이면 ?all_day=1 없이도 다른 종일 일정과 비교
+    assert conflict_titles(client, '충돌 워크숍') == ['충돌 출장', '충돌 회의']
+    # 시간 지정 일정은 기본적으로 종일 일정과 비교하지 않음
+    assert conflict_titles(client, '충돌 회의') == []
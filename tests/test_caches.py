@@ -0,0 +1,122 @@
+# ============================================
+# 업무 일정 관리 시스템 - 로그인 사용자 / 조직도 캐시 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_caches.py
+# ============================================
+
+import contextlib
+
+from sqlalchemy import event
+
+from models import db
+from services.org_cache import org_cache
+from services.user_cache import user_cache
+
+
+@contextlib.contextmanager
+def count_queries():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record)
+    try:
+        yield statements
+    finally:
+        event.remove(db.engine, 'before_cursor_execute', record)
+
+
+def user_id_of(client):
+    from models.user import User
+    return User.query.filter_by(username=client.username).one().id
+
+
+def test_user_cache_serves_user_and_company_without_queries(app, login):
+    from models.user import User
+    from services.company_service import CompanyService
+
+    admin_client, member_client = login(), login()
+    with app.app_context():
+        admin_id, member_id = user_id_of(admin_client), user_id_of(member_client)
+        success, _, company = CompanyService.create_company('캐시 회사', db.session.get(User, admin_id))
+        assert success
+        code = company.code
+
+    with app.app_context():
+        user_cache.invalidate(member_id)
+        user_cache.load(member_id)
+        # 비밀번호 해시는 캐시하지 않음
+        assert 'password_hash' not in user_cache._entries[member_id].user.__dict__
+
+    with app.app_context(), count_queries() as statements:
+        user = user_cache.load(member_id)
+        assert user.company is None
+    assert statements == []
+
+    with app.app_context():
+        success, _, _ = CompanyService.join_company(code, user_cache.load(member_id))
+        assert success
+
+    # 가입 후 무효화되어 새 소속이 보임
+    with app.app_context():
+        assert user_cache.load(member_id).company.name == '캐시 회사'
+    with app.app_context(), count_queries() as statements:
+        assert user_cache.load(member_id).company.name == '캐시 회사'
+    assert statements == []
+
+
+def test_org_cache_invalidated_on_commit_not_on_rollback(app, login):
+    from models.company import Company
+    from models.team import Team
+    from models.user import User
+
+    client = login()
+    with app.app_context():
+        user_id = user_id_of(client)
+        company = Company(name='조직도 회사')
+        db.session.add(company)
+        db.session.flush()
+        team = Team(company_id=company.id, name='조직도 팀')
+        db.session.add(team)
+        db.session.commit()
+        team_id = team.id
+
+        snapshot = org_cache.get()
+        assert org_cache.get() is snapshot
+        assert user_id not in snapshot.team_member_ids(team_id)
+
+        # 롤백한 변경은 캐시를 건드리지 않음
+        db.session.get(User, user_id).team_id = team_id
+        db.session.flush()
+        db.session.rollback()
+        assert org_cache.get() is snapshot
+
+        db.session.get(User, user_id).team_id = team_id
+        db.session.commit()
+        refreshed = org_cache.get()
+        assert refreshed is not snapshot
+        assert user_id in refreshed.team_member_ids(team_id)
+
+
+def test_org_cache_change_survives_failed_savepoint(app, login):
+    import pytest
+    from sqlalchemy.exc import IntegrityError
+
+    from models.company import Company
+    from models.user import User
+
+    client = login()
+    with app.app_context():
+        user_id = user_id_of(client)
+        snapshot = org_cache.get()
+        db.session.get(User, user_id).department = '세이브포인트'
+        db.session.flush()
+        taken = Company(name='중복 코드 회사', code='DUPCODE1')
+        db.session.add(taken)
+        db.session.flush()
+        with pytest.raises(IntegrityError):
+            with db.session.begin_nested():
+                db.session.add(Company(name='중복 코드 회사 2', code='DUPCODE1'))
+        db.session.commit()
+        assert org_cache.get() is not snapshot
+        assert user_id in org_cache.get().department_member_ids('세이브포인트')
@@ -0,0 +1,55 @@
+# ============================================
+# 업무 일정 관리 시스템 - 회사/팀 코드 충돌 재시도 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_company_service.py
+# ============================================
+
+import secrets
+
+import pytest
+
+
+def colliding_codes(existing_code, retry_code):
+    """첫 호출은 이미 있는 코드, 이후는 새 코드"""
+    codes = iter([existing_code])
+    return lambda *args, **kwargs: next(codes, retry_code)
+
+
+@pytest.mark.parametrize('kind', ['company', 'team'])
+def test_code_collision_retries_in_savepoint(login, db, monkeypatch, kind):
+    from models.company import Company
+    from models.team import Team
+    from models.user import User
+    from services.company_service import CompanyService, TeamService
+
+    admin = db.session.execute(db.select(User).filter_by(username=login().username)).scalar_one()
+    existing = Company(name=f'기존 {secrets.token_hex(4)}')
+    db.session.add(existing)
+    db.session.commit()
+    company_id = existing.id
+
+    if kind == 'company':
+        existing_code, model = existing.code, Company
+    else:
+        other = Team(company_id=company_id, name='기존 팀')
+        db.session.add(other)
+        db.session.commit()
+        existing_code, model = other.code, Team
+    retry_code = secrets.token_hex(3).upper()
+    monkeypatch.setattr(model, 'generate_code', staticmethod(colliding_codes(existing_code, retry_code)))
+
+    # 바깥 트랜잭션에 먼저 들어간 변경 (SAVEPOINT 롤백으로 사라지면 안 됨)
+    admin.department = '기획팀'
+    if kind == 'company':
+        success, message, created = CompanyService.create_company(f'새 회사 {retry_code}', admin)
+        expected_role = User.ROLE_ADMIN
+    else:
+        success, message, created = TeamService.create_team(company_id, '새 팀', leader_user=admin)
+        expected_role = User.ROLE_TEAM_LEADER
+    assert success, message
+    created_id, admin_id = created.id, admin.id
+
+    db.session.remove()
+    assert db.session.get(model, created_id).code == retry_code
+    admin = db.session.get(User, admin_id)
+    assert admin.role == expected_role
+    assert admin.department == '기획팀'
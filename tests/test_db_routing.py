@@ -0,0 +1,84 @@
+# ============================================
+# 업무 일정 관리 시스템 - 읽기 복제본 라우팅 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_db_routing.py
+# ============================================
+#
+# 주 DB와 복제본을 서로 다른 SQLite 파일로 두고, 같은 id의 사용자 이름을 다르게 넣어
+# 어느 DB에서 읽었는지 구분합니다.
+
+import pytest
+from flask import Flask
+from sqlalchemy import event
+
+from config import Config
+from models import REPLICA_BIND, db, load_models
+from services import db_routing
+
+
+@pytest.fixture
+def routed_app(app, tmp_path, monkeypatch):
+    from models.user import User
+
+    # init_db_routing이 바꾸는 모듈 전역과 세션 이벤트는 테스트 후 원래대로
+    monkeypatch.setattr(db_routing, '_replica_enabled', db_routing._replica_enabled)
+    monkeypatch.setattr(db_routing, '_sticky_seconds', db_routing._sticky_seconds)
+    had_listeners = event.contains(db.session, 'after_flush', db_routing._after_flush)
+
+    routed = Flask('routing_test')
+    routed.config.from_object(Config)
+    routed.config.update(
+        SQLALCHEMY_DATABASE_URI=f"sqlite:///{tmp_path / 'primary.db'}",
+        DATABASE_REPLICA_URL=f"sqlite:///{tmp_path / 'replica.db'}",
+        SQLALCHEMY_ENGINE_OPTIONS={},
+        SQLALCHEMY_BINDS={},
+    )
+    db_routing.init_db_routing(routed)
+    db.init_app(routed)
+    load_models()
+
+    with routed.app_context():
+        for bind_key, username in ((None, 'primary'), (REPLICA_BIND, 'replica')):
+            engine = db.engines[bind_key]
+            db.metadata.create_all(engine)
+            with engine.begin() as connection:
+                connection.execute(User.__table__.insert().values(
+                    id=1, username=username, email=f'{username}@example.com', password_hash='x'
+                ))
+
+    @routed.route('/read')
+    @db_routing.read_replica
+    def read():
+        return db.session.get(User, 1).username
+
+    @routed.route('/write', methods=['POST'])
+    def write():
+        db.session.get(User, 1).department = '기획'
+        db.session.commit()
+        return 'ok'
+
+    yield routed
+
+    if not had_listeners:
+        event.remove(db.session, 'after_flush', db_routing._after_flush)
+        event.remove(db.session, 'do_orm_execute', db_routing._do_orm_execute)
+
+
+def test_reads_go_to_replica_until_user_writes(routed_app, monkeypatch):
+    client = routed_app.test_client()
+    assert client.get('/read').get_data(as_text=True) == 'replica'
+
+    now = [1000.0]
+    monkeypatch.setattr(db_routing.time, 'time', lambda: now[0])
+    assert client.post('/write').get_data(as_text=True) == 'ok'
+    # 쓰기 직후에는 주 DB에서 읽음 (복제 지연 대비), 다른 사용자는 그대로 복제본
+    assert client.get('/read').get_data(as_text=True) == 'primary'
+    assert routed_app.test_client().get('/read').get_data(as_text=True) == 'replica'
+
+    now[0] += routed_app.config['DATABASE_REPLICA_STICKY_SECONDS'] + 1
+    assert client.get('/read').get_data(as_text=True) == 'replica'
+
+    with routed_app.app_context():
+        with db.engines[None].connect() as connection:
+            assert connection.exec_driver_sql('SELECT department FROM users').scalar() == '기획'
+        with db.engines[REPLICA_BIND].connect() as connection:
+            assert connection.exec_driver_sql('SELECT department FROM users').scalar() is None
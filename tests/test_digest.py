@@ -0,0 +1,100 @@
+# ============================================
+# 업무 일정 관리 시스템 - 팀원 일정 요약 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_digest.py
+# ============================================
+
+import json
+import threading
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+
+def join_team(db, *clients):
+    from models.company import Company
+    from models.team import Team
+    from models.user import User
+
+    company = Company(name='요약 테스트 회사')
+    db.session.add(company)
+    db.session.flush()
+    team = Team(company_id=company.id, name='요약 테스트 팀')
+    db.session.add(team)
+    db.session.flush()
+    users = [User.query.filter_by(username=client.username).one() for client in clients]
+    for user in users:
+        user.company_id = company.id
+        user.team_id = team.id
+    db.session.commit()
+    return users
+
+
+def add_schedule(client, title, due_date):
+    response = client.post('/schedule/add', data={
+        'title': title, 'task_description': '내용', 'due_date': due_date.isoformat(), 'is_all_day': 'on',
+    })
+    assert response.status_code == 302
+
+
+def test_digest_is_rebuilt_on_write_and_read_only_on_get(app, login):
+    from models import db
+    from models.upcoming_digest import UpcomingDigest
+
+    # 요청마다 자기 앱 컨텍스트(세션, g)를 쓰도록 DB 확인은 요청 사이에 따로 컨텍스트를 엶
+    writer, reader = login(), login()
+    with app.app_context():
+        author_id = join_team(db, writer, reader)[0].id
+    due = date.today() + timedelta(days=3)
+    expected = [{'title': '보고서 제출', 'due_date': due.isoformat()}]
+
+    add_schedule(writer, '보고서 제출', due)
+    with app.app_context():
+        digest = db.session.get(UpcomingDigest, author_id)
+        assert json.loads(digest.items) == expected
+        assert digest.digest_date == date.today()
+        # 날짜가 지난 요약은 조회 때 계산만 하고 저장하지 않음
+        digest.digest_date = date.today() - timedelta(days=1)
+        db.session.commit()
+
+    flushes = []
+
+    def record_flush(session, flush_context, instances):
+        # 쓰기 큐 스레드의 저장은 제외하고 요청 스레드의 쓰기만 기록
+        if threading.current_thread().name != 'db-writer':
+            flushes.append(list(session.dirty) + list(session.new))
+
+    event.listen(db.session, 'before_flush', record_flush)
+    try:
+        payload = reader.get('/api/team-schedules').get_json()
+    finally:
+        event.remove(db.session, 'before_flush', record_flush)
+    assert payload['team_schedules'] == {writer.username: expected}
+    assert flushes == []
+
+    # 저장은 쓰기 큐 스레드에서 (다음 조회부터는 다시 계산하지 않음)
+    deadline = time.monotonic() + 5
+    while True:
+        with app.app_context():
+            if db.session.get(UpcomingDigest, author_id).digest_date == date.today():
+                break
+        assert time.monotonic() < deadline, '요약이 갱신되지 않음'
+        time.sleep(0.01)
+
+
+def test_refresh_digests_command_updates_stale_dates(app, login):
+    from models import db
+    from models.upcoming_digest import UpcomingDigest
+    from models.user import User
+
+    client = login()
+    add_schedule(client, '주간 보고', date.today() + timedelta(days=1))
+    with app.app_context():
+        user_id = User.query.filter_by(username=client.username).one().id
+        db.session.get(UpcomingDigest, user_id).digest_date = date.today() - timedelta(days=1)
+        db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=['refresh-digests'])
+    assert result.exit_code == 0, result.output
+    with app.app_context():
+        assert db.session.get(UpcomingDigest, user_id).digest_date == date.today()
@@ -0,0 +1,71 @@
+# ============================================
+# 업무 일정 관리 시스템 - 일정 변경 실시간 알림 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_events.py
+# ============================================
+
+from datetime import date
+
+import pytest
+
+from services import events
+
+
+@pytest.fixture
+def owner(app, login):
+    from models.user import User
+
+    client = login()
+    with app.app_context():
+        user_id = User.query.filter_by(username=client.username).one().id
+    subscription = events.broker.subscribe([f'user:{user_id}'])
+    yield user_id, subscription
+    events.broker.unsubscribe(subscription)
+
+
+def drain(subscription):
+    messages = []
+    while True:
+        message = subscription.get(timeout=0)
+        if message is None:
+            return messages
+        messages.append(message)
+
+
+def test_deleting_recurring_schedule_asks_for_refetch(app, owner):
+    from models import db
+    from models.schedule import Schedule
+
+    user_id, subscription = owner
+    with app.app_context():
+        schedule = Schedule(user_id=user_id, title='주간 회의', task_description='회의',
+                            due_date=date(2099, 1, 5), recurrence_rule='FREQ=WEEKLY')
+        db.session.add(schedule)
+        db.session.commit()
+        schedule_id = schedule.id
+        drain(subscription)
+
+        db.session.delete(schedule)
+        db.session.commit()
+
+    assert drain(subscription) == [('schedule', {'action': 'deleted', 'id': schedule_id, 'recurring': True})]
+
+
+def test_savepoint_rollback_keeps_outer_transaction_events(app, owner):
+    from sqlalchemy.exc import IntegrityError
+
+    from models import db
+    from models.schedule import Schedule
+    from models.user import User
+
+    user_id, subscription = owner
+    with app.app_context():
+        db.session.add(Schedule(user_id=user_id, title='바깥 일정', task_description='내용', due_date=date(2099, 1, 5)))
+        db.session.flush()
+        taken = db.session.get(User, user_id).username
+        with pytest.raises(IntegrityError):
+            with db.session.begin_nested():
+                db.session.add(User(username=taken, email='dup@example.com', password='pass1234'))
+        db.session.commit()
+
+    messages = drain(subscription)
+    assert [data['action'] for name, data in messages if name == 'schedule'] == ['created']
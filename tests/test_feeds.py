@@ -0,0 +1,40 @@
+# ============================================
+# 업무 일정 관리 시스템 - ICS 구독 피드 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_feeds.py
+# ============================================
+
+from services import feed_service
+
+
+def feed_path(client):
+    return '/' + client.get('/api/feeds').get_json()['user'].split('/', 3)[3]
+
+
+def test_feed_render_does_not_overwrite_concurrent_render(login, db, monkeypatch):
+    from models.calendar_feed import CalendarFeed
+
+    client = login()
+    client.post('/schedule/add', data={'title': '보고서', 'task_description': '제출', 'due_date': '2099-02-01'})
+    path = feed_path(client)
+    token = path.rsplit('/', 1)[1].removesuffix('.ics')
+    db.session.remove()
+
+    iter_ics = feed_service.schedule_io.iter_ics
+
+    def render_after_other_request(*args, **kwargs):
+        # 이 요청이 생성하는 사이 다른 요청이 먼저 저장
+        with db.engine.begin() as connection:
+            connection.execute(
+                CalendarFeed.__table__.update()
+                .where(CalendarFeed.__table__.c.token == token)
+                .values(body='BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n', etag='other')
+            )
+        return iter_ics(*args, **kwargs)
+
+    monkeypatch.setattr(feed_service.schedule_io, 'iter_ics', render_after_other_request)
+    response = client.get(path)
+    assert response.headers['ETag'] == '"other"'
+
+    db.session.remove()
+    feed = CalendarFeed.query.filter_by(token=token).one()
+    assert feed.etag == 'other'
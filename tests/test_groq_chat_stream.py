@@ -0,0 +1,57 @@
+# ============================================
+# 업무 일정 관리 시스템 - Groq 채팅 스트림 종료 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_groq_chat_stream.py
+# ============================================
+
+import importlib.util
+import os
+from types import SimpleNamespace
+
+import pytest
+from werkzeug.test import EnvironBuilder
+
+GROQ_APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'groq', 'app.py')
+
+
+class FakeStream:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.close_calls = 0
+
+    def __iter__(self):
+        for text in self.chunks:
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text))])
+
+    def close(self):
+        self.close_calls += 1
+
+
+@pytest.fixture
+def chat(monkeypatch):
+    spec = importlib.util.spec_from_file_location('groq_chat_app', GROQ_APP)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    stream = FakeStream(['안녕', '하세요'])
+    fake_client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=lambda **_: stream)))
+    monkeypatch.setattr(module, 'Groq', lambda: fake_client)
+    monkeypatch.setenv('GROQ_API_KEY', 'test')
+    return module.app.test_client(), stream
+
+
+def test_stream_closed_when_client_leaves_before_first_chunk(chat):
+    # test client는 첫 청크를 미리 읽으므로 WSGI 앱을 직접 호출하고 본문을 읽지 않은 채 닫음
+    client, stream = chat
+    environ = EnvironBuilder(method='POST', path='/chat/stream', json={'message': 'hi'}).get_environ()
+    body = client.application(environ, lambda status, headers, exc_info=None: None)
+    body.close()
+    assert stream.close_calls == 1
+
+
+def test_stream_closed_after_full_response(chat):
+    client, stream = chat
+    response = client.post('/chat/stream', json={'message': 'hi'})
+    body = response.get_data(as_text=True)
+    response.close()
+    assert '안녕' in body and 'event: done' in body
+    assert stream.close_calls == 1
@@ -0,0 +1,33 @@
+# ============================================
+# 업무 일정 관리 시스템 - 녹화 응답 재생 기준 날짜 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_llm_replay.py
+# ============================================
+
+import json
+from datetime import date
+
+from benchmarks import extraction_bench
+from benchmarks.corpus import build_corpus
+from benchmarks.llm_recorder import RecordedLLMClient
+
+
+def test_replay_pins_reference_date_to_recording_date(tmp_path):
+    corpus = build_corpus(str(tmp_path / 'corpus'), 1, 3, year=2020, seed=1)
+    recording = tmp_path / 'recording.json'
+    oracle = RecordedLLMClient('oracle', corpus)
+    responses = {}
+    for document in corpus:
+        responses[document.key] = {'content': oracle._oracle_response(document.key), 'prompt_tokens': None}
+    recording.write_text(json.dumps({'corpus_year': 2020, 'recorded_on': '2019-06-01', 'responses': responses}))
+
+    client = RecordedLLMClient('replay', corpus, str(recording))
+    assert client.reference_date == date(2019, 6, 1)
+
+    # 2020년 일정은 지금 기준으로는 모두 과거지만, 녹화일 기준으로 채점되어야 함
+    results = extraction_bench.run(corpus, client)
+    summary = extraction_bench.summarize(results)
+    assert summary['recall'] == 1.0
+
+
+def test_recordings_without_date_fall_back_to_corpus_year():
+    assert RecordedLLMClient.recorded_on({'corpus_year': 2031, 'responses': {}}) == date(2030, 1, 1)
@@ -0,0 +1,92 @@
+# ============================================
+# 업무 일정 관리 시스템 - 스키마 마이그레이션 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_migrations.py
+# ============================================
+
+import importlib
+
+import pytest
+from sqlalchemy import Column, DateTime, create_engine, inspect, select, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateColumn, CreateTable
+
+import migrations
+
+# SQLite 전용 문법 (PostgreSQL에서 오류)
+SQLITE_ONLY = ('AUTOINCREMENT', 'DATETIME', 'INSERT OR', 'DEFAULT 0', 'DEFAULT 1')
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migrate.db'}")
+    yield engine
+    engine.dispose()
+
+
+def versions(engine):
+    with engine.connect() as connection:
+        return connection.execute(select(migrations.version_table.c.version)).scalars().all()
+
+
+def test_fresh_database_requires_migrate_command(engine):
+    # 시작 시 기본 확인은 새 DB를 만들지 않음 (워커 여러 개가 동시에 create_all 하지 않도록)
+    with pytest.raises(migrations.SchemaOutdated):
+        migrations.check(engine, log=lambda message: None)
+    with engine.connect() as connection:
+        assert migrations.current_version(connection) is None
+
+
+def test_fresh_database_records_latest_version(engine):
+    latest = migrations.latest_version()
+    assert migrations.check(engine, auto_upgrade=True, log=lambda message: None) == latest
+    assert versions(engine) == [m.version for m in migrations.discover()]
+    # 다시 확인해도 그대로
+    assert migrations.check(engine, auto_upgrade=False, log=lambda message: None) == latest
+
+
+def test_legacy_database_upgrade_is_repeatable(app, engine):
+    from models import db, load_models
+
+    # schema_version 없이 db.create_all()로 만들어진 예전 DB (태그 색인 이전)
+    load_models()
+    with engine.begin() as connection:
+        db.metadata.create_all(connection)
+        connection.execute(text('DROP TABLE schedule_tags'))
+        connection.execute(text('DROP TABLE tags'))
+        connection.execute(text('ALTER TABLE users DROP COLUMN role'))
+        connection.execute(text(
+            "INSERT INTO users (id, username, email, password_hash) VALUES (1, 'legacy', 'legacy@example.com', 'x')"
+        ))
+        connection.execute(text(
+            "INSERT INTO schedules (id, user_id, title, task_description, due_date, tags) "
+            "VALUES (1, 1, '보고', '내용', '2024-01-01', '#업무, 보고, 업무')"
+        ))
+
+    applied = migrations.upgrade(engine, log=lambda message: None)
+    assert [m.version for m in applied] == [m.version for m in migrations.discover()]
+    assert migrations.upgrade(engine, log=lambda message: None) == []
+
+    with engine.connect() as connection:
+        tags = connection.execute(text('SELECT name, usage_count FROM tags ORDER BY name')).all()
+        assert tags == [('보고', 1), ('업무', 1)]
+        assert connection.execute(text('SELECT COUNT(*) FROM schedule_tags')).scalar() == 2
+        assert connection.execute(text('SELECT role FROM users')).scalar() == 'member'
+        assert 'ix_schedule_tags_tag_id_schedule_id' in {
+            index['name'] for index in inspect(connection).get_indexes('schedule_tags')
+        }
+
+
+def test_migration_ddl_compiles_for_postgresql():
+    dialect = postgresql.dialect()
+    tables = [migrations.version_table]
+    for migration in migrations.discover():
+        module = importlib.import_module(f'migrations.{migration.name}')
+        metadata = getattr(module, 'metadata', None)
+        if metadata is not None:
+            tables.extend(metadata.sorted_tables)
+
+    for table in tables:
+        ddl = str(CreateTable(table).compile(dialect=dialect)).upper()
+        assert not any(token in ddl for token in SQLITE_ONLY), ddl
+    column = CreateColumn(Column('updated_at', DateTime)).compile(dialect=dialect)
+    assert str(column) == 'updated_at TIMESTAMP WITHOUT TIME ZONE'
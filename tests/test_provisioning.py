@@ -0,0 +1,88 @@
+# ============================================
+# 업무 일정 관리 시스템 - 조직 일괄 등록 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_provisioning.py
+# ============================================
+
+import json
+
+import pytest
+
+TOKEN = 'provision-test-token'
+
+
+@pytest.fixture
+def provision_api(app, monkeypatch):
+    monkeypatch.setitem(app.config, 'PROVISION_TOKEN', TOKEN)
+    monkeypatch.setitem(app.config, 'PROVISION_HASH_PROCESSES', 1)
+
+    def post(rows):
+        response = app.test_client().post(
+            '/api/admin/provision?format=json', data=json.dumps(rows),
+            headers={'Authorization': f'Bearer {TOKEN}'}, content_type='application/json'
+        )
+        assert response.status_code == 200, response.get_data(as_text=True)
+        return response.get_json()
+    return post
+
+
+@pytest.mark.parametrize('authorization', [None, f'Bearer {TOKEN}x', f'Bearer {TOKEN[:-1]}', 'Bearer 토큰'])
+def test_api_rejects_wrong_token(app, provision_api, authorization):
+    headers = {'Authorization': authorization} if authorization else {}
+    response = app.test_client().post('/api/admin/provision?format=json', data='[]', headers=headers,
+                                      content_type='application/json')
+    assert response.status_code == 401
+
+
+def test_api_never_returns_passwords(provision_api):
+    summary = provision_api([
+        {'company': '비밀번호 회사', 'username': 'pw_given', 'email': 'pw_given@example.com', 'password': 'secret1'},
+        {'company': '비밀번호 회사', 'username': 'pw_missing', 'email': 'pw_missing@example.com'},
+    ])
+    assert summary['users'] == {'created': 1, 'skipped': 0}
+    assert [error['row'] for error in summary['errors']] == [2]
+    assert 'temporary_passwords' not in summary
+    assert 'secret1' not in json.dumps(summary)
+
+
+def test_role_conflicts_are_reported_not_applied(app, provision_api):
+    from models import db
+    from models.company import Company
+    from models.team import Team
+    from models.user import User
+
+    provision_api([
+        {'company': '역할 회사', 'team': '개발팀', 'username': 'role_admin', 'email': 'role_admin@example.com',
+         'password': 'secret1', 'role': 'admin'},
+        {'company': '역할 회사', 'team': '개발팀', 'username': 'role_lead', 'email': 'role_lead@example.com',
+         'password': 'secret1', 'role': 'team_leader'},
+        {'company': '역할 회사', 'team': '개발팀', 'username': 'role_lead2', 'email': 'role_lead2@example.com',
+         'password': 'secret1', 'role': 'team_leader'},
+    ])
+    summary = provision_api([
+        {'company': '역할 회사', 'username': 'role_admin2', 'email': 'role_admin2@example.com',
+         'password': 'secret1', 'role': 'admin'},
+    ])
+    assert summary['users'] == {'created': 0, 'skipped': 1}
+    assert '이미 관리자가 있습니다' in summary['errors'][0]['message']
+
+    with app.app_context():
+        company = Company.query.filter_by(name='역할 회사').one()
+        team = Team.query.filter_by(company_id=company.id, name='개발팀').one()
+        assert db.session.get(User, company.admin_id).username == 'role_admin'
+        assert db.session.get(User, team.leader_id).username == 'role_lead'
+        assert User.query.filter(User.username.in_(['role_lead2', 'role_admin2'])).count() == 0
+
+
+def test_cli_shows_temporary_passwords_only_with_flag(app, tmp_path):
+    path = tmp_path / 'org.csv'
+    path.write_text('company,username,email\n임시 회사,temp_a,temp_a@example.com\n', encoding='utf-8')
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(args=['provision-org', str(path)])
+    assert result.exit_code == 0, result.output
+    assert '사용자: 생성 0' in result.output and 'temp_a\t' not in result.output
+
+    result = runner.invoke(args=['provision-org', '--show-passwords', str(path)])
+    assert result.exit_code == 0, result.output
+    assert '사용자: 생성 1' in result.output
+    assert 'temp_a\t' in result.output
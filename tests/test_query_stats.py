@@ -0,0 +1,65 @@
+# ============================================
+# 업무 일정 관리 시스템 - 요청별 SQL 쿼리 집계 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_query_stats.py
+# ============================================
+
+from flask import g
+from sqlalchemy import text
+
+from services import query_stats
+
+
+def recorded(endpoint):
+    """(요청 수, 쿼리 수 합계)"""
+    for key, stats in query_stats.REQUEST_QUERIES.snapshot().items():
+        if dict(key).get('endpoint') == endpoint:
+            return stats['count'], stats['sum']
+    return 0, 0
+
+
+def test_streamed_export_queries_are_counted(login):
+    client = login()
+    for day in range(1, 4):
+        client.post('/schedule/add', data={
+            'title': f'일정 {day}', 'task_description': '내용', 'due_date': f'2099-01-0{day}'
+        })
+
+    requests_before, queries_before = recorded('api_export_schedules')
+    response = client.get('/api/schedules/export?format=csv')
+    assert response.is_streamed
+    assert '일정 3' in response.get_data(as_text=True)
+    response.close()
+
+    requests_after, queries_after = recorded('api_export_schedules')
+    assert requests_after == requests_before + 1
+    assert queries_after > queries_before
+
+
+def test_failed_request_is_counted_and_keeps_only_slowest_statements(app, db):
+    requests_before, queries_before = recorded('unknown')
+
+    ctx = app.test_request_context('/nowhere')
+    ctx.push()
+    app.preprocess_request()
+    for _ in range(20):
+        db.session.execute(text('SELECT 1'))
+    assert len(g.sql_statements) == query_stats._LOGGED_STATEMENTS
+    ctx.pop(RuntimeError('boom'))
+
+    requests_after, queries_after = recorded('unknown')
+    assert requests_after == requests_before + 1
+    assert queries_after - queries_before >= 20
+
+
+def test_metrics_require_token_or_local_request(app, monkeypatch):
+    client = app.test_client()
+    remote = {'REMOTE_ADDR': '10.0.0.5'}
+
+    monkeypatch.setitem(app.config, 'METRICS_TOKEN', None)
+    assert client.get('/metrics').status_code == 200
+    assert client.get('/metrics', environ_base=remote).status_code == 404
+    assert client.get('/metrics/sql', environ_base=remote).status_code == 404
+
+    monkeypatch.setitem(app.config, 'METRICS_TOKEN', 'metrics-token')
+    assert client.get('/metrics').status_code == 401
+    assert client.get('/metrics', environ_base=remote, headers={'Authorization': 'Bearer metrics-token'}).status_code == 200
@@ -0,0 +1,132 @@
+# ============================================
+# 업무 일정 관리 시스템 - 로그인 시도 제한 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_rate_limit.py
+# ============================================
+
+import pytest
+
+from services import rate_limit
+from services.rate_limit import SlidingWindowLimiter
+from tests.conftest import PASSWORD
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limit.time, 'monotonic', lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def limits():
+    """로그인 제한을 작게 설정하고 테스트 후 원래대로"""
+    originals = [(limiter, limiter.limit, limiter.window)
+                 for limiter in (rate_limit.login_ip_limiter, rate_limit.login_user_limiter)]
+    rate_limit.login_ip_limiter.configure(3, 300)
+    rate_limit.login_user_limiter.configure(10, 300)
+    yield
+    for limiter, limit, window in originals:
+        limiter.configure(limit, window)
+
+
+def test_sliding_window_expires_old_hits(clock):
+    limiter = SlidingWindowLimiter(limit=2, window=60)
+    limiter.hit('a')
+    clock[0] += 30
+    limiter.hit('a')
+    assert limiter.check('a') == (False, 31)
+    clock[0] += 31
+    assert limiter.check('a') == (True, 0)
+
+
+def test_sliding_window_prunes_when_full(clock):
+    limiter = SlidingWindowLimiter(limit=1, window=60, max_keys=2)
+    limiter.hit('old')
+    clock[0] += 61
+    limiter.hit('a')
+    limiter.hit('b')
+    assert set(limiter._hits) == {'a', 'b'}
+
+
+def post_login(client, username, password, ip):
+    return client.post('/login', data={'username': username, 'password': password},
+                       environ_base={'REMOTE_ADDR': ip})
+
+
+def test_ip_limit_counts_only_failures(app, login, limits):
+    users = [login().username for _ in range(2)]
+    for _ in range(3):
+        for username in users:
+            client = app.test_client()
+            assert post_login(client, username, PASSWORD, '10.0.0.1').status_code == 302
+
+    client = app.test_client()
+    for _ in range(3):
+        assert post_login(client, users[0], 'wrong-password', '10.0.0.2').status_code == 200
+    response = post_login(app.test_client(), users[1], PASSWORD, '10.0.0.2')
+    assert response.status_code == 200
+    assert '로그인 시도가 너무 많습니다' in response.get_data(as_text=True)
+    # 다른 IP는 영향 없음
+    assert post_login(app.test_client(), users[1], PASSWORD, '10.0.0.3').status_code == 302
+
+
+def test_proxy_fix_is_config_gated(app, monkeypatch):
+    from werkzeug.middleware.proxy_fix import ProxyFix
+
+    import app as app_module
+
+    assert not isinstance(app.wsgi_app, ProxyFix)
+    monkeypatch.setattr(app_module.Config, 'PROXY_FIX_HOPS', 1)
+    proxied = app_module.create_app()
+    assert isinstance(proxied.wsgi_app, ProxyFix)
+    assert proxied.wsgi_app.x_for == 1
+
+    @proxied.route('/_client_ip')
+    def client_ip():
+        from flask import request
+        return request.remote_addr
+
+    response = proxied.test_client().get('/_client_ip', headers={'X-Forwarded-For': '203.0.113.9, 10.0.0.1'},
+                                         environ_base={'REMOTE_ADDR': '127.0.0.1'})
+    assert response.get_data(as_text=True) == '10.0.0.1'
+
+
+def test_try_acquire_checks_and_records_atomically(clock):
+    limiter = SlidingWindowLimiter(limit=2, window=60)
+    assert limiter.try_acquire('a') == (True, 0)
+    assert limiter.try_acquire('a') == (True, 0)
+    assert limiter.try_acquire('a') == (False, 61)
+    limiter.release('a')
+    assert limiter.try_acquire('a') == (True, 0)
+
+
+def test_concurrent_failures_are_capped_before_hashing(app, login, limits, monkeypatch):
+    import threading
+
+    from models.user import User
+    from services.auth import AuthService
+
+    rate_limit.login_user_limiter.configure(10, 300)
+    rate_limit.login_ip_limiter.configure(100, 300)
+    username = login().username
+    verified = []
+    barrier = threading.Barrier(30)
+    original = User.check_password
+
+    def slow_check(self, password):
+        verified.append(password)
+        return original(self, password)
+
+    monkeypatch.setattr(User, 'check_password', slow_check)
+
+    def attempt():
+        with app.app_context():
+            barrier.wait()
+            AuthService.authenticate_user(username, 'wrong-password', '10.0.1.1')
+
+    threads = [threading.Thread(target=attempt) for _ in range(30)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(verified) == 10
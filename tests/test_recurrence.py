@@ -0,0 +1,151 @@
+# ============================================
+# 업무 일정 관리 시스템 - 반복 일정 / 회차 예외 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_recurrence.py
+# ============================================
+
+from datetime import date, datetime, time
+from types import SimpleNamespace
+
+from services import schedule_io
+
+
+def weekly_meeting(**overrides):
+    fields = dict(
+        id=7, title='주간 회의', task_description='', tags=None, is_completed=False,
+        start_date=date(2099, 1, 5), due_date=date(2099, 1, 5), end_date=date(2099, 1, 5),
+        is_all_day=False, start_time=time(9, 0), end_time=time(10, 0),
+        recurrence_rule='FREQ=WEEKLY', recurrence_until=None, updated_at=datetime(2099, 1, 1),
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def exception(occurrence_date, **fields):
+    values = dict(occurrence_date=occurrence_date, is_cancelled=False, override_date=None, title=None,
+                  start_time=None, end_time=None, is_completed=None)
+    values.update(fields)
+    return SimpleNamespace(**values)
+
+
+def test_ics_event_writes_exdate_and_recurrence_id():
+    body = schedule_io.ics_event(weekly_meeting(), 'example.com', exceptions=[
+        exception(date(2099, 1, 12), is_cancelled=True),
+        exception(date(2099, 1, 26), is_cancelled=True),
+        exception(date(2099, 1, 19), override_date=date(2099, 1, 20), title='옮긴 회의', start_time=time(14, 0)),
+    ])
+    lines = body.split('\r\n')
+    assert 'EXDATE:20990112T090000,20990126T090000' in lines
+    assert body.count('BEGIN:VEVENT') == 2
+    assert body.count('UID:schedule-7@example.com') == 2
+    assert 'RECURRENCE-ID:20990119T090000' in lines
+    assert 'DTSTART:20990120T140000' in lines
+    assert 'SUMMARY:옮긴 회의' in lines
+
+
+def test_ics_event_all_day_uses_date_values():
+    body = schedule_io.ics_event(weekly_meeting(is_all_day=True), 'example.com', exceptions=[
+        exception(date(2099, 1, 12), is_cancelled=True),
+        exception(date(2099, 1, 19), override_date=date(2099, 1, 21)),
+    ])
+    lines = body.split('\r\n')
+    assert 'EXDATE;VALUE=DATE:20990112' in lines
+    assert 'RECURRENCE-ID;VALUE=DATE:20990119' in lines
+    assert 'DTSTART;VALUE=DATE:20990121' in lines
+
+
+def test_single_schedule_ignores_exceptions():
+    body = schedule_io.ics_event(weekly_meeting(recurrence_rule=None), 'example.com')
+    assert 'RRULE' not in body and 'EXDATE' not in body
+
+
+def test_feed_reflects_cancelled_occurrence(login, db):
+    from models.calendar_feed import CalendarFeed
+    from models.schedule import Schedule
+    from models.schedule_exception import ScheduleException
+
+    client = login()
+    client.post('/schedule/add', data={
+        'title': '주간 회의', 'task_description': '회의', 'due_date': '2099-01-05', 'recurrence': 'WEEKLY'
+    })
+    feed_path = '/' + client.get('/api/feeds').get_json()['user'].split('/', 3)[3]
+    assert 'EXDATE' not in client.get(feed_path).get_data(as_text=True)
+
+    schedule = Schedule.query.filter_by(title='주간 회의').order_by(Schedule.id.desc()).first()
+    # 회차 예외만 추가해도 (일정 행을 건드리지 않아도) 피드가 무효화되어야 함
+    db.session.add(ScheduleException(schedule_id=schedule.id, occurrence_date=date(2099, 1, 12), is_cancelled=True))
+    db.session.commit()
+    feed = CalendarFeed.query.filter_by(owner_type=CalendarFeed.OWNER_USER, owner_id=schedule.user_id).one()
+    assert feed.etag is None
+    db.session.remove()
+
+    body = client.get(feed_path).get_data(as_text=True)
+    assert 'EXDATE;VALUE=DATE:20990112' in body
+
+
+def test_next_due_date_skips_cancelled_occurrence():
+    from services import recurrence
+
+    meeting = weekly_meeting(is_all_day=True)
+    today = date(2099, 1, 20)
+    assert recurrence.next_due_date(meeting, today) == date(2099, 1, 26)
+    cancelled = [exception(date(2099, 1, 26), is_cancelled=True)]
+    assert recurrence.next_due_date(meeting, today, cancelled) == date(2099, 2, 2)
+
+
+def test_next_due_date_of_finished_series_is_last_occurrence():
+    from services import recurrence
+
+    meeting = weekly_meeting(recurrence_rule='FREQ=WEEKLY;COUNT=3', recurrence_until=date(2099, 1, 19))
+    assert recurrence.next_due_date(meeting, date(2099, 3, 1)) == date(2099, 1, 19)
+
+
+def test_recurring_schedule_is_not_overdue_after_first_occurrence(login, db):
+    from models.schedule import Schedule
+    from models.user import User
+    from services.schedule_listing import ScheduleListService
+    from services.schedule_service import ScheduleService
+
+    client = login()
+    user = User.query.filter_by(username=client.username).one()
+    today = date(2099, 6, 10)  # 수요일
+    weekly = Schedule(user_id=user.id, title='주간 회의', task_description='회의', due_date=date(2099, 5, 1),
+                      recurrence_rule='FREQ=WEEKLY')
+    late = Schedule(user_id=user.id, title='지난 마감', task_description='마감', due_date=date(2099, 6, 1))
+    db.session.add_all([weekly, late])
+    db.session.commit()
+
+    counts = ScheduleService.urgency_counts(user.id, today)
+    assert counts['overdue'] == 1
+    assert counts['urgent'] == 1  # 다음 회차 2099-06-12 (금)
+
+    page = ScheduleListService.page(user.id, today=today)
+    assert [s.title for s in page['schedules']] == ['지난 마감', '주간 회의']
+    assert page['schedules'][1].days_left_on(today) == 2
+
+    first = ScheduleListService.page(user.id, today=today, limit=1)
+    second = ScheduleListService.page(user.id, cursor=first['next_cursor'], limit=1)
+    assert [s.title for s in second['schedules']] == ['주간 회의']
+
+
+def test_dashboard_renders_recurring_schedule(login):
+    client = login()
+    client.post('/schedule/add', data={
+        'title': '매일 점검', 'task_description': '점검', 'due_date': '2020-01-01', 'recurrence': 'DAILY'
+    })
+    body = client.get('/dashboard').get_data(as_text=True)
+    assert '매일 점검' in body
+    result = client.get('/api/dashboard/schedules?urgency=overdue').get_json()
+    assert result['schedules'] == []
+
+
+def test_compute_until_is_bounded_for_far_future_until():
+    import time as clock
+
+    from services import recurrence
+
+    started = clock.perf_counter()
+    assert recurrence.compute_until('FREQ=DAILY;UNTIL=99991231', date(2024, 1, 1)) == date(9999, 12, 31)
+    assert clock.perf_counter() - started < 0.5
+    assert recurrence.compute_until('FREQ=WEEKLY;UNTIL=20240131', date(2024, 1, 1)) == date(2024, 1, 29)
+    assert recurrence.compute_until('FREQ=MONTHLY;COUNT=3', date(2024, 1, 31)) == date(2024, 5, 31)
+    assert recurrence.compute_until('FREQ=DAILY', date(2024, 1, 1)) is None
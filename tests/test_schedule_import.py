@@ -0,0 +1,66 @@
+# ============================================
+# 업무 일정 관리 시스템 - 일정 가져오기 행 정규화 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_schedule_import.py
+# ============================================
+
+import csv
+import json
+from datetime import date
+
+import pytest
+
+from services import schedule_io
+
+
+def test_normalize_row_converts_scalars_and_tag_lists():
+    row = schedule_io.normalize_row({
+        'title': 123, 'due_date': '2099-03-01', 'tags': ['a', 'b'], 'memo': 4.5, 'schedule_type': 'MEETING'
+    })
+    assert row['title'] == '123'
+    assert row['task_description'] == '123'
+    assert row['due_date'] == date(2099, 3, 1)
+    assert row['tags'] == 'a,b'
+    assert row['memo'] == '4.5'
+    assert row['schedule_type'] == 'meeting'
+
+
+@pytest.mark.parametrize('raw', [
+    {'title': {'nested': True}, 'due_date': '2099-03-01'},
+    {'title': 'x', 'due_date': '2099-03-01', 'task_description': ['a']},
+    {'title': 'x', 'due_date': '2099-03-01', 'recurrence_rule': {'FREQ': 'DAILY'}},
+    {'title': 'x', 'due_date': '2099-03-01', 'tags': [{'a': 1}]},
+])
+def test_normalize_row_rejects_structured_values(raw):
+    with pytest.raises(schedule_io.ImportRowError):
+        schedule_io.normalize_row(raw)
+
+
+def test_import_skips_bad_rows_and_keeps_the_rest(login):
+    client = login()
+    lines = [
+        {'title': 123, 'due_date': '2099-03-01'},
+        {'title': 'tags', 'due_date': '2099-03-02', 'tags': ['a', 'b']},
+        {'title': {'x': 1}, 'due_date': '2099-03-03'},
+        {'title': 'ok', 'due_date': '2099-03-04', 'memo': ['x']},
+        {'title': 'last', 'due_date': '2099-03-05'},
+    ]
+    body = '\n'.join(json.dumps(line) for line in lines)
+    response = client.post('/api/schedules/import?format=jsonl', data=body.encode(),
+                           content_type='application/x-ndjson')
+    assert response.status_code == 200
+    result = response.get_json()
+    assert result['created'] == 3
+    assert result['skipped'] == 2
+    assert [error['row'] for error in result['errors']] == [3, 4]
+
+
+def test_import_reports_unreadable_csv_row(login):
+    client = login()
+    body = 'title,due_date\nfirst,2099-04-01\nhuge,"' + 'x' * (csv.field_size_limit() + 1) + '"\nafter,2099-04-03\n'
+    response = client.post('/api/schedules/import?format=csv', data=body.encode(), content_type='text/csv')
+    assert response.status_code == 200
+    result = response.get_json()
+    assert result['created'] == 1
+    assert result['skipped'] == 1
+    assert result['errors'][0]['row'] == 2
+    assert 'CSV 오류' in result['errors'][0]['message']
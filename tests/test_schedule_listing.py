@@ -0,0 +1,44 @@
+# ============================================
+# 업무 일정 관리 시스템 - 대시보드 일정 목록 페이지 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_schedule_listing.py
+# ============================================
+
+
+def add_schedule(client, title, due_date, **fields):
+    response = client.post('/schedule/add', data={
+        'title': title, 'task_description': '내용', 'due_date': due_date, 'is_all_day': 'on', **fields
+    })
+    assert response.status_code == 302
+
+
+def walk(client, limit, **filters):
+    """next_cursor를 따라 끝까지 읽은 일정 제목"""
+    titles, cursor = [], None
+    while True:
+        params = dict(filters, limit=limit, **({'cursor': cursor} if cursor else {}))
+        page = client.get('/api/dashboard/schedules', query_string=params).get_json()
+        titles.extend(item['title'] for item in page['schedules'])
+        if not page['has_more']:
+            return titles
+        cursor = page['next_cursor']
+
+
+def test_keyset_pages_cover_every_schedule_once(login):
+    client = login()
+    # 같은 마감일이 여러 건이어도 (마감일, id) 커서로 빠짐/중복 없이 이어짐
+    for index in range(5):
+        add_schedule(client, f'같은 날 {index}', '2099-02-01', tags='보고' if index % 2 else '')
+    add_schedule(client, '먼저', '2099-01-15')
+
+    expected = ['먼저'] + [f'같은 날 {index}' for index in range(5)]
+    assert walk(client, limit=2) == expected
+    assert walk(client, limit=4) == expected
+    assert walk(client, limit=2, tag='보고') == ['같은 날 1', '같은 날 3']
+    assert walk(client, limit=2, **{'from': '2099-02-01'}) == expected[1:]
+
+
+def test_invalid_cursor_is_rejected(login):
+    client = login()
+    response = client.get('/api/dashboard/schedules', query_string={'cursor': '!!!'})
+    assert response.status_code == 400
+    assert response.get_json()['success'] is False
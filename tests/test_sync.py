@@ -0,0 +1,121 @@
+# ============================================
+# 업무 일정 관리 시스템 - 일정 증분 동기화 테스트
+# 위치: C:\Users\user\Desktop\인공지능산업협회AI\tests\test_sync.py
+# ============================================
+
+import base64
+from datetime import datetime, timedelta
+
+import pytest
+
+from services.sync_service import encode_cursor
+
+
+@pytest.fixture
+def lag(app, monkeypatch):
+    """마지막 페이지에서 다시 읽는 구간 (기본 0 - 중복 없이 위치만 확인)"""
+    def set_lag(seconds):
+        monkeypatch.setitem(app.config, 'SYNC_COMMIT_LAG_SECONDS', seconds)
+    set_lag(0)
+    return set_lag
+
+
+def add_schedule(client, title):
+    response = client.post('/schedule/add', data={
+        'title': title, 'task_description': '내용', 'due_date': '2099-03-01', 'is_all_day': 'on',
+    })
+    assert response.status_code == 302
+
+
+def changes(client, **params):
+    response = client.get('/api/schedules/changes', query_string=params)
+    return response.status_code, response.get_json()
+
+
+def test_changes_report_new_schedules_and_tombstones(login, lag):
+    client, other = login(), login()
+    add_schedule(client, '첫 일정')
+    add_schedule(client, '둘째 일정')
+    _, full = changes(client)
+    assert [item['title'] for item in full['changes']] == ['첫 일정', '둘째 일정']
+    assert full['deleted'] == [] and full['has_more'] is False
+    removed_id = full['changes'][0]['id']
+
+    assert client.post(f'/schedule/{removed_id}/delete').status_code in (200, 302)
+    add_schedule(client, '셋째 일정')
+    add_schedule(other, '다른 사용자 일정')
+
+    _, delta = changes(client, since=full['cursor'])
+    assert [item['title'] for item in delta['changes']] == ['셋째 일정']
+    assert [item['id'] for item in delta['deleted']] == [removed_id]
+
+    # 이어 읽으면 변경 없음, 다른 사용자의 변경은 보이지 않음
+    _, empty = changes(client, since=delta['cursor'])
+    assert empty['changes'] == [] and empty['deleted'] == []
+
+
+def test_changes_page_with_limit(login, lag):
+    client = login()
+    for index in range(3):
+        add_schedule(client, f'페이지 {index}')
+
+    titles, cursor, has_more = [], None, True
+    while has_more:
+        _, page = changes(client, limit=2, **({'since': cursor} if cursor else {}))
+        titles.extend(item['title'] for item in page['changes'])
+        cursor, has_more = page['cursor'], page['has_more']
+    assert titles == ['페이지 0', '페이지 1', '페이지 2']
+
+
+def test_expired_and_invalid_cursors(login):
+    client = login()
+    status, body = changes(client, since=encode_cursor(datetime.utcnow() - timedelta(days=400), None, 0, 0))
+    assert status == 410 and body['resync'] is True
+    # 발급 시각이 없는 이전 형식 커서도 전체 동기화 안내
+    legacy = base64.urlsafe_b64encode(b'2024-01-01T00:00:00|1|0').decode('ascii')
+    status, body = changes(client, since=legacy)
+    assert status == 410 and body['resync'] is True
+    status, body = changes(client, since='not-a-cursor')
+    assert status == 400 and body['resync'] is False
+
+
+def set_updated_at(app, title, updated_at):
+    from models import db
+    from models.schedule import Schedule
+
+    with app.app_context():
+        db.session.execute(
+            Schedule.__table__.update().where(Schedule.title == title).values(updated_at=updated_at)
+        )
+        db.session.commit()
+
+
+def test_idle_account_cursor_does_not_expire(app, login, lag):
+    client = login()
+    add_schedule(client, '오래된 일정')
+    set_updated_at(app, '오래된 일정', datetime.utcnow() - timedelta(days=400))
+
+    status, full = changes(client)
+    assert status == 200
+    status, delta = changes(client, since=full['cursor'])
+    assert status == 200 and delta['changes'] == []
+
+
+def test_late_commit_behind_cursor_is_read_again(app, login, lag):
+    lag(30)
+    client = login()
+    add_schedule(client, '먼저 커밋')
+    _, full = changes(client)
+    assert [item['title'] for item in full['changes']] == ['먼저 커밋']
+
+    # 커서 발급 뒤에 커밋됐지만 flush 시각(updated_at)은 그보다 앞선 변경
+    add_schedule(client, '늦게 커밋')
+    set_updated_at(app, '늦게 커밋', datetime.utcnow() - timedelta(seconds=10))
+    _, delta = changes(client, since=full['cursor'])
+    assert sorted(item['title'] for item in delta['changes']) == ['늦게 커밋', '먼저 커밋']
+
+    # 구간이 지나면 커서가 앞으로 나아감
+    lag(0)
+    _, settled = changes(client, since=delta['cursor'])
+    _, empty = changes(client, since=settled['cursor'])
+    assert empty['changes'] == []